@@ -29,6 +29,11 @@ class ShuffleSettings(TypedDict):
     modules: bool
 
 
+class ConcurrencySettings(TypedDict):
+    per_network: int | None
+    per_rpc: int | None
+
+
 class DefaultSettings(TypedDict):
     routes: list[Route]
 
@@ -37,6 +42,7 @@ class DefaultSettings(TypedDict):
 
     shuffle: ShuffleSettings
     threads: Union[int, Literal['all']]
+    concurrency: ConcurrencySettings
     tx_attempts: int
     delay: DelaySettings
 
@@ -53,6 +59,10 @@ default_settings: DefaultSettings = {
     'dev_mode': True,
     
     'threads': 'all',
+    'concurrency': {
+        'per_network': None,
+        'per_rpc': None
+    },
     'tx_attempts': 1,
     'delay': {
         'before_tx_receipt': (1, 10),
@@ -0,0 +1,226 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable
+from urllib.parse import urlparse
+
+from src.helpers.concurrency import rpc_limits
+
+OVERLOAD_MARKERS = (
+    'too many requests',
+    'rate limit',
+    'request limit',
+    'max calls per sec',
+)
+
+
+def is_overload_response(status_code: int | None, body: Any) -> bool:
+    """
+    Check whether the response status or the error body means the target is overloaded.
+
+    Bodies of successful responses are not scanned, except their JSON-RPC `error` payloads.
+    """
+    if status_code == 429:
+        return True
+
+    if status_code is not None and status_code < 400:
+        if not isinstance(body, dict) or not body.get('error'):
+            return False
+        body = body['error']
+
+    text = str(body).lower()
+    return any(marker in text for marker in OVERLOAD_MARKERS)
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Check whether the raised error means the target is overloaded or timed out."""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+
+    message = str(error).lower()
+    return (
+        is_overload_response(getattr(error, 'status_code', None), message)
+        or '429' in message
+        or 'timed out' in message
+    )
+
+
+def get_target(url: str) -> str:
+    """Get the limiter target of the URL: its host."""
+    return urlparse(url).netloc or url
+
+
+class AimdLimiter:
+    """
+    In-flight request limit adapted by additive increase, multiplicative decrease (AIMD).
+
+    Every successful request raises the limit by `increase / limit`, i.e. by about
+    `increase` per window of requests, and every overload signal (429, timeout,
+    "too many requests" body) cuts it by `decrease`.
+    """
+    MAX_LIMIT = 64
+
+    def __init__(
+        self,
+        initial: float = 4,
+        min_limit: float = 1,
+        max_limit: float = MAX_LIMIT,
+        increase: float = 1,
+        decrease: float = 0.5,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial (float): The initial limit.
+            min_limit (float): The lower bound of the limit.
+            max_limit (float): The upper bound of the limit.
+            increase (float): The limit growth per window of successful requests.
+            decrease (float): The factor the limit is multiplied by on overload.
+        """
+        self.limit = initial
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self.in_flight < int(self.limit)
+            )
+            self.in_flight += 1
+
+    async def release(self, is_overloaded: bool = False) -> None:
+        """
+        Release the permit and adapt the limit.
+
+        Args:
+            is_overloaded (bool): Whether the request got an overload signal.
+        """
+        async with self._condition:
+            self.in_flight -= 1
+
+            if is_overloaded:
+                self.limit = max(self.min_limit, self.limit * self.decrease)
+            else:
+                self.limit = min(
+                    self.max_limit,
+                    self.limit + self.increase / self.limit
+                )
+
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator['AimdSlot']:
+        """
+        Hold the permit inside the `async with` block.
+
+        Errors raised in the block are classified by `is_overload_error`. Call
+        `mark_overloaded` of the slot for overload signals which are not raised, e.g. error bodies.
+        """
+        await self.acquire()
+        slot = AimdSlot()
+        try:
+            yield slot
+        except BaseException as error:
+            slot.is_overloaded = slot.is_overloaded or is_overload_error(error)
+            raise
+        finally:
+            await self.release(slot.is_overloaded)
+
+
+class AimdSlot:
+    """The permit held by one request."""
+
+    def __init__(self):
+        self.is_overloaded = False
+
+    def mark_overloaded(self) -> None:
+        self.is_overloaded = True
+
+
+class AdaptiveConcurrency:
+    """
+    Registry of AIMD limiters per target: an RPC endpoint, an explorer API or a CEX host.
+
+    Unless `initial` is passed, new limiters start at the configured `per_rpc` limit of
+    `rpc_limits` or, when requests are not capped, at the upper bound, and only back
+    off after overload signals.
+
+    Example of use:
+    >>> async with adaptive_concurrency.slot(get_target(url)):
+    >>>     response = await session.get(url)
+    >>> adaptive_concurrency.get_limits()
+    """
+
+    def __init__(self, **limiter_kwargs: float):
+        """
+        Initialize the registry.
+
+        Args:
+            limiter_kwargs (float): The arguments of every new `AimdLimiter`.
+        """
+        self.limiter_kwargs = limiter_kwargs
+        self._limiters: dict[str, AimdLimiter] = {}
+
+    def get_limiter(self, target: str) -> AimdLimiter:
+        if target not in self._limiters:
+            self._limiters[target] = AimdLimiter(
+                **{'initial': self._get_initial_limit(), **self.limiter_kwargs}
+            )
+        return self._limiters[target]
+
+    def _get_initial_limit(self) -> float:
+        max_limit = self.limiter_kwargs.get('max_limit', AimdLimiter.MAX_LIMIT)
+        return min(rpc_limits.per_rpc or max_limit, max_limit)
+
+    def slot(self, target: str):
+        return self.get_limiter(target).slot()
+
+    def get_limits(self) -> dict[str, dict[str, float]]:
+        """Get the current limit and in-flight requests per target for monitoring."""
+        return {
+            target: {
+                'limit': round(limiter.limit, 2),
+                'in_flight': limiter.in_flight,
+            }
+            for target, limiter in self._limiters.items()
+        }
+
+    def create_web3_middleware(self, rpc: str) -> Callable:
+        """
+        Create the async web3 middleware holding the adaptive permit for every request.
+
+        JSON-RPC error responses about rate limits are treated as overload signals.
+
+        Args:
+            rpc (str): The RPC endpoint of the provider.
+
+        Returns:
+            Callable: The middleware to inject into the `middleware_onion`.
+        """
+        target = get_target(rpc)
+
+        async def adaptive_concurrency_middleware(make_request: Callable, w3: Any) -> Callable:
+            async def middleware(method: str, params: Any) -> Any:
+                async with self.slot(target) as slot:
+                    response = await make_request(method, params)
+
+                    if (
+                        isinstance(response, dict)
+                        and response.get('error')
+                        and is_overload_response(None, response['error'])
+                    ):
+                        slot.mark_overloaded()
+
+                    return response
+
+            return middleware
+
+        return adaptive_concurrency_middleware
+
+
+adaptive_concurrency = AdaptiveConcurrency()
@@ -0,0 +1,157 @@
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable
+
+
+class ConcurrencyLimits:
+    """
+    Caps the number of in-flight RPC requests per network and per RPC endpoint.
+
+    Semaphores are created lazily for every network and endpoint, so the limits
+    cost nothing for networks which are not used. `None` means no limit.
+
+    Example of use:
+    >>> rpc_limits.configure(per_network=20, per_rpc=8)
+    >>> async with rpc_limits.hold(network_name, rpc):
+    >>>     await make_request()
+    """
+
+    def __init__(
+        self,
+        per_network: int | None = None,
+        per_rpc: int | None = None,
+    ):
+        """
+        Initialize the limits.
+
+        Args:
+            per_network (int | None): The max number of in-flight requests to one network.
+            per_rpc (int | None): The max number of in-flight requests to one RPC endpoint.
+        """
+        self.configure(per_network, per_rpc)
+
+    def configure(
+        self,
+        per_network: int | None = None,
+        per_rpc: int | None = None,
+    ) -> None:
+        """Set new limits. Requests already holding a permit keep it."""
+        self.per_network = per_network
+        self.per_rpc = per_rpc
+        self._network_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._rpc_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @staticmethod
+    def _get_semaphore(
+        semaphores: dict[str, asyncio.Semaphore],
+        key: str,
+        limit: int | None
+    ) -> asyncio.Semaphore | None:
+        if not limit:
+            return None
+
+        if key not in semaphores:
+            semaphores[key] = asyncio.Semaphore(limit)
+        return semaphores[key]
+
+    @asynccontextmanager
+    async def hold(
+        self,
+        network_name: str,
+        rpc: str
+    ) -> AsyncIterator[None]:
+        """Hold the network and RPC permits inside the `async with` block."""
+        network_semaphore = self._get_semaphore(
+            self._network_semaphores, network_name, self.per_network
+        )
+        rpc_semaphore = self._get_semaphore(
+            self._rpc_semaphores, rpc, self.per_rpc
+        )
+
+        if network_semaphore:
+            await network_semaphore.acquire()
+        try:
+            if rpc_semaphore:
+                await rpc_semaphore.acquire()
+            try:
+                yield
+            finally:
+                if rpc_semaphore:
+                    rpc_semaphore.release()
+        finally:
+            if network_semaphore:
+                network_semaphore.release()
+
+    def create_web3_middleware(
+        self,
+        network_name: str,
+        rpc: str
+    ) -> Callable:
+        """
+        Create the async web3 middleware holding the permits for every request.
+
+        Args:
+            network_name (str): The network of the provider.
+            rpc (str): The RPC endpoint of the provider.
+
+        Returns:
+            Callable: The middleware to inject into the `middleware_onion`.
+        """
+        async def concurrency_middleware(make_request: Callable, w3: Any) -> Callable:
+            async def middleware(method: str, params: Any) -> Any:
+                async with self.hold(network_name, rpc):
+                    return await make_request(method, params)
+
+            return middleware
+
+        return concurrency_middleware
+
+
+class WorkerPermit:
+    """
+    The worker slot of the account scheduler held by one running account.
+
+    The slot can be given back while the account waits, so another account runs in it,
+    and taken again when the account resumes.
+
+    Example of use:
+    >>> permit = current_permit.get()
+    >>> async with permit.parked():
+    >>>     await asyncio.sleep(30)
+    """
+
+    def __init__(self, semaphore: asyncio.Semaphore):
+        """
+        Initialize the permit already acquired from the semaphore.
+
+        Args:
+            semaphore (asyncio.Semaphore): The worker slots of the scheduler.
+        """
+        self.semaphore = semaphore
+        self.is_held = True
+
+    async def acquire(self) -> None:
+        if not self.is_held:
+            await self.semaphore.acquire()
+            self.is_held = True
+
+    def release(self) -> None:
+        if self.is_held:
+            self.is_held = False
+            self.semaphore.release()
+
+    @asynccontextmanager
+    async def parked(self) -> AsyncIterator[None]:
+        """Give the slot back inside the `async with` block and take it again after."""
+        self.release()
+        try:
+            yield
+        finally:
+            await self.acquire()
+
+
+current_permit: ContextVar[WorkerPermit | None] = ContextVar(
+    'current_permit', default=None
+)
+rpc_limits = ConcurrencyLimits()
@@ -0,0 +1,97 @@
+import asyncio
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Samples are counted into exponential buckets, so memory stays constant no matter
+    how many requests are observed. Percentiles are answered with the upper bound
+    of the bucket the percentile falls into.
+    """
+    BUCKET_BOUNDS = (
+        0.025, 0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 6.4, 12.8
+    )
+
+    def __init__(
+        self,
+        default: float = 0.5,
+        min_samples: int = 5
+    ):
+        """
+        Initialize the histogram.
+
+        Args:
+            default (float): The value in seconds returned while there are not enough samples.
+            min_samples (int): The number of samples needed to answer percentiles.
+        """
+        self.default = default
+        self.min_samples = min_samples
+        self.counts = [0] * (len(self.BUCKET_BOUNDS) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.BUCKET_BOUNDS, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """
+        Observe the time spent inside the `with` block.
+
+        Cancelled blocks, e.g. hedged requests that lost the race, are not observed:
+        their truncated durations would bias the percentiles down.
+        """
+        started_at = time.perf_counter()
+        try:
+            yield
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.observe(time.perf_counter() - started_at)
+            raise
+        else:
+            self.observe(time.perf_counter() - started_at)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else self.default
+
+    def percentile(self, q: float) -> float:
+        """
+        Get the latency percentile.
+
+        Args:
+            q (float): The percentile in range (0, 1], e.g. 0.95.
+
+        Returns:
+            float: The upper bound of the bucket in seconds.
+        """
+        if self.total < self.min_samples:
+            return self.default
+
+        rank = q * self.total
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                break
+
+        if index < len(self.BUCKET_BOUNDS):
+            return self.BUCKET_BOUNDS[index]
+        return self.BUCKET_BOUNDS[-1] * 2
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            'count': self.total,
+            'mean': self.mean,
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95),
+            'p99': self.percentile(0.99),
+        }
@@ -0,0 +1,197 @@
+import asyncio
+import time
+from typing import Any, Callable
+
+from src.helpers.metrics import LatencyHistogram
+from user_data._inputs.settings.rpcs import RPC_RATE_LIMITS
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second up to `capacity`.
+
+    Waiters are served in FIFO order, so a heavy request can't be starved by light ones.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float): The max number of tokens, i.e. the allowed burst.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self, cost: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, waiting for them if needed.
+
+        Args:
+            cost (float): The number of tokens to take. Capped by the capacity.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        cost = min(cost, self.capacity)
+        started_at = time.monotonic()
+
+        async with self._lock:
+            self._refill()
+            if self._tokens < cost:
+                await asyncio.sleep((cost - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= cost
+
+        return time.monotonic() - started_at
+
+
+class RpcRateLimiter:
+    """
+    Process-wide request rate limits per RPC endpoint.
+
+    Every endpoint gets its own token bucket configured by the longest matching URL prefix
+    in `RPC_RATE_LIMITS` (so API keys appended to the URL don't matter), or by the default
+    limit. Requests are weighted per method: heavy methods take more tokens.
+    Time spent waiting for tokens is observed per endpoint.
+
+    Example of use:
+    >>> w3.middleware_onion.add(rate_limiter.create_web3_middleware(rpc))
+    >>> rate_limiter.get_metrics()
+    """
+    DEFAULT_LIMIT = {'rate': 10, 'burst': 20}
+    METHOD_WEIGHTS: dict[str, float] = {
+        'eth_call': 1,
+        'eth_estimateGas': 2,
+        'eth_getLogs': 5,
+        'eth_getBlockByNumber': 1,
+        'eth_getBlockByHash': 1,
+        'eth_sendRawTransaction': 2,
+        'debug_traceTransaction': 10,
+        'starknet_call': 1,
+        'starknet_estimateFee': 3,
+        'starknet_simulateTransactions': 5,
+        'starknet_getBlockWithTxs': 5,
+        'starknet_getEvents': 5,
+    }
+    FULL_BLOCK_WEIGHT = 5
+    DEFAULT_WEIGHT = 1
+
+    def __init__(self, limits: dict[str, dict[str, float]] | None = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            limits (dict[str, dict[str, float]] | None): Limits by URL prefix with the
+                `rate` (requests per second) and `burst` keys. The `default` key sets
+                the limit for other endpoints.
+        """
+        limits = dict(limits or {})
+        self.default_limit = limits.pop('default', self.DEFAULT_LIMIT)
+        self.limits = limits
+
+        self._buckets: dict[str, TokenBucket] = {}
+        self._waits: dict[str, LatencyHistogram] = {}
+
+    def _get_limit(self, rpc: str) -> dict[str, float]:
+        prefixes = [prefix for prefix in self.limits if rpc.startswith(prefix)]
+        if not prefixes:
+            return self.default_limit
+
+        return self.limits[max(prefixes, key=len)]
+
+    def get_bucket(self, rpc: str) -> TokenBucket:
+        if rpc not in self._buckets:
+            limit = self._get_limit(rpc)
+            self._buckets[rpc] = TokenBucket(
+                rate=limit['rate'],
+                capacity=limit.get('burst', limit['rate'])
+            )
+            self._waits[rpc] = LatencyHistogram(default=0.0, min_samples=1)
+
+        return self._buckets[rpc]
+
+    def get_weight(self, method: str, params: Any = None) -> float:
+        """
+        Get the number of tokens the request takes.
+
+        `eth_getBlockBy*` with full transactions costs `FULL_BLOCK_WEIGHT`.
+        """
+        if (
+            method in ('eth_getBlockByNumber', 'eth_getBlockByHash')
+            and isinstance(params, (list, tuple))
+            and len(params) > 1
+            and params[1]
+        ):
+            return self.FULL_BLOCK_WEIGHT
+
+        if not method.startswith(('eth_', 'starknet_', 'debug_', 'net_', 'web3_')):
+            method = f'starknet_{method}'
+
+        return self.METHOD_WEIGHTS.get(method, self.DEFAULT_WEIGHT)
+
+    async def acquire(
+        self,
+        rpc: str,
+        method: str,
+        params: Any = None,
+        count: int = 1
+    ) -> float:
+        """
+        Wait until the request to the endpoint is allowed.
+
+        Args:
+            rpc (str): The endpoint URL.
+            method (str): The JSON-RPC method.
+            params (Any): The JSON-RPC params.
+            count (int): The number of requests, e.g. in a JSON-RPC batch.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        waited = await self.get_bucket(rpc).acquire(
+            self.get_weight(method, params) * count
+        )
+        self._waits[rpc].observe(waited)
+        return waited
+
+    def get_metrics(self) -> dict[str, dict[str, float]]:
+        """Get queue-wait statistics in seconds per endpoint."""
+        return {
+            rpc: histogram.snapshot()
+            for rpc, histogram in self._waits.items()
+        }
+
+    def create_web3_middleware(self, rpc: str) -> Callable:
+        """
+        Create the async web3 middleware waiting for the rate limit before every request.
+
+        Args:
+            rpc (str): The RPC endpoint of the provider.
+
+        Returns:
+            Callable: The middleware to inject into the `middleware_onion`.
+        """
+        async def rate_limit_middleware(make_request: Callable, w3: Any) -> Callable:
+            async def middleware(method: str, params: Any) -> Any:
+                await self.acquire(rpc, method, params)
+                return await make_request(method, params)
+
+            return middleware
+
+        return rate_limit_middleware
+
+
+rate_limiter = RpcRateLimiter(RPC_RATE_LIMITS)
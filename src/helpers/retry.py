@@ -0,0 +1,143 @@
+import asyncio
+import random
+from enum import Enum
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar('T')
+
+
+class ErrorKind(Enum):
+    RETRYABLE = 'retryable'
+    FATAL = 'fatal'
+    ADJUST = 'adjust'
+
+
+class RetryPolicy:
+    """
+    Bounded retry policy with exponential backoff, jitter and error classification.
+
+    Errors are classified by the `classify` callable:
+        - `ErrorKind.RETRYABLE`: the call is repeated after a backoff delay;
+        - `ErrorKind.ADJUST`: `on_adjust` is called to change the call inputs, then the call is repeated;
+        - `ErrorKind.FATAL`: the error is raised immediately.
+    The last error is raised when the attempt budget is spent.
+
+    Example of use:
+    >>> policy = RetryPolicy(
+    >>>     max_attempts=3,
+    >>>     classify=lambda error: (
+    >>>         ErrorKind.ADJUST
+    >>>         if isinstance(error, ContractCustomError)
+    >>>         else ErrorKind.FATAL
+    >>>     )
+    >>> )
+    >>> await policy.run(lambda: self._bridge(bridge_info), on_adjust=increase_slippage)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        jitter: float = 0.25,
+        classify: Callable[[BaseException], ErrorKind] | None = None,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts (int): The total number of attempts including the first one.
+            base_delay (float): The delay in seconds before the second attempt.
+            max_delay (float): The upper bound for the delay in seconds.
+            jitter (float): The relative random deviation of the delay, e.g. 0.25 is ±25%.
+            classify (Callable[[BaseException], ErrorKind] | None): The error classifier.
+                All errors are retryable by default.
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.classify = classify or (lambda error: ErrorKind.RETRYABLE)
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        Get the backoff delay after the failed attempt.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting from 1.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return max(0.0, delay * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    async def run(
+        self,
+        func: Callable[[], Awaitable[T]],
+        on_adjust: Callable[[int, BaseException], None] | None = None,
+        on_retry: Callable[[int, BaseException, float], None] | None = None,
+    ) -> T:
+        """
+        Run the coroutine function until it succeeds or the budget is spent.
+
+        Args:
+            func (Callable[[], Awaitable[T]]): The coroutine function to run.
+            on_adjust (Callable[[int, BaseException], None] | None): Called with the attempt
+                number and the error before an adjust-and-retry attempt.
+            on_retry (Callable[[int, BaseException, float], None] | None): Called with the attempt
+                number, the error and the delay before a retry.
+
+        Returns:
+            T: The result of the function.
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await func()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                kind = self.classify(error)
+
+                if kind == ErrorKind.FATAL or attempt == self.max_attempts:
+                    raise
+
+                if kind == ErrorKind.ADJUST and on_adjust:
+                    on_adjust(attempt, error)
+
+                delay = self.get_delay(attempt)
+                if on_retry:
+                    on_retry(attempt, error, delay)
+                await asyncio.sleep(delay)
+
+        raise RuntimeError('Retry policy must have at least one attempt')
+
+    async def poll(
+        self,
+        check: Callable[[], Awaitable[bool]],
+        on_pending: Callable[[int, float], None] | None = None,
+    ) -> bool:
+        """
+        Poll the condition with backoff until it is met or the budget is spent.
+
+        Args:
+            check (Callable[[], Awaitable[bool]]): The coroutine function checking the condition.
+            on_pending (Callable[[int, float], None] | None): Called with the attempt number
+                and the delay when the condition is not met yet.
+
+        Returns:
+            bool: True if the condition was met, False if the budget was spent.
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            if await check():
+                return True
+
+            if attempt == self.max_attempts:
+                break
+
+            delay = self.get_delay(attempt)
+            if on_pending:
+                on_pending(attempt, delay)
+            await asyncio.sleep(delay)
+
+        return False
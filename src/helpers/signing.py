@@ -0,0 +1,233 @@
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Literal
+
+from eth_account import Account
+from eth_account.datastructures import SignedTransaction
+from eth_account.signers.local import LocalAccount
+
+from src.helpers.metrics import LatencyHistogram
+
+SignKind = Literal['evm', 'stark']
+
+
+@lru_cache(maxsize=4096)
+def _get_evm_account(private_key: bytes) -> LocalAccount:
+    """Get the key object of the private key, cached per pool worker."""
+    return Account.from_key(private_key)
+
+
+def _sign(kind: SignKind, private_key: Any, payload: Any) -> Any:
+    if kind == 'evm':
+        return _get_evm_account(private_key).sign_transaction(payload)
+
+    from starknet_py.hash.utils import message_signature
+    return list(message_signature(msg_hash=payload, priv_key=private_key))
+
+
+def sign_batch(items: list[tuple[SignKind, Any, Any]]) -> list[tuple[bool, Any]]:
+    """
+    Sign a batch of payloads in a pool worker.
+
+    Returns:
+        list[tuple[bool, Any]]: The success flag and the signature or the error of every item.
+    """
+    results = []
+    for kind, private_key, payload in items:
+        try:
+            results.append((True, _sign(kind, private_key, payload)))
+        except Exception as error:
+            results.append((False, error))
+    return results
+
+
+class SigningService:
+    """
+    Signs transactions in an executor pool instead of the event loop.
+
+    Every batch of up to `max_batch` requests runs as its own task, at most one per pool
+    worker, so all workers sign in parallel. A request is dispatched at once while a
+    worker is free; while all of them are busy, requests queue up and form the next
+    micro-batches. Key objects are cached in every pool worker. The time from the
+    request to the signature is observed.
+
+    Example of use:
+    >>> signed_tx = await signing_service.sign_evm_transaction(account.key, tx_params)
+    >>> signing_service.get_metrics()
+    """
+    MAX_BATCH = 32
+
+    def __init__(
+        self,
+        executor: Literal['thread', 'process'] = 'thread',
+        workers: int | None = None,
+        max_batch: int = MAX_BATCH,
+    ):
+        """
+        Initialize the service. The pool is created on the first request.
+
+        Args:
+            executor (Literal['thread', 'process']): The kind of the pool. Processes bypass
+                the GIL for pure Python code like RLP encoding, threads start faster.
+            workers (int | None): The number of pool workers, the pool default if None.
+            max_batch (int): The max number of signatures per pool call.
+        """
+        self.executor = executor
+        self.workers = workers
+        self.max_batch = max_batch
+
+        self.latency = LatencyHistogram(default=0.0, min_samples=1)
+        self.batches = 0
+        self.signed = 0
+
+        self._pool: Executor | None = None
+        self._pending: list[tuple[SignKind, Any, Any, asyncio.Future]] = []
+        self._batcher: asyncio.Task | None = None
+        self._has_pending: asyncio.Event | None = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    def _get_pool(self) -> Executor:
+        if not self._pool:
+            self._pool = (
+                ProcessPoolExecutor(self.workers)
+                if self.executor == 'process'
+                else ThreadPoolExecutor(self.workers, thread_name_prefix='signer')
+            )
+        return self._pool
+
+    def _get_worker_count(self) -> int:
+        if self.workers:
+            return self.workers
+
+        cpu_count = os.cpu_count() or 1
+        # the defaults of the pools
+        return cpu_count if self.executor == 'process' else min(32, cpu_count + 4)
+
+    async def sign_evm_transaction(
+        self,
+        private_key: bytes,
+        tx_params: dict
+    ) -> SignedTransaction:
+        """
+        Sign the EVM transaction.
+
+        Args:
+            private_key (bytes): The private key of the account.
+            tx_params (dict): The prepared parameters of the transaction.
+
+        Returns:
+            SignedTransaction: The signed transaction.
+        """
+        return await self._submit('evm', bytes(private_key), dict(tx_params))
+
+    async def sign_stark_hash(
+        self,
+        private_key: int,
+        msg_hash: int
+    ) -> list[int]:
+        """
+        Sign the Starknet transaction hash with the Stark curve.
+
+        Args:
+            private_key (int): The private key of the account.
+            msg_hash (int): The hash of the transaction.
+
+        Returns:
+            list[int]: The signature `[r, s]`.
+        """
+        return await self._submit('stark', private_key, msg_hash)
+
+    async def _submit(
+        self,
+        kind: SignKind,
+        private_key: Any,
+        payload: Any
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        if not self._batcher or self._batcher.done():
+            self._has_pending = asyncio.Event()
+            self._batcher = loop.create_task(self._run_batches())
+
+        future = loop.create_future()
+        self._pending.append((kind, private_key, payload, future))
+        self._has_pending.set()
+
+        started_at = time.perf_counter()
+        try:
+            return await future
+        finally:
+            self.latency.observe(time.perf_counter() - started_at)
+
+    async def _run_batches(self) -> None:
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self._get_worker_count())
+
+        def on_signed(task: asyncio.Task) -> None:
+            self._in_flight.discard(task)
+            slots.release()
+
+        while True:
+            await self._has_pending.wait()
+            await slots.acquire()
+
+            batch = self._pending[:self.max_batch]
+            self._pending = self._pending[self.max_batch:]
+            if not self._pending:
+                self._has_pending.clear()
+
+            batch = [item for item in batch if not item[3].cancelled()]
+            if not batch:
+                slots.release()
+                continue
+
+            task = loop.create_task(self._sign_batch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(on_signed)
+
+    async def _sign_batch(
+        self,
+        batch: list[tuple[SignKind, Any, Any, asyncio.Future]]
+    ) -> None:
+        self.batches += 1
+        self.signed += len(batch)
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._get_pool(),
+                sign_batch,
+                [(kind, key, payload) for kind, key, payload, _ in batch]
+            )
+        except Exception as error:
+            results = [(False, error)] * len(batch)
+
+        for (*_, future), (is_success, value) in zip(batch, results):
+            if future.done():
+                continue
+            if is_success:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def get_metrics(self) -> dict[str, dict[str, float]]:
+        """Get the signing latency in seconds and the batch sizes."""
+        return {
+            'latency': self.latency.snapshot(),
+            'batches': {
+                'count': self.batches,
+                'mean_size': round(self.signed / self.batches, 2) if self.batches else 0,
+            },
+        }
+
+    def shutdown(self) -> None:
+        if self._batcher:
+            self._batcher.cancel()
+        for task in self._in_flight:
+            task.cancel()
+        if self._pool:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+
+signing_service = SigningService()
@@ -4,6 +4,7 @@ import random
 from datetime import datetime
 
 from src._types.common import IntRange
+from src.helpers.concurrency import current_permit
 
 
 def get_izoformat_timestamp() -> str:
@@ -22,8 +23,25 @@ def get_unix_timestamp() -> str:
 
 
 async def sleep(value: int | IntRange):
+    """
+    Sleep for the given or a random number of seconds.
+
+    Inside an account run by the scheduler the worker slot is given back for the time
+    of the sleep, so other accounts run while this one waits.
+
+    Args:
+        value (int | IntRange): The seconds or the range to choose them from.
+
+    """
     if isinstance(value, int):
-        await asyncio.sleep(value)
+        seconds = value
     else:
-        random_value = random.randint(value[0], value[1])
-        await asyncio.sleep(random_value)
+        seconds = random.randint(value[0], value[1])
+
+    permit = current_permit.get()
+    if permit is None:
+        await asyncio.sleep(seconds)
+        return
+
+    async with permit.parked():
+        await asyncio.sleep(seconds)
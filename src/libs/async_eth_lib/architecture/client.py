@@ -9,8 +9,12 @@ from web3.middleware.geth_poa import async_geth_poa_middleware
 from eth_account.signers.local import LocalAccount
 
 from src._types.networks import NetworkNamesEnum
+from src.helpers.adaptive_concurrency import adaptive_concurrency
+from src.helpers.concurrency import rpc_limits
+from src.helpers.rate_limit import rate_limiter
 from .transaction import Transaction
 from .contract import Contract
+from .multicall import Multicall
 from .logger import CustomLogger
 from ..models import exceptions as exceptions
 from ..data.networks import Networks
@@ -38,6 +42,7 @@ class EvmClient:
         
         self.transaction = Transaction(self.account, self.network, self.w3)
         self.contract = Contract(self.transaction)
+        self.multicall = Multicall(self.transaction)
 
     def _init_proxy(self, check_proxy: bool):
         if not self.proxy:
@@ -67,13 +72,14 @@ class EvmClient:
         }
 
     def _init_web3(self):
+        self.rpc = (
+            random.choice(self.network.rpcs)
+            if isinstance(self.network.rpcs, list)
+            else self.network.rpcs
+        )
         self.w3 = AsyncWeb3(
             AsyncWeb3.AsyncHTTPProvider(
-                endpoint_uri=(
-                    random.choice(self.network.rpcs)
-                    if isinstance(self.network.rpcs, list)
-                    else self.network.rpcs
-                ),
+                endpoint_uri=self.rpc,
                 request_kwargs={
                     'proxy': self.proxy,
                     'headers': self.headers
@@ -83,6 +89,18 @@ class EvmClient:
             middlewares=[]
         )
         self.w3.middleware_onion.inject(async_geth_poa_middleware, layer=0)
+        self.w3.middleware_onion.add(
+            rpc_limits.create_web3_middleware(self.network.name, self.rpc),
+            name='rpc_limits'
+        )
+        self.w3.middleware_onion.add(
+            adaptive_concurrency.create_web3_middleware(self.rpc),
+            name='adaptive_concurrency'
+        )
+        self.w3.middleware_onion.add(
+            rate_limiter.create_web3_middleware(self.rpc),
+            name='rate_limiter'
+        )
 
     def _init_account(self, private_key: str | None):
         if private_key:
@@ -0,0 +1,138 @@
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+from eth_abi import decode, encode
+from web3 import Web3
+from web3.contract.async_contract import AsyncContract
+
+from src._types.networks import NetworkNamesEnum
+from .transaction import Transaction
+from ..models.dataclasses import DefaultAbis
+from ..models.type_alias import AddressType
+
+
+@dataclass
+class MulticallCall:
+    """
+    A read-only call batched by Multicall3.
+
+    Attributes:
+        target (AddressType): The address of the called contract.
+        call_data (bytes): The encoded function selector and arguments.
+        output_types (list[str]): The ABI types used to decode the returned data.
+    """
+    target: AddressType
+    call_data: bytes
+    output_types: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_signature(
+        cls,
+        target: AddressType,
+        text_signature: str,
+        args: Sequence[Any],
+        output_types: list[str]
+    ) -> 'MulticallCall':
+        """
+        Create the call from a text signature, e.g. `getAmountsOut(uint256,address[])`.
+
+        Args:
+            target (AddressType): The address of the called contract.
+            text_signature (str): The function text signature.
+            args (Sequence[Any]): The function arguments.
+            output_types (list[str]): The ABI types used to decode the returned data.
+
+        Returns:
+            MulticallCall: The call.
+        """
+        input_types = text_signature[text_signature.index('(') + 1:-1]
+        selector = Web3.keccak(text=text_signature)[:4]
+        call_data = selector + encode(
+            [item for item in input_types.split(',') if item],
+            list(args)
+        )
+
+        return cls(
+            target=Web3.to_checksum_address(target),
+            call_data=call_data,
+            output_types=output_types
+        )
+
+    @classmethod
+    def from_contract(
+        cls,
+        contract: AsyncContract,
+        fn_name: str,
+        args: Sequence[Any],
+        output_types: list[str]
+    ) -> 'MulticallCall':
+        return cls(
+            target=contract.address,
+            call_data=Web3.to_bytes(
+                hexstr=contract.encodeABI(fn_name, args=list(args))
+            ),
+            output_types=output_types
+        )
+
+
+class Multicall:
+    """Batches read-only calls into one `eth_call` through Multicall3."""
+    DEFAULT_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+    ADDRESSES: dict[str, str] = {
+        NetworkNamesEnum.ZKSYNC_ERA: '0xF9cda624FBC7e059355ce98a31693d299FACd963',
+    }
+
+    def __init__(self, transaction: Transaction):
+        self.transaction = transaction
+
+    @property
+    def address(self) -> str:
+        return self.ADDRESSES.get(self.transaction.network.name, self.DEFAULT_ADDRESS)
+
+    def get_contract(self) -> AsyncContract:
+        return self.transaction.w3.eth.contract(
+            address=Web3.to_checksum_address(self.address),
+            abi=DefaultAbis.MULTICALL_3
+        )
+
+    def get_eth_balance_call(self, account_address: AddressType) -> MulticallCall:
+        return MulticallCall.from_signature(
+            target=self.address,
+            text_signature='getEthBalance(address)',
+            args=[Web3.to_checksum_address(account_address)],
+            output_types=['uint256']
+        )
+
+    async def aggregate(
+        self,
+        calls: Sequence[MulticallCall]
+    ) -> list[tuple | None]:
+        """
+        Execute the calls in one request.
+
+        Args:
+            - `calls` (Sequence[MulticallCall]): The calls to execute.
+
+        Returns:
+            - `list[tuple | None]`: The decoded result of each call or None if the call reverted.
+        """
+        if not calls:
+            return []
+
+        results = await self.get_contract().functions.aggregate3([
+            (call.target, True, call.call_data)
+            for call in calls
+        ]).call()
+
+        decoded_results: list[tuple | None] = []
+        for call, (success, return_data) in zip(calls, results):
+            if not success or not return_data:
+                decoded_results.append(None)
+                continue
+
+            try:
+                decoded_results.append(decode(call.output_types, return_data))
+            except Exception:
+                decoded_results.append(None)
+
+        return decoded_results
@@ -6,6 +6,8 @@ from eth_typing import BlockIdentifier
 from eth_account.datastructures import SignedTransaction
 from eth_account.signers.local import LocalAccount
 
+from src.helpers.signing import signing_service
+
 from .network import Network
 from ..models.others import TokenAmount
 from ..models.type_alias import AddressType
@@ -189,7 +191,7 @@ class Transaction:
 
     async def sign_transaction(self, tx_params: TxParams | dict) -> SignedTransaction:
         """
-        Sign a transaction.
+        Sign a transaction in the pool of `signing_service`, off the event loop.
 
         Args:
             - `tx_params` (TxParams): parameters of the transaction.
@@ -198,7 +200,9 @@ class Transaction:
             - `SignedTransaction`: the signed transaction.
 
         """
-        return self.account.sign_transaction(tx_params)
+        return await signing_service.sign_evm_transaction(
+            self.account.key, dict(tx_params)
+        )
 
     async def sign_message(self, message: str):
         pass
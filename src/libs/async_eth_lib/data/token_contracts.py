@@ -33,14 +33,19 @@ class TokenContractData:
 
         return getattr(cls, contract_name)
 
+    @classmethod
+    def get_all_tokens(cls) -> list[TokenContract | NativeTokenContract]:
+        return [
+            value
+            for value in vars(cls).values()
+            if isinstance(value, (TokenContract, NativeTokenContract))
+        ]
+
 
 class ContractsFactory:
     @staticmethod
-    def get_contract(
-        network_name: NetworkNamesEnum,
-        token_symbol: TokenSymbol
-    ) -> TokenContract | NativeTokenContract:
-        supported_networks: dict[NetworkNamesEnum, type[TokenContractData]] = {
+    def get_supported_networks() -> dict[NetworkNamesEnum, type[TokenContractData]]:
+        return {
             NetworkNamesEnum.ETHEREUM: EthereumTokenContracts,
             NetworkNamesEnum.ARBITRUM: ArbitrumTokenContracts,
             NetworkNamesEnum.AVALANCHE: AvalancheTokenContracts,
@@ -54,6 +59,13 @@ class ContractsFactory:
             NetworkNamesEnum.ZKSYNC_ERA: ZkSyncEraTokenContracts,
         }
 
+    @staticmethod
+    def get_contract(
+        network_name: NetworkNamesEnum,
+        token_symbol: TokenSymbol
+    ) -> TokenContract | NativeTokenContract:
+        supported_networks = ContractsFactory.get_supported_networks()
+
         if network_name not in supported_networks:
             raise ValueError("Network not supported")
 
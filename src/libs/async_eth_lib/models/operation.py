@@ -1,5 +1,5 @@
 import random
-from typing import List, TypedDict
+from typing import TYPE_CHECKING, List, TypedDict
 from typing_extensions import NotRequired
 
 from src._types.networks import NetworkNamesEnum
@@ -9,6 +9,9 @@ from . import exceptions as exceptions
 from .contract import NativeTokenContract, TokenContract
 from .others import TokenAmount
 
+if TYPE_CHECKING:
+    from .route_graph import RouteGraph
+
 
 # region Class to get info about operations like swap, bridge, add liquidity, remove liquidity etc.
 class OperationInfo:
@@ -108,7 +111,10 @@ class TxPayloadDetails:
         method_name: str,
         addresses: List[str],
         function_signature: str | None = None,
-        bool_list: List[bool] | None = None
+        bool_list: List[bool] | None = None,
+        tokens: List[TokenSymbol] | None = None,
+        pool_addresses: List[str | None] | None = None,
+        encoded_path: bytes | None = None
     ):
         """
         Initialize the RouteInfo class.
@@ -118,6 +124,9 @@ class TxPayloadDetails:
             addresses (List[str]): The list of addresses.
             function_signature (str | None): The hex signature of provided function.
             bool_list (List[bool] | None): The list of boolean values (default is None).
+            tokens (List[TokenSymbol] | None): The tokens of the path (default is None).
+            pool_addresses (List[str | None] | None): The pools of each hop (default is None).
+            encoded_path (bytes | None): The packed addresses of the path (default is None).
 
         """
         self.method_name = method_name
@@ -126,22 +135,46 @@ class TxPayloadDetails:
             self.function_signature = function_signature
         if bool_list:
             self.bool_list = bool_list
+        self.tokens = tokens
+        self.pool_addresses = pool_addresses
+        self.encoded_path = encoded_path
 
 
 class TxPayloadDetailsFetcher:
     """
     Derived classes should reassigned 
+        ROUTE_GRAPH: RouteGraph | None = None
+    or
         PATHS: dict[str, dict[str: TxPayloadDetails]] = {}
     from TxPayloadDetailsFetcher to use it's methods
     """
+    ROUTE_GRAPH: 'RouteGraph | None' = None
     PATHS: dict[str, dict[str, TxPayloadDetails]] = {}
 
+    @classmethod
+    def get_all_tx_payload_details(
+        cls,
+        first_token: TokenSymbol,
+        second_token: TokenSymbol
+    ) -> List[TxPayloadDetails]:
+        if cls.ROUTE_GRAPH:
+            return cls.ROUTE_GRAPH.get_all_tx_payload_details(
+                first_token, second_token
+            )
+
+        return [cls.get_tx_payload_details(first_token, second_token)]
+
     @classmethod
     def get_tx_payload_details(
         cls,
         first_token: TokenSymbol,
         second_token: TokenSymbol
     ) -> TxPayloadDetails:
+        if cls.ROUTE_GRAPH:
+            return cls.ROUTE_GRAPH.get_tx_payload_details(
+                first_token, second_token
+            )
+
         if first_token not in cls.PATHS:
             raise exceptions.TxPayloadDetailsNotAdded(
                 f"The '{first_token}' token has not been "
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+from eth_typing import HexStr
+from web3 import Web3
+
+from src._types.networks import NetworkNamesEnum
+from src._types.tokens import TokenSymbol
+
+from . import exceptions as exceptions
+from .operation import TxPayloadDetails
+
+if TYPE_CHECKING:
+    from ..data.token_contracts import TokenContractData
+
+
+# region Pools
+@dataclass(frozen=True)
+class Pool:
+    """
+    A liquidity pool of the DEX, an edge of the route graph.
+
+    Attributes:
+        first_token (TokenSymbol): The first token of the pool.
+        second_token (TokenSymbol): The second token of the pool.
+        address (str | None): The pool address, if the DEX needs it in the payload.
+        is_stable (bool): Whether the pool uses the stable curve.
+        priority (int): The order among pools of the same pair, the lowest first.
+            With equal priorities, the pool declared from the token to swap is preferred.
+    """
+    first_token: TokenSymbol
+    second_token: TokenSymbol
+    address: str | None = None
+    is_stable: bool = False
+    priority: int = 0
+
+
+@dataclass(frozen=True)
+class SwapMethod:
+    name: str
+    function_signature: str | None = None
+
+
+@dataclass(frozen=True)
+class SwapMethods:
+    """Router methods used for swaps from native, to native and between tokens."""
+    from_native: SwapMethod
+    to_native: SwapMethod
+    tokens: SwapMethod
+# endregion Pools
+
+
+# region Route graph
+class RouteGraph:
+    """
+    Pools of a DEX on the network kept as a graph of tokens.
+
+    The best `k_paths` paths (the fewest hops first) between every pair of tokens
+    are precomputed with their payload details, so that lookups are O(1).
+    Paths of the same length follow the priority of their pools, and a route set
+    in `preferred_routes` always comes first. The index is rebuilt when the pools
+    are changed.
+
+    Example of use:
+    >>> class MuteRoutes(TxPayloadDetailsFetcher):
+    >>>     ROUTE_GRAPH = RouteGraph(
+    >>>         network_name=NetworkNamesEnum.ZKSYNC_ERA,
+    >>>         token_contracts=ZkSyncEraTokenContracts,
+    >>>         pools=[Pool(TokenSymbol.ETH, TokenSymbol.USDC)],
+    >>>         swap_methods=SwapMethods(...)
+    >>>     )
+    """
+
+    def __init__(
+        self,
+        network_name: NetworkNamesEnum,
+        token_contracts: type[TokenContractData],
+        pools: Iterable[Pool],
+        swap_methods: SwapMethods,
+        is_pools_in_path: bool = False,
+        max_hops: int = 3,
+        k_paths: int = 3,
+        native_token: TokenSymbol = TokenSymbol.ETH,
+        wrapped_native_token: TokenSymbol = TokenSymbol.WETH,
+        preferred_routes: Iterable[list[TokenSymbol]] = (),
+    ):
+        """
+        Initialize the route graph and precompute paths.
+
+        Args:
+            network_name (NetworkNamesEnum): The network of the DEX.
+            token_contracts (type[TokenContractData]): The token contracts of the network.
+            pools (Iterable[Pool]): The pools of the DEX.
+            swap_methods (SwapMethods): The router methods for swaps.
+            is_pools_in_path (bool): Whether pool addresses are interleaved with tokens in the path.
+            max_hops (int): The max number of pools in one path.
+            k_paths (int): The number of best paths kept for every pair of tokens.
+            native_token (TokenSymbol): The native token of the network.
+            wrapped_native_token (TokenSymbol): The token used instead of native one in paths.
+            preferred_routes (Iterable[list[TokenSymbol]]): The routes (tokens from the first
+                to the last one) used first for their pairs instead of the shortest path.
+        """
+        self.network_name = network_name
+        self.token_contracts = token_contracts
+        self.swap_methods = swap_methods
+        self.is_pools_in_path = is_pools_in_path
+        self.max_hops = max_hops
+        self.k_paths = k_paths
+        self.native_token = native_token
+        self.wrapped_native_token = wrapped_native_token
+        self.preferred_routes = {
+            (route[0], route[-1]): route
+            for route in preferred_routes
+        }
+
+        self._pools: tuple[Pool, ...] = ()
+        self._edges: dict[TokenSymbol, list[Pool]] = {}
+        self._pools_by_pair: dict[tuple[TokenSymbol, TokenSymbol], Pool] = {}
+        self._index: dict[tuple[TokenSymbol, TokenSymbol], list[TxPayloadDetails]] = {}
+
+        self.update_pools(pools)
+
+    @property
+    def pools(self) -> tuple[Pool, ...]:
+        return self._pools
+
+    def update_pools(self, pools: Iterable[Pool]) -> None:
+        """Replace the pools of the DEX and rebuild precomputed paths."""
+        self._pools = tuple(pools)
+        self._build_index()
+
+    def add_pool(self, pool: Pool) -> None:
+        self.update_pools(self._pools + (pool,))
+
+    def get_pool(
+        self,
+        first_token: TokenSymbol,
+        second_token: TokenSymbol
+    ) -> Pool | None:
+        return self._pools_by_pair.get((first_token, second_token))
+
+    def get_tx_payload_details(
+        self,
+        first_token: TokenSymbol,
+        second_token: TokenSymbol
+    ) -> TxPayloadDetails:
+        """Get the payload details of the best path between the tokens."""
+        return self.get_all_tx_payload_details(first_token, second_token)[0]
+
+    def get_all_tx_payload_details(
+        self,
+        first_token: TokenSymbol,
+        second_token: TokenSymbol
+    ) -> list[TxPayloadDetails]:
+        """Get the payload details of all precomputed paths, the best one first."""
+        paths = self._index.get((first_token, second_token))
+
+        if not paths:
+            raise exceptions.TxPayloadDetailsNotAdded(
+                f"There are no pools connecting '{first_token}' and "
+                f"'{second_token}' in {self.network_name} route graph"
+            )
+
+        return paths
+
+    @staticmethod
+    def _get_pool_rank(pool: Pool, token: TokenSymbol) -> tuple[int, bool]:
+        return pool.priority, pool.first_token != token
+
+    def _build_index(self) -> None:
+        edges: dict[TokenSymbol, list[Pool]] = defaultdict(list)
+        pools_by_pair: dict[tuple[TokenSymbol, TokenSymbol], Pool] = {}
+
+        for pool in self._pools:
+            edges[pool.first_token].append(pool)
+            edges[pool.second_token].append(pool)
+
+        for token, pools in edges.items():
+            pools.sort(key=lambda pool: self._get_pool_rank(pool, token))
+            for pool in pools:
+                next_token = self._get_next_token(pool, token)
+                pools_by_pair.setdefault((token, next_token), pool)
+
+        self._edges = dict(edges)
+        self._pools_by_pair = pools_by_pair
+        self._index = {
+            (first_token, second_token): [
+                self._create_tx_payload_details(first_token, second_token, hops)
+                for hops in paths
+            ]
+            for first_token in self._edges
+            for second_token, paths in self._find_paths(first_token).items()
+        }
+
+    @staticmethod
+    def _get_next_token(pool: Pool, token: TokenSymbol) -> TokenSymbol:
+        return (
+            pool.second_token
+            if pool.first_token == token
+            else pool.first_token
+        )
+
+    def _get_preferred_hops(
+        self,
+        route: list[TokenSymbol]
+    ) -> list[tuple[Pool, TokenSymbol]]:
+        hops = []
+        for token, next_token in zip(route, route[1:]):
+            pool = self._pools_by_pair.get((token, next_token))
+            if not pool:
+                raise exceptions.TxPayloadDetailsNotAdded(
+                    f"There is no pool of '{token}' and '{next_token}' for the "
+                    f"preferred route in {self.network_name} route graph"
+                )
+            hops.append((pool, next_token))
+
+        return hops
+
+    def _find_paths(
+        self,
+        first_token: TokenSymbol
+    ) -> dict[TokenSymbol, list[list[tuple[Pool, TokenSymbol]]]]:
+        """Breadth-first search of the simple paths, so that shorter ones come first."""
+        paths: dict[TokenSymbol, list[list[tuple[Pool, TokenSymbol]]]] = defaultdict(list)
+        queue: deque[tuple[TokenSymbol, list[tuple[Pool, TokenSymbol]]]] = deque(
+            [(first_token, [])]
+        )
+
+        while queue:
+            token, hops = queue.popleft()
+            if len(hops) == self.max_hops:
+                continue
+
+            visited = {first_token, *(hop_token for _, hop_token in hops)}
+            for pool in self._edges.get(token, []):
+                next_token = self._get_next_token(pool, token)
+                if next_token in visited:
+                    continue
+
+                next_hops = hops + [(pool, next_token)]
+                if len(paths[next_token]) < self.k_paths:
+                    paths[next_token].append(next_hops)
+                queue.append((next_token, next_hops))
+
+        for (route_first_token, second_token), route in self.preferred_routes.items():
+            if route_first_token != first_token:
+                continue
+
+            preferred_hops = self._get_preferred_hops(route)
+            paths[second_token] = [preferred_hops] + [
+                hops for hops in paths[second_token]
+                if hops != preferred_hops
+            ][:self.k_paths - 1]
+
+        return paths
+
+    def _get_token_address(self, token_symbol: TokenSymbol) -> str:
+        if token_symbol == self.native_token:
+            token_symbol = self.wrapped_native_token
+
+        return self.token_contracts.get_token(token_symbol).address
+
+    def _create_tx_payload_details(
+        self,
+        first_token: TokenSymbol,
+        second_token: TokenSymbol,
+        hops: list[tuple[Pool, TokenSymbol]]
+    ) -> TxPayloadDetails:
+        if first_token == self.native_token:
+            swap_method = self.swap_methods.from_native
+        elif second_token == self.native_token:
+            swap_method = self.swap_methods.to_native
+        else:
+            swap_method = self.swap_methods.tokens
+
+        tokens = [first_token] + [token for _, token in hops]
+        pool_addresses = [pool.address for pool, _ in hops]
+
+        swap_path = [self._get_token_address(first_token)]
+        for pool, token in hops:
+            if self.is_pools_in_path:
+                swap_path.append(Web3.to_checksum_address(pool.address))
+            swap_path.append(self._get_token_address(token))
+
+        return TxPayloadDetails(
+            method_name=swap_method.name,
+            addresses=swap_path,
+            function_signature=swap_method.function_signature,
+            bool_list=[pool.is_stable for pool, _ in hops],
+            tokens=tokens,
+            pool_addresses=pool_addresses,
+            encoded_path=b''.join(
+                Web3.to_bytes(hexstr=HexStr(address))
+                for address in swap_path
+            )
+        )
+# endregion Route graph
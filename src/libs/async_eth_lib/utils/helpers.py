@@ -5,6 +5,11 @@ from typing import Any, List
 from curl_cffi.requests import AsyncSession
 
 from src._types.common import HttpMethod
+from src.helpers.adaptive_concurrency import (
+    adaptive_concurrency,
+    get_target,
+    is_overload_response
+)
 from ..models import exceptions as exceptions
 
 
@@ -53,11 +58,17 @@ async def make_async_request(
     headers: dict | None = None,
     **kwargs
 ) -> dict:
-    async with AsyncSession(headers=headers, trust_env=True) as session:
+    async with (
+        adaptive_concurrency.slot(get_target(url)) as slot,
+        AsyncSession(headers=headers, trust_env=True) as session
+    ):
         response = await session.request(method, url=url, **kwargs)
         status_code = response.status_code
         json_response = response.json()
 
+        if is_overload_response(status_code, json_response):
+            slot.mark_overloaded()
+
         if status_code <= 201:
             return json_response
 
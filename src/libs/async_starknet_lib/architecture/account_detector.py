@@ -0,0 +1,193 @@
+import asyncio
+import hashlib
+import json
+import os
+from typing import List
+
+from starknet_py.net.full_node_client import FullNodeClient
+
+from .http_client import batch_call
+from ..models.others import StarkAccount, WalletType
+from ..utils.helpers import join_path
+from ..utils.key_derivation import (
+    derive_argent_private_key,
+    derive_braavos_private_key,
+    derive_wallets,
+    derive_wallets_bulk
+)
+
+NOT_FOUND_ADDRESS = 'Account not found'
+
+
+# region Wallet types cache
+class WalletTypeCache:
+    """
+    Detected wallet types and addresses persisted on disk.
+
+    Entries are keyed by the SHA-256 of the mnemonic, so the file holds no secrets.
+    Only deployed accounts are stored: an account not found now may be deployed later.
+    """
+    PATH = ['user_data', '_outputs', 'starknet_wallet_types.json']
+
+    def __init__(self, path: list[str] = PATH):
+        self.path = join_path(path)
+        self._entries: dict[str, dict[str, str]] | None = None
+
+    @staticmethod
+    def get_key(mnemonic: str) -> str:
+        return hashlib.sha256(mnemonic.strip().encode()).hexdigest()
+
+    def get(self, mnemonic: str) -> dict[str, str] | None:
+        return self._load().get(self.get_key(mnemonic))
+
+    def set_many(self, accounts: List[StarkAccount]) -> None:
+        entries = self._load()
+        for account in accounts:
+            entries[self.get_key(account.mnemonic)] = {
+                'wallet_type': account.wallet_type,
+                'address': account.address,
+            }
+        self._save()
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        if self._entries is None:
+            try:
+                with open(self.path) as file:
+                    self._entries = json.load(file)
+            except (OSError, ValueError):
+                self._entries = {}
+
+        return self._entries
+
+    def _save(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w') as file:
+                json.dump(self._entries, file, indent=4)
+        except OSError:
+            pass
+
+
+wallet_types = WalletTypeCache()
+# endregion Wallet types cache
+
+
+# region Detection
+def _derive_cached_account(
+    mnemonic: str,
+    entry: dict[str, str]
+) -> StarkAccount | None:
+    derive_key = (
+        derive_argent_private_key
+        if entry['wallet_type'] == WalletType.ARGENT
+        else derive_braavos_private_key
+    )
+    private_key = derive_key(mnemonic)
+    if not private_key:
+        return None
+
+    return StarkAccount(mnemonic, private_key, entry['address'], entry['wallet_type'])
+
+
+async def _get_deployed_addresses(
+    node_client: FullNodeClient,
+    addresses: List[str],
+    batch_size: int
+) -> set[str]:
+    responses = await batch_call(
+        client=node_client,
+        method_name='getClassHashAt',
+        params_list=[
+            {'block_id': 'latest', 'contract_address': address}
+            for address in addresses
+        ],
+        batch_size=batch_size
+    )
+
+    return {
+        address
+        for address, response in zip(addresses, responses)
+        if response.get('result')
+    }
+
+
+async def detect_accounts(
+    node_client: FullNodeClient,
+    mnemonics: List[str],
+    processes: int | None = 1,
+    batch_size: int = 50
+) -> List[StarkAccount]:
+    """
+    Detect the Argent X or Braavos accounts of the mnemonics.
+
+    Accounts detected before are restored from `wallet_types` without requests.
+    For the others, all candidate addresses of all mnemonics are checked by batched
+    `starknet_getClassHashAt` requests and resolved in memory: the first deployed
+    address in the order Argent X (newest version first), Braavos wins.
+
+    Args:
+        node_client (FullNodeClient): The node client.
+        mnemonics (List[str]): The mnemonics.
+        processes (int | None): The number of processes deriving keys, see `derive_wallets_bulk`.
+        batch_size (int): The max number of calls in one batch request.
+
+    Returns:
+        List[StarkAccount]: The account of every mnemonic, in order. Not found accounts
+            have the `Account not found` address.
+    """
+    accounts: list[StarkAccount | None] = [None] * len(mnemonics)
+    pending: list[int] = []
+
+    for index, mnemonic in enumerate(mnemonics):
+        entry = wallet_types.get(mnemonic)
+        if entry:
+            accounts[index] = _derive_cached_account(mnemonic, entry)
+        if not accounts[index]:
+            pending.append(index)
+
+    if pending:
+        pending_mnemonics = [mnemonics[index] for index in pending]
+        if len(pending_mnemonics) == 1:
+            derived = [derive_wallets(pending_mnemonics[0])]
+        else:
+            derived = await asyncio.get_running_loop().run_in_executor(
+                None, derive_wallets_bulk, pending_mnemonics, processes
+            )
+
+        candidates = [
+            [
+                (wallet_type, wallet['private_key'], address)
+                for wallet_type in (WalletType.ARGENT, WalletType.BRAAVOS)
+                if (wallet := wallets.get(wallet_type))
+                for address in wallet['addresses'].values()
+            ]
+            for wallets in derived
+        ]
+        deployed = await _get_deployed_addresses(
+            node_client=node_client,
+            addresses=[
+                address
+                for mnemonic_candidates in candidates
+                for _, _, address in mnemonic_candidates
+            ],
+            batch_size=batch_size
+        )
+
+        found = []
+        for index, mnemonic_candidates in zip(pending, candidates):
+            for wallet_type, private_key, address in mnemonic_candidates:
+                if address in deployed:
+                    accounts[index] = StarkAccount(
+                        mnemonics[index], private_key, address, wallet_type
+                    )
+                    found.append(accounts[index])
+                    break
+
+        if found:
+            wallet_types.set_many(found)
+
+    return [
+        account or StarkAccount(address=NOT_FOUND_ADDRESS, mnemonic=mnemonic)
+        for mnemonic, account in zip(mnemonics, accounts)
+    ]
+# endregion Detection
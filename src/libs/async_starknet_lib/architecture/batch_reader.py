@@ -0,0 +1,221 @@
+from dataclasses import dataclass, field
+from typing import Callable, List, NamedTuple
+
+from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.models import AddressRepresentation
+from starknet_py.net.client_models import Call
+
+from .http_client import batch_call
+from ..models.type_alias import TokenContractType
+
+
+def decode_felt(result: List[int]) -> int:
+    return result[0]
+
+
+def decode_u256(result: List[int]) -> int:
+    """Decode `Uint256` of Cairo 0 or `u256` of Cairo 1: the low and the high 128 bits."""
+    if len(result) == 1:
+        return result[0]
+    return result[0] + (result[1] << 128)
+
+
+class ViewMethod(NamedTuple):
+    selector: int
+    decode: Callable[[List[int]], int]
+
+
+# selectors are hashed and decoders are chosen once, not per call
+VIEW_METHODS: dict[str, ViewMethod] = {
+    'balanceOf': ViewMethod(get_selector_from_name('balanceOf'), decode_u256),
+    'allowance': ViewMethod(get_selector_from_name('allowance'), decode_u256),
+    'decimals': ViewMethod(get_selector_from_name('decimals'), decode_felt),
+}
+
+
+def to_int(value: AddressRepresentation) -> int:
+    return value if isinstance(value, int) else int(value, 16)
+
+
+@dataclass
+class TokenSnapshot:
+    """
+    Columnar snapshot of token views.
+
+    `balances[i][j]` and `allowances[i][j]` belong to `accounts[i]` and `tokens[j]`,
+    `decimals[j]` belongs to `tokens[j]`. Failed reads are None.
+    """
+    accounts: List[int]
+    tokens: List[int]
+    decimals: List[int | None]
+    balances: List[List[int | None]]
+    allowances: List[List[int | None]] | None = None
+    _token_index: dict[int, int] = field(default_factory=dict, repr=False)
+    _account_index: dict[int, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._token_index = {token: j for j, token in enumerate(self.tokens)}
+        self._account_index = {account: i for i, account in enumerate(self.accounts)}
+
+    def get_decimals(self, token: AddressRepresentation) -> int | None:
+        return self.decimals[self._token_index[to_int(token)]]
+
+    def get_balance(
+        self,
+        account: AddressRepresentation,
+        token: AddressRepresentation
+    ) -> int | None:
+        return self.balances[
+            self._account_index[to_int(account)]
+        ][self._token_index[to_int(token)]]
+
+    def get_allowance(
+        self,
+        account: AddressRepresentation,
+        token: AddressRepresentation
+    ) -> int | None:
+        if self.allowances is None:
+            return None
+        return self.allowances[
+            self._account_index[to_int(account)]
+        ][self._token_index[to_int(token)]]
+
+
+class StarknetBatchReader:
+    """
+    Reads view functions of many contracts in JSON-RPC batches of `starknet_call`.
+
+    Calldata is built from precomputed selectors and results are decoded by plain
+    functions instead of ABI-driven serializers.
+
+    Example of use:
+    >>> reader = StarknetBatchReader(client.node_client)
+    >>> snapshot = await reader.read_tokens([client.account.address], [eth, usdc])
+    >>> snapshot.get_balance(client.account.address, usdc.address)
+    """
+    BATCH_SIZE = 50
+
+    def __init__(
+        self,
+        node_client: FullNodeClient,
+        batch_size: int = BATCH_SIZE
+    ):
+        """
+        Initialize the reader.
+
+        Args:
+            node_client (FullNodeClient): The node client.
+            batch_size (int): The max number of calls in one batch request.
+        """
+        self.node_client = node_client
+        self.batch_size = batch_size
+
+    async def call_many(self, calls: List[Call]) -> List[List[int] | None]:
+        """
+        Call the view functions in batches.
+
+        Args:
+            calls (List[Call]): The calls.
+
+        Returns:
+            List[List[int] | None]: The raw felts of every call or None if it failed.
+        """
+        responses = await batch_call(
+            client=self.node_client,
+            method_name='call',
+            params_list=[
+                {
+                    'request': {
+                        'contract_address': hex(call.to_addr),
+                        'entry_point_selector': hex(call.selector),
+                        'calldata': [hex(value) for value in call.calldata],
+                    },
+                    'block_id': 'latest',
+                }
+                for call in calls
+            ],
+            batch_size=self.batch_size
+        )
+
+        return [
+            [int(value, 16) for value in response['result']]
+            if 'result' in response
+            else None
+            for response in responses
+        ]
+
+    async def read_tokens(
+        self,
+        accounts: List[AddressRepresentation],
+        tokens: List[TokenContractType],
+        spender: AddressRepresentation | None = None
+    ) -> TokenSnapshot:
+        """
+        Read the balances, the decimals and optionally the allowances of the tokens
+        for the accounts in one round of batches.
+
+        Known decimals (native token, `TokenContract.decimals`) are not requested and
+        fetched decimals are stored in the token contracts.
+
+        Args:
+            accounts (List[AddressRepresentation]): The accounts.
+            tokens (List[TokenContractType]): The token contracts.
+            spender (AddressRepresentation | None): The spender of the allowances to read.
+
+        Returns:
+            TokenSnapshot: The snapshot.
+        """
+        account_ids = [to_int(account) for account in accounts]
+        token_ids = [to_int(token.address) for token in tokens]
+
+        calls: List[Call] = []
+        targets: List[tuple[str, int, int]] = []
+
+        def add(method_name: str, i: int, j: int, calldata: List[int]) -> None:
+            calls.append(Call(
+                to_addr=token_ids[j],
+                selector=VIEW_METHODS[method_name].selector,
+                calldata=calldata
+            ))
+            targets.append((method_name, i, j))
+
+        decimals: List[int | None] = []
+        for j, token in enumerate(tokens):
+            known = 18 if token.is_native_token else token.decimals
+            decimals.append(known)
+            if known is None:
+                add('decimals', -1, j, [])
+
+        for i, account in enumerate(account_ids):
+            for j in range(len(tokens)):
+                add('balanceOf', i, j, [account])
+                if spender is not None:
+                    add('allowance', i, j, [account, to_int(spender)])
+
+        balances = [[None] * len(tokens) for _ in account_ids]
+        allowances = (
+            [[None] * len(tokens) for _ in account_ids]
+            if spender is not None
+            else None
+        )
+
+        for (method_name, i, j), result in zip(targets, await self.call_many(calls)):
+            value = VIEW_METHODS[method_name].decode(result) if result else None
+
+            if method_name == 'decimals':
+                decimals[j] = value
+                if value is not None:
+                    tokens[j].decimals = value
+            elif method_name == 'balanceOf':
+                balances[i][j] = value
+            else:
+                allowances[i][j] = value
+
+        return TokenSnapshot(
+            accounts=account_ids,
+            tokens=token_ids,
+            decimals=decimals,
+            balances=balances,
+            allowances=allowances
+        )
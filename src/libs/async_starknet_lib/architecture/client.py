@@ -1,11 +1,20 @@
+import dataclasses
+
 from starknet_py.net.account.account import Account
+from starknet_py.net.client_models import Call
+from starknet_py.net.models.transaction import Invoke
 from starknet_py.net.models import StarknetChainId
 from starknet_py.net.signer.stark_curve_signer import (
     StarkCurveSigner,
     KeyPair
 )
 
+from src.helpers.signing import signing_service
+
+from .batch_reader import StarknetBatchReader
 from .contract import Contract
+from .execute_bundler import StarknetExecuteBundler
+from .fee_estimator import fee_estimator
 from .logger import CustomLogger
 from .starknet_utils import StarknetNodeClient
 
@@ -20,7 +29,8 @@ class StarknetClient(StarknetNodeClient):
         private_key: str,
         proxy: str | None = None,
         check_proxy: bool = False,
-        create_log_file_per_account: bool = True
+        create_log_file_per_account: bool = True,
+        bundle_window: float = 0
     ):
         self.address = address
         self.account_id = account_id
@@ -38,8 +48,50 @@ class StarknetClient(StarknetNodeClient):
         self._init_logger(create_log_file_per_account)
         
         self.contract = Contract(self.account)
+        self.reader = StarknetBatchReader(self.node_client)
+        # operations are bundled into one `execute` if the window is set, see `StarknetTask`
+        self.bundle_window = bundle_window
+        self.bundler: StarknetExecuteBundler | None = None
         self.network_decimals = 18
 
+    async def sign_invoke(
+        self,
+        calls: list[Call],
+        max_fee: int | None = None,
+        use_cached_fee: bool = True
+    ) -> Invoke:
+        """
+        Prepare the invoke transaction and sign it in the pool of `signing_service`.
+
+        The max fee is taken from `fee_estimator`, which reuses estimates of the same
+        calls across wallets and batches live estimates.
+
+        Args:
+            calls (list[Call]): The calls to execute.
+            max_fee (int | None): The max fee, estimated if None.
+            use_cached_fee (bool): Whether a cached estimate may be used instead of simulating.
+
+        Returns:
+            Invoke: The signed transaction.
+        """
+        transaction = await self.account._prepare_invoke(
+            calls=calls,
+            max_fee=max_fee or 0
+        )
+        if max_fee is None:
+            transaction = dataclasses.replace(
+                transaction,
+                max_fee=await fee_estimator.get_max_fee(
+                    self.account, calls, transaction, use_cache=use_cached_fee
+                )
+            )
+
+        signature = await signing_service.sign_stark_hash(
+            private_key=self.key_pair.private_key,
+            msg_hash=transaction.calculate_hash(self.CHAIN_ID)
+        )
+        return dataclasses.replace(transaction, signature=signature)
+
     async def __aexit__(self, exc_type, exc, tb):
         await super().__aexit__(exc_type, exc, tb)
 
@@ -1,5 +1,4 @@
 import json
-from typing import Any, cast
 
 from starknet_py.net.account.account import Account
 from starknet_py.contract import (
@@ -9,10 +8,10 @@ from starknet_py.contract import (
 
 from src.libs.async_eth_lib.models.type_alias import AbiType
 
+from .contract_cache import CallTemplate, contract_cache
 from ..data.config import DEFAULT_TOKEN_ABI_PATH
 from ..models.contract import NativeTokenContract, RawContract, TokenContract
 from ..models.type_alias import TokenContractType
-from ..utils.helpers import read_json
 
 
 class Contract:
@@ -60,28 +59,15 @@ class Contract:
             - `abi_or_path` (list[str]): ['src', 'libs', 'async_eth_lib', 'abis', 'erc20.json']
             - `abi_or_path` (str): '[{"type": "function", "name": "approve", "inputs": [{"type": "address"}, {"type": "uint256"}]}]'
             - `abi_or_path` (str): 'src/libs/async_eth_lib/abis/erc20.json'
+
+        Contracts are cached by (address, ABI hash) in `contract_cache` and bound to the account.
         """
-        if isinstance(abi_or_path, str):
-            if (json_abi := self.load_json_abi(abi_or_path)):
-                abi = json_abi
-            else:
-                abi = read_json(abi_or_path)
-        elif isinstance(abi_or_path, dict):
-            abi = abi_or_path
-        elif isinstance(abi_or_path, list):
-            if all(isinstance(item, dict) for item in abi_or_path):
-                abi = abi_or_path
-            elif all(isinstance(item, str) for item in abi_or_path):
-                abi = read_json(cast(list[str], abi_or_path))
-
-        contract = stark_Contract(
+        return contract_cache.get(
             address=address,
-            abi=abi, #type: ignore
-            provider=self.account
+            abi_or_path=abi_or_path,
+            account=self.account
         )
 
-        return contract
-
     def get_starknet_contract_from_raw(
         self,
         contract: RawContract
@@ -100,6 +86,38 @@ class Contract:
             contract.abi_or_path
         )
     
+    def get_call_template(
+        self,
+        contract: RawContract | TokenContractType,
+        function_name: str,
+        **fixed
+    ) -> CallTemplate:
+        """
+        Retrieves a prepared-call template of the contract function.
+
+        Args:
+            - `contract` (RawContract | TokenContract | NativeTokenContract): The contract,
+              native tokens use the default token ABI.
+            - `function_name` (str): The name of the function.
+            - `**fixed`: The arguments shared by all wallets, e.g. the spender or the pool id.
+
+        Returns:
+            - `CallTemplate`: The template, only the other arguments are passed to `build`.
+        """
+        abi_or_path = (
+            DEFAULT_TOKEN_ABI_PATH
+            if isinstance(contract, NativeTokenContract)
+            else contract.abi_or_path
+        )
+
+        return contract_cache.get_template(
+            contract.address,
+            abi_or_path,
+            function_name,
+            self.account,
+            **fixed
+        )
+
     def get_token_starknet_contract(
         self,
         contract: TokenContractType | AddressRepresentation,
@@ -0,0 +1,214 @@
+import copy
+import hashlib
+import json
+from typing import Any, cast
+
+from starknet_py.contract import Contract as stark_Contract, ContractFunction
+from starknet_py.net.account.account import Account
+from starknet_py.net.client_models import Call
+from starknet_py.net.models import AddressRepresentation
+
+from src.libs.async_eth_lib.models.type_alias import AbiType
+
+from ..utils.helpers import read_json
+
+
+def to_int(value: AddressRepresentation) -> int:
+    return value if isinstance(value, int) else int(value, 16)
+
+
+class CallTemplate:
+    """
+    Prepared call of one contract function with fixed arguments.
+
+    The ABI serializer and the selector are built once, only the arguments that
+    change per wallet (amounts, deadlines) are passed to `build`.
+
+    Example of use:
+    >>> template = contract_cache.get_template(token, abi_path, 'approve', account, spender=router)
+    >>> approve_call = template.build(amount=amount.Wei)
+    """
+
+    def __init__(
+        self,
+        function: ContractFunction,
+        fixed: dict[str, Any]
+    ):
+        self.function = function
+        self.fixed = fixed
+
+    def build(self, **arguments) -> Call:
+        prepared = self.function.prepare_call(**self.fixed, **arguments)
+        return Call(
+            to_addr=prepared.to_addr,
+            selector=prepared.selector,
+            calldata=prepared.calldata
+        )
+
+
+class StarknetContractCache:
+    """
+    Starknet contracts of the process cached by (address, ABI hash).
+
+    Building `starknet_py.Contract` parses the ABI and builds the serializers of all
+    functions, which is the same work for every wallet. The parsed contract is kept
+    once and handed out as a shallow copy bound to the account of the caller,
+    so the serializers are shared. ABI files are read once per path.
+
+    Example of use:
+    >>> contract = contract_cache.get(address, abi_or_path, account)
+    """
+
+    def __init__(self):
+        self._abis: dict[str, tuple[list[dict], str]] = {}
+        self._contracts: dict[tuple[int, str], stark_Contract] = {}
+        self._templates: dict[tuple, CallTemplate] = {}
+
+    @staticmethod
+    def get_abi_hash(abi: list[dict] | dict) -> str:
+        return hashlib.sha256(
+            json.dumps(abi, sort_keys=True).encode()
+        ).hexdigest()
+
+    def load_abi(self, abi_or_path: AbiType) -> tuple[list[dict], str]:
+        """
+        Parse the ABI or read it from the path.
+
+        Args:
+            - `abi_or_path` (str | list[str] | tuple[str] | list[dict[str, Any]]): The ABI or ABI path of the contract.
+
+        Returns:
+            - `tuple[list[dict], str]`: The ABI and its hash.
+        """
+        if isinstance(abi_or_path, (list, tuple)) and all(
+            isinstance(item, str) for item in abi_or_path
+        ):
+            path_key = '/'.join(abi_or_path)
+        elif isinstance(abi_or_path, str):
+            path_key = abi_or_path
+        else:
+            abi = cast(list[dict], abi_or_path)
+            return abi, self.get_abi_hash(abi)
+
+        if path_key not in self._abis:
+            abi = self._parse(abi_or_path)
+            self._abis[path_key] = (abi, self.get_abi_hash(abi))
+
+        return self._abis[path_key]
+
+    @staticmethod
+    def _parse(abi_or_path: AbiType) -> list[dict]:
+        if isinstance(abi_or_path, str):
+            try:
+                return json.loads(abi_or_path)
+            except ValueError:
+                return read_json(abi_or_path)  # type: ignore
+
+        return read_json(list(abi_or_path))  # type: ignore
+
+    def _get_parsed(
+        self,
+        address: AddressRepresentation,
+        abi_or_path: AbiType,
+        account: Account
+    ) -> stark_Contract:
+        abi, abi_hash = self.load_abi(abi_or_path)
+        key = (to_int(address), abi_hash)
+
+        contract = self._contracts.get(key)
+        if not contract:
+            contract = stark_Contract(
+                address=address,
+                abi=abi,  # type: ignore
+                provider=account
+            )
+            self._contracts[key] = contract
+
+        return contract
+
+    def get(
+        self,
+        address: AddressRepresentation,
+        abi_or_path: AbiType,
+        account: Account
+    ) -> stark_Contract:
+        """
+        Get the contract bound to the account.
+
+        Args:
+            - `address` (AddressRepresentation): The address of the contract.
+            - `abi_or_path` (str | list[str] | tuple[str] | list[dict[str, Any]]): The ABI or ABI path of the contract.
+            - `account` (Account): The account calling and invoking the contract.
+
+        Returns:
+            - `stark_Contract`: The contract instance.
+        """
+        contract = self._get_parsed(address, abi_or_path, account)
+        if contract.account is account:
+            return contract
+
+        return self._bind(contract, account)
+
+    @staticmethod
+    def _bind(contract: stark_Contract, account: Account) -> stark_Contract:
+        bound = copy.copy(contract)
+        bound.account = account
+        bound.client = account.client
+
+        functions = copy.copy(contract.functions)
+        for name, function in contract.functions.items():
+            bound_function = copy.copy(function)
+            bound_function.account = account
+            bound_function.client = account.client
+            functions[name] = bound_function
+        bound.functions = functions
+
+        return bound
+
+    def get_template(
+        self,
+        address: AddressRepresentation,
+        abi_or_path: AbiType,
+        function_name: str,
+        account: Account,
+        **fixed
+    ) -> CallTemplate:
+        """
+        Get the call template of the function with the fixed arguments.
+
+        Templates only build calls, so they are shared by all accounts.
+
+        Args:
+            - `address` (AddressRepresentation): The address of the contract.
+            - `abi_or_path` (str | list[str] | tuple[str] | list[dict[str, Any]]): The ABI or ABI path of the contract.
+            - `function_name` (str): The name of the function.
+            - `account` (Account): The account used if the contract is not cached yet.
+            - `**fixed`: The arguments shared by all calls of the template.
+
+        Returns:
+            - `CallTemplate`: The template.
+        """
+        contract = self._get_parsed(address, abi_or_path, account)
+        key = (
+            contract.address,
+            self.load_abi(abi_or_path)[1],
+            function_name,
+            repr(sorted(fixed.items()))
+        )
+
+        template = self._templates.get(key)
+        if not template:
+            template = CallTemplate(contract.functions[function_name], fixed)
+            self._templates[key] = template
+
+        return template
+
+    def get_metrics(self) -> dict[str, int]:
+        return {
+            'abis': len(self._abis),
+            'contracts': len(self._contracts),
+            'templates': len(self._templates),
+        }
+
+
+contract_cache = StarknetContractCache()
@@ -0,0 +1,165 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List
+
+from starknet_py.net.client_models import Call, TransactionReceipt
+
+from .logger import CustomLogger
+from ..models.exceptions import TransactionNotSent
+from ..models.others import LogStatus
+
+
+@dataclass
+class BundledOperation:
+    name: str
+    calls: List[Call]
+    future: asyncio.Future
+
+
+class StarknetExecuteBundler:
+    """
+    Bundles the operations of one wallet into one multicall transaction.
+
+    Operations submitted within `window` seconds of the first one (swaps, liquidity
+    actions, transfers planned concurrently for the wallet) are sent as one `execute`
+    with a single fee estimate and nonce. Every operation receives the receipt of the
+    shared transaction, so its task logs and records its own result as before.
+    Bundles are always simulated by a live fee estimate, never priced from the cache,
+    so a call that would revert fails the bundle before it is sent. Only if the bundle
+    fails before it reaches the node (`TransactionNotSent`), e.g. on such an estimate,
+    are its operations sent one by one. A bundle that may have been sent is never resent.
+
+    Example of use:
+    >>> bundler = StarknetExecuteBundler(send=task.send_calls, wait=task.wait_for_tx)
+    >>> await asyncio.gather(myswap.swap(swap_info), jediswap.swap(other_swap_info))
+    """
+    WINDOW = 2
+    MAX_CALLS = 20
+
+    def __init__(
+        self,
+        send: Callable[..., Awaitable[int]],
+        wait: Callable[[int], Awaitable[TransactionReceipt]],
+        window: float = WINDOW,
+        max_calls: int = MAX_CALLS,
+        custom_logger: CustomLogger | None = None
+    ):
+        """
+        Initialize the bundler.
+
+        Args:
+            send (Callable): Sends the calls in one transaction and returns its hash,
+                a cached fee estimate is allowed unless `use_cached_fee` is False.
+            wait (Callable): Waits for the receipt of the transaction hash.
+            window (float): Seconds the first operation of a bundle waits for others.
+            max_calls (int): The number of calls that sends the bundle immediately.
+            custom_logger (CustomLogger | None): The logger of the wallet.
+        """
+        self.send = send
+        self.wait = wait
+        self.window = window
+        self.max_calls = max_calls
+        self.custom_logger = custom_logger
+
+        self._pending: List[BundledOperation] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def execute(
+        self,
+        calls: List[Call],
+        name: str = 'operation'
+    ) -> TransactionReceipt:
+        """
+        Execute the calls of one operation in the next bundle.
+
+        Args:
+            calls (List[Call]): The calls of the operation.
+            name (str): The name of the operation for logs.
+
+        Returns:
+            TransactionReceipt: The receipt of the transaction containing the calls.
+        """
+        loop = asyncio.get_running_loop()
+        operation = BundledOperation(name, calls, loop.create_future())
+        self._pending.append(operation)
+
+        if sum(len(pending.calls) for pending in self._pending) >= self.max_calls:
+            asyncio.ensure_future(self._flush())
+        elif len(self._pending) == 1:
+            self._timer = loop.call_later(
+                self.window,
+                lambda: asyncio.ensure_future(self._flush())
+            )
+
+        return await operation.future
+
+    async def _flush(self) -> None:
+        operations, self._pending = self._pending, []
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if not operations:
+            return
+
+        try:
+            if len(operations) == 1:
+                tx_hash = await self.send(operations[0].calls)
+            else:
+                tx_hash = await self.send(
+                    [call for operation in operations for call in operation.calls],
+                    use_cached_fee=False
+                )
+        except Exception as error:
+            if len(operations) == 1 or not isinstance(error, TransactionNotSent):
+                for operation in operations:
+                    self._set_result(operation, error)
+            else:
+                self._log(
+                    LogStatus.WARNING,
+                    f'Failed to send a bundle of {len(operations)} operations: {error}. '
+                    f'Sending them one by one'
+                )
+                await asyncio.gather(
+                    *(self._execute_alone(operation) for operation in operations)
+                )
+            return
+
+        if len(operations) > 1:
+            self._log(
+                LogStatus.INFO,
+                f'Bundled {len(operations)} operations '
+                f'({", ".join(operation.name for operation in operations)}) '
+                f'in tx {hex(tx_hash)}'
+            )
+
+        try:
+            result = await self.wait(tx_hash)
+        except Exception as error:
+            result = error
+
+        for operation in operations:
+            self._set_result(operation, result)
+
+    async def _execute_alone(self, operation: BundledOperation) -> None:
+        try:
+            result = await self.wait(await self.send(operation.calls))
+        except Exception as error:
+            result = error
+
+        self._set_result(operation, result)
+
+    @staticmethod
+    def _set_result(
+        operation: BundledOperation,
+        result: TransactionReceipt | Exception
+    ) -> None:
+        if operation.future.done():
+            return
+        if isinstance(result, Exception):
+            operation.future.set_exception(result)
+        else:
+            operation.future.set_result(result)
+
+    def _log(self, status: str, message: str) -> None:
+        if self.custom_logger:
+            self.custom_logger.log_message(status, message)
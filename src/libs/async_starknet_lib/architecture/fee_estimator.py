@@ -0,0 +1,203 @@
+import asyncio
+import time
+from typing import Any, List
+
+from starknet_py.net.account.account import Account
+from starknet_py.net.client_models import Call, EstimatedFee
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.models.transaction import Invoke
+
+from .transport import starknet_transports
+
+
+class StarknetFeeEstimator:
+    """
+    Fee estimates of invoke transactions cached per call shape and block window.
+
+    Call shapes (the same approve + swap on the same router) repeat across thousands of
+    wallets, so an estimate is reused by all wallets with the same account class for the
+    current window of `block_window` blocks and then multiplied by `multiplier`. The
+    account class is part of the key, because `__validate__` and `__execute__` of Argent
+    and Braavos accounts cost differently. On a cache miss the query transaction is
+    estimated live: estimates of all wallets requested from the same node URL within
+    `max_delay` seconds are sent through the shared node client of `starknet_transports`
+    as one `starknet_estimateFee` request with many transactions. If the batch fails,
+    every transaction is estimated on its own.
+
+    Example of use:
+    >>> transaction = await account._prepare_invoke(calls=calls, max_fee=0)
+    >>> max_fee = await fee_estimator.get_max_fee(account, calls, transaction)
+    """
+    MULTIPLIER = 1.5
+    BLOCK_WINDOW = 10
+    BLOCK_NUMBER_TTL = 5
+    MAX_DELAY = 0.05
+    MAX_BATCH = 20
+
+    def __init__(
+        self,
+        multiplier: float = MULTIPLIER,
+        block_window: int = BLOCK_WINDOW,
+        block_number_ttl: float = BLOCK_NUMBER_TTL,
+        max_delay: float = MAX_DELAY,
+        max_batch: int = MAX_BATCH,
+    ):
+        """
+        Initialize the estimator.
+
+        Args:
+            multiplier (float): The safety multiplier of the estimated fee.
+            block_window (int): The number of blocks an estimate is valid for.
+            block_number_ttl (float): Seconds a fetched block number is reused for.
+            max_delay (float): Seconds the first estimate of a batch waits for others.
+            max_batch (int): The max number of transactions in one request.
+        """
+        self.multiplier = multiplier
+        self.block_window = block_window
+        self.block_number_ttl = block_number_ttl
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+
+        self.hits = 0
+        self.misses = 0
+
+        self._fees: dict[tuple, tuple[int, int]] = {}
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        self._block_number: tuple[float, int] | None = None
+        self._class_hashes: dict[int, int] = {}
+        self._queue: dict[str, list[tuple[Invoke, asyncio.Future]]] = {}
+
+    @staticmethod
+    def get_shape(calls: List[Call]) -> tuple:
+        """Get the key of the calls: contracts, entry points and calldata lengths."""
+        return tuple(
+            (call.to_addr, call.selector, len(call.calldata))
+            for call in calls
+        )
+
+    async def get_max_fee(
+        self,
+        account: Account,
+        calls: List[Call],
+        transaction: Invoke,
+        use_cache: bool = True
+    ) -> int:
+        """
+        Get the max fee of the transaction with the safety multiplier.
+
+        Args:
+            account (Account): The account sending the transaction.
+            calls (List[Call]): The calls of the transaction.
+            transaction (Invoke): The prepared, not signed transaction.
+            use_cache (bool): Whether a cached estimate may be used. Without it the
+                transaction is always simulated, so a reverting call fails the estimate.
+
+        Returns:
+            int: The max fee in wei.
+        """
+        window = await self._get_block_window(account.client)
+        key = (await self._get_class_hash(account), self.get_shape(calls))
+
+        cached = self._fees.get(key)
+        if use_cache and cached and cached[0] == window:
+            self.hits += 1
+            return int(cached[1] * self.multiplier)
+
+        self.misses += 1
+        in_flight = self._in_flight.get(key) if use_cache else None
+        if in_flight:
+            overall_fee = await asyncio.shield(in_flight)
+        else:
+            future = asyncio.get_running_loop().create_future()
+            if use_cache:
+                self._in_flight[key] = future
+            try:
+                query = await account.sign_for_fee_estimate(transaction)
+                estimate = await self._estimate(account.client.url, query)
+                overall_fee = estimate.overall_fee
+                future.set_result(overall_fee)
+            except BaseException as error:
+                future.set_exception(error)
+                # mark the exception as retrieved if nobody waits for it
+                future.exception()
+                raise
+            finally:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+
+            self._fees[key] = (window, overall_fee)
+
+        return int(overall_fee * self.multiplier)
+
+    async def _get_class_hash(self, account: Account) -> int:
+        class_hash = self._class_hashes.get(account.address)
+        if class_hash is None:
+            class_hash = await account.client.get_class_hash_at(account.address)
+            self._class_hashes[account.address] = class_hash
+
+        return class_hash
+
+    async def _get_block_window(self, node_client: FullNodeClient) -> int:
+        now = time.monotonic()
+        if (
+            not self._block_number
+            or now - self._block_number[0] > self.block_number_ttl
+        ):
+            self._block_number = (now, await node_client.get_block_number())
+
+        return self._block_number[1] // self.block_window
+
+    async def _estimate(
+        self,
+        node_url: str,
+        query: Invoke
+    ) -> EstimatedFee:
+        future = asyncio.get_running_loop().create_future()
+
+        queue = self._queue.setdefault(node_url, [])
+        queue.append((query, future))
+
+        if len(queue) == 1:
+            asyncio.get_running_loop().call_later(
+                self.max_delay,
+                lambda: asyncio.ensure_future(self._flush(node_url))
+            )
+        elif len(queue) >= self.max_batch:
+            asyncio.ensure_future(self._flush(node_url))
+
+        return await future
+
+    async def _flush(self, node_url: str) -> None:
+        batch = self._queue.pop(node_url, [])
+        if not batch:
+            return
+
+        node_client = starknet_transports.get_node_client(node_url)
+
+        try:
+            estimates = await node_client.estimate_fee([query for query, _ in batch])
+            results: List[Any] = list(estimates)
+        except Exception:
+            # one invalid transaction fails the whole batch, estimate them one by one
+            results = await asyncio.gather(
+                *(node_client.estimate_fee(query) for query, _ in batch),
+                return_exceptions=True
+            )
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def get_metrics(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'shapes': len(self._fees),
+        }
+
+
+fee_estimator = StarknetFeeEstimator()
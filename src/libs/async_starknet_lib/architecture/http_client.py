@@ -0,0 +1,121 @@
+from typing import List, Optional, Union
+
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.http_client import HttpMethod, RpcHttpClient
+
+from src._types.networks import NetworkNamesEnum
+from src.helpers.adaptive_concurrency import adaptive_concurrency, get_target
+from src.helpers.concurrency import rpc_limits
+from src.helpers.rate_limit import rate_limiter
+
+
+class LimitedRpcHttpClient(RpcHttpClient):
+    """RPC HTTP client waiting for the shared rate, adaptive and hard concurrency limits of its endpoint."""
+
+    async def call(
+        self,
+        method_name: str,
+        params: Optional[Union[dict, list]] = None
+    ):
+        await rate_limiter.acquire(self.url, method_name, params)
+
+        async with (
+            adaptive_concurrency.slot(get_target(self.url)),
+            rpc_limits.hold(NetworkNamesEnum.STARKNET, self.url)
+        ):
+            return await super().call(method_name=method_name, params=params)
+
+    async def batch_call(
+        self,
+        method_name: str,
+        params_list: List[Union[dict, list]]
+    ) -> List[dict]:
+        """
+        Send the calls of one method as a single JSON-RPC batch request.
+
+        Args:
+            method_name (str): The method without the `starknet_` prefix.
+            params_list (List[Union[dict, list]]): The params of every call.
+
+        Returns:
+            List[dict]: The responses with `result` or `error`, in the order of the params.
+        """
+        if not params_list:
+            return []
+
+        payload = [
+            {
+                'jsonrpc': '2.0',
+                'method': f'starknet_{method_name}',
+                'params': params,
+                'id': request_id,
+            }
+            for request_id, params in enumerate(params_list)
+        ]
+
+        await rate_limiter.acquire(
+            self.url, method_name, count=len(params_list)
+        )
+        async with (
+            adaptive_concurrency.slot(get_target(self.url)),
+            rpc_limits.hold(NetworkNamesEnum.STARKNET, self.url)
+        ):
+            responses = await self.request(
+                address=self.url,
+                http_method=HttpMethod.POST,
+                payload=payload
+            )
+
+        if isinstance(responses, dict):
+            # the node rejected the batch as a whole
+            return [responses] * len(params_list)
+
+        by_id = {response.get('id'): response for response in responses}
+        return [
+            by_id.get(request_id, {'error': {'message': 'No response'}})
+            for request_id in range(len(params_list))
+        ]
+
+
+def limit_node_client(client: FullNodeClient) -> FullNodeClient:
+    """Replace the HTTP client of the node client with the limited one, keeping its session."""
+    client._client = LimitedRpcHttpClient(
+        url=client.url,
+        session=client._client.session
+    )
+    return client
+
+
+async def batch_call(
+    client: FullNodeClient,
+    method_name: str,
+    params_list: List[Union[dict, list]],
+    batch_size: int = 50
+) -> List[dict]:
+    """
+    Send the calls of one method in JSON-RPC batches of `batch_size`.
+
+    Falls back to one request per call if the node client is not limited.
+
+    Returns:
+        List[dict]: The responses with `result` or `error`, in the order of the params.
+    """
+    http_client = client._client
+    responses = []
+
+    for start in range(0, len(params_list), batch_size):
+        chunk = params_list[start:start + batch_size]
+
+        if isinstance(http_client, LimitedRpcHttpClient):
+            responses.extend(await http_client.batch_call(method_name, chunk))
+            continue
+
+        for params in chunk:
+            try:
+                responses.append({
+                    'result': await http_client.call(method_name, params)
+                })
+            except Exception as error:
+                responses.append({'error': {'message': str(error)}})
+
+    return responses
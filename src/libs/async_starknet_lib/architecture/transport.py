@@ -0,0 +1,141 @@
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from aiohttp_proxy import ProxyConnector
+from starknet_py.net.full_node_client import FullNodeClient
+
+from .http_client import limit_node_client
+
+
+class StarknetTransports:
+    """
+    Registry of aiohttp sessions shared by all Starknet node clients of the process.
+
+    One session with its connector pool is kept per (node URL, proxy), so thousands of
+    `StarknetClient` instances reuse a few dozen keep-alive sockets and cached DNS
+    lookups instead of opening connections of their own. Sessions belong to the event
+    loop they are created in: close the registry at shutdown of the loop.
+
+    Example of use:
+    >>> session = starknet_transports.get_session(node_url, proxy)
+    >>> client = FullNodeClient(node_url=node_url, session=session)
+    >>> shared_client = starknet_transports.get_node_client(node_url)
+    >>> ...
+    >>> await starknet_transports.close()
+    """
+    LIMIT = 100
+    LIMIT_PER_HOST = 20
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 60
+    REQUEST_TIMEOUT = 60
+
+    def __init__(
+        self,
+        limit: int = LIMIT,
+        limit_per_host: int = LIMIT_PER_HOST,
+        dns_cache_ttl: int = DNS_CACHE_TTL,
+        keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+        request_timeout: float = REQUEST_TIMEOUT,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            limit (int): The max number of sockets of one pool.
+            limit_per_host (int): The max number of sockets of one pool to one host.
+            dns_cache_ttl (int): Seconds DNS lookups are cached for.
+            keepalive_timeout (float): Seconds an idle socket is kept open.
+            request_timeout (float): The total timeout of a request in seconds.
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.request_timeout = request_timeout
+
+        self._sessions: dict[tuple[str, str | None], ClientSession] = {}
+        self._node_clients: dict[str, FullNodeClient] = {}
+
+    def _create_connector(self, proxy: str | None) -> TCPConnector:
+        options = dict(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout,
+            enable_cleanup_closed=True,
+        )
+        if proxy:
+            return ProxyConnector.from_url(proxy, **options)
+        return TCPConnector(**options)
+
+    def get_session(
+        self,
+        node_url: str,
+        proxy: str | None = None
+    ) -> ClientSession:
+        """
+        Get the shared session of the node URL and the proxy, creating it if needed.
+
+        Args:
+            node_url (str): The URL of the node.
+            proxy (str | None): The proxy URL or None for direct connections.
+
+        Returns:
+            ClientSession: The session. Don't close it, the registry does.
+        """
+        key = (node_url, proxy or None)
+        session = self._sessions.get(key)
+
+        if not session or session.closed:
+            session = ClientSession(
+                connector=self._create_connector(proxy),
+                timeout=ClientTimeout(total=self.request_timeout)
+            )
+            self._sessions[key] = session
+
+        return session
+
+    def get_node_client(self, node_url: str) -> FullNodeClient:
+        """
+        Get the node client of the URL shared by the whole process.
+
+        It uses the direct session of the URL, so requests made for many wallets at
+        once, e.g. batched fee estimates and status polls, don't depend on the proxy
+        of any one wallet.
+
+        Args:
+            node_url (str): The URL of the node.
+
+        Returns:
+            FullNodeClient: The limited node client.
+        """
+        session = self.get_session(node_url)
+        client = self._node_clients.get(node_url)
+
+        if not client or client._client.session is not session:
+            client = limit_node_client(
+                FullNodeClient(node_url=node_url, session=session)
+            )
+            self._node_clients[node_url] = client
+
+        return client
+
+    def get_stats(self) -> dict[str, int]:
+        """Get the number of sessions and sockets in use for monitoring."""
+        return {
+            'sessions': len(self._sessions),
+            'acquired_sockets': sum(
+                len(getattr(session.connector, '_acquired', ()))
+                for session in self._sessions.values()
+                if session.connector
+            ),
+        }
+
+    async def close(self) -> None:
+        """Close all sessions and their connector pools."""
+        sessions, self._sessions = self._sessions, {}
+        self._node_clients = {}
+        for session in sessions.values():
+            if not session.closed:
+                await session.close()
+
+
+starknet_transports = StarknetTransports()
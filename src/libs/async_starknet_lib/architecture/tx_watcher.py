@@ -0,0 +1,204 @@
+import asyncio
+from typing import List
+
+from starknet_py.net.client_models import TransactionReceipt
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.transaction_errors import TransactionRejectedError
+
+from .http_client import batch_call
+from .logger import CustomLogger
+from .transport import starknet_transports
+from ..models.others import LogStatus
+
+PENDING_STATUSES = ('RECEIVED', 'NOT_RECEIVED')
+
+
+class StarknetTxWatcher:
+    """
+    Tracks all pending transactions sent through one node.
+
+    Statuses of all pending hashes are polled in one batch of `starknet_getTransactionStatus`
+    every `poll_interval` seconds, a few polls per Starknet block. Only transactions
+    accepted on L2 fetch their receipts, which resolve the awaiting futures.
+    Reverted transactions are resolved too, so callers check `execution_status`
+    of the receipt as before. Polls go through the shared direct node client of
+    `starknet_transports`, so they don't depend on the proxy of any one wallet, and
+    failed polls are logged.
+
+    Example of use:
+    >>> tx_receipt = await tx_watchers.wait_for_tx(node_client, tx_hash)
+    """
+    POLL_INTERVAL = 3
+    BATCH_SIZE = 50
+
+    def __init__(
+        self,
+        node_url: str,
+        poll_interval: float = POLL_INTERVAL,
+        batch_size: int = BATCH_SIZE,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            node_url (str): The URL of the node to poll.
+            poll_interval (float): Seconds between two polls.
+            batch_size (int): The max number of statuses in one batch request.
+        """
+        self.node_url = node_url
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+
+        self.failed_polls = 0
+        self.custom_logger = CustomLogger(account_id='tx_watcher', address=0)
+
+        self._pending: dict[int, asyncio.Future] = {}
+        self._waiters: dict[int, int] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def node_client(self) -> FullNodeClient:
+        return starknet_transports.get_node_client(self.node_url)
+
+    async def wait_for_tx(
+        self,
+        tx_hash: int,
+        timeout: float = 300
+    ) -> TransactionReceipt:
+        """
+        Wait until the transaction is accepted on L2 or reverted.
+
+        Args:
+            tx_hash (int): The hash of the transaction.
+            timeout (float): Seconds to wait for.
+
+        Returns:
+            TransactionReceipt: The receipt of the transaction.
+
+        Raises:
+            TransactionRejectedError: If the transaction was rejected.
+            asyncio.TimeoutError: If the transaction is still pending after the timeout.
+        """
+        future = self._pending.get(tx_hash)
+        if not future:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[tx_hash] = future
+
+        if not self._task or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        self._waiters[tx_hash] = self._waiters.get(tx_hash, 0) + 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        finally:
+            self._waiters[tx_hash] -= 1
+            if not self._waiters[tx_hash]:
+                del self._waiters[tx_hash]
+                self._pending.pop(tx_hash, None)
+
+    async def _run(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self._poll()
+            except Exception as error:
+                self.failed_polls += 1
+                if self.failed_polls == 1:
+                    self.custom_logger.log_message(
+                        status=LogStatus.WARNING,
+                        message=(
+                            f'Failed to poll {len(self._pending)} pending txs '
+                            f'through {self.node_url}: {error}'
+                        )
+                    )
+                continue
+
+            if self.failed_polls:
+                self.custom_logger.log_message(
+                    status=LogStatus.INFO,
+                    message=(
+                        f'Polling through {self.node_url} recovered '
+                        f'after {self.failed_polls} failed polls'
+                    )
+                )
+                self.failed_polls = 0
+
+    async def _poll(self) -> None:
+        tx_hashes = list(self._pending)
+        responses = await batch_call(
+            client=self.node_client,
+            method_name='getTransactionStatus',
+            params_list=[
+                {'transaction_hash': hex(tx_hash)}
+                for tx_hash in tx_hashes
+            ],
+            batch_size=self.batch_size
+        )
+
+        finished: List[int] = []
+        for tx_hash, response in zip(tx_hashes, responses):
+            status = response.get('result')
+            if not status:
+                continue
+
+            if status.get('finality_status') == 'REJECTED':
+                self._reject(tx_hash, status)
+            elif status.get('finality_status') not in PENDING_STATUSES:
+                finished.append(tx_hash)
+
+        receipts = await asyncio.gather(
+            *(
+                self.node_client.get_transaction_receipt(tx_hash)
+                for tx_hash in finished
+            ),
+            return_exceptions=True
+        )
+        for tx_hash, receipt in zip(finished, receipts):
+            if isinstance(receipt, BaseException):
+                continue
+
+            future = self._pending.pop(tx_hash, None)
+            if future and not future.done():
+                future.set_result(receipt)
+
+    def _reject(self, tx_hash: int, status: dict) -> None:
+        future = self._pending.pop(tx_hash, None)
+        if future and not future.done():
+            future.set_exception(TransactionRejectedError(
+                message=status.get('failure_reason') or f'Transaction {hex(tx_hash)} rejected'
+            ))
+            # retrieved here, the waiters may have timed out already
+            future.exception()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+
+class StarknetTxWatchers:
+    """Registry of transaction watchers, one per node URL."""
+
+    def __init__(self):
+        self._watchers: dict[str, StarknetTxWatcher] = {}
+
+    def get(self, node_client: FullNodeClient) -> StarknetTxWatcher:
+        if node_client.url not in self._watchers:
+            self._watchers[node_client.url] = StarknetTxWatcher(node_client.url)
+        return self._watchers[node_client.url]
+
+    async def wait_for_tx(
+        self,
+        node_client: FullNodeClient,
+        tx_hash: int,
+        timeout: float = 300
+    ) -> TransactionReceipt:
+        return await self.get(node_client).wait_for_tx(tx_hash, timeout)
+
+    def get_pending_counts(self) -> dict[str, int]:
+        return {
+            url: watcher.pending_count
+            for url, watcher in self._watchers.items()
+        }
+
+
+tx_watchers = StarknetTxWatchers()
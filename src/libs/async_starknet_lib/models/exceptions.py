@@ -17,6 +17,11 @@ class TransactionException(Exception):
     pass
 
 
+class TransactionNotSent(TransactionException):
+    """The transaction failed before it could reach the node, so sending it again is safe."""
+    pass
+
+
 class GasPriceTooHigh(Exception):
     pass
 
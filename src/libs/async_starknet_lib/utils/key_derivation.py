@@ -0,0 +1,209 @@
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List
+
+import bip32
+import bip39
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import Ethereum
+from starknet_py.constants import EC_ORDER
+from starknet_py.hash.address import compute_address
+from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.hash.utils import private_to_stark_key
+
+from ..architecture.logger import console_logger
+from ..data.config import get_base_path, get_class_hash
+from ..models.others import WalletType
+from .helpers import normalize_non_evm_hex_value
+
+SHA256_MASK = 2 ** 256
+GRIND_LIMIT = SHA256_MASK - SHA256_MASK % EC_ORDER
+GRIND_ATTEMPTS = 100001
+
+ARGENT_INITIALIZE = get_selector_from_name('initialize')
+BRAAVOS_INITIALIZER = get_selector_from_name('initializer')
+
+
+# region Math
+def mod(a: int, b: int) -> int:
+    result = a % b
+    return result if result >= 0 else b + result
+
+
+def ensure_bytes(seed: str | bytes) -> bytes | None:
+    if isinstance(seed, str) and seed.startswith('0x'):
+        return bytes.fromhex(seed[2:])
+    elif isinstance(seed, bytes):
+        return seed
+
+    return None
+
+
+def sha256_num(data: str | bytes) -> int:
+    if isinstance(data, str):
+        data = data.encode()
+    return int.from_bytes(hashlib.sha256(data).digest(), byteorder='big')
+
+
+def number_to_var_bytes_be(n: int) -> bytes:
+    return n.to_bytes(max(1, (n.bit_length() + 7) // 8), byteorder='big')
+
+
+def grind_key(seed: str | bytes) -> str | None:
+    """
+    Grind the Stark private key from the seed, as Argent X and Braavos do.
+
+    The hash state of the seed is computed once and copied for every attempt.
+
+    Args:
+        seed (str | bytes): The seed as bytes or a 0x-prefixed hex string.
+
+    Returns:
+        str | None: The private key in hex or None if the seed is invalid or no key was found.
+    """
+    if (bytes_seed := ensure_bytes(seed)) is None:
+        return None
+
+    seed_hash = hashlib.sha256(bytes_seed)
+    for i in range(GRIND_ATTEMPTS):
+        attempt_hash = seed_hash.copy()
+        attempt_hash.update(number_to_var_bytes_be(i))
+        key = int.from_bytes(attempt_hash.digest(), byteorder='big')
+
+        if key < GRIND_LIMIT:
+            return hex(key % EC_ORDER)
+
+    console_logger.error('grindKey is broken: tried 100k vals')
+    return None
+# endregion Math
+
+
+# region Derivation
+def derive_argent_private_key(mnemonic: str) -> str | None:
+    hdkey1 = HDWallet(cryptocurrency=Ethereum, mnemonic=mnemonic)
+    hdkey2 = HDWallet(cryptocurrency=Ethereum, seed=hdkey1.private_key())
+    child_node = hdkey2.from_derivation(get_base_path())
+
+    private_key = grind_key(child_node.private_key())
+    return normalize_non_evm_hex_value(private_key) if private_key else None
+
+
+def derive_braavos_private_key(mnemonic: str) -> str | None:
+    seed = bip39.phrase_to_seed(mnemonic)
+    hd_key = bip32.BIP32.from_seed(seed)
+    derived = hd_key.get_privkey_from_path(get_base_path())
+
+    private_key = grind_key('0x' + derived.hex())
+    return normalize_non_evm_hex_value(private_key) if private_key else None
+
+
+def compute_argent_addresses(public_key: int) -> dict[int, str]:
+    """Get the addresses of all Argent X versions by the Cairo version, newest first."""
+    addresses = {
+        cairo_version: compute_address(
+            class_hash=get_class_hash(class_name),
+            constructor_calldata=[public_key, 0],
+            salt=public_key
+        )
+        for cairo_version, class_name in (
+            (263, 'argentx_implementation_cairo_2_6_3'),
+            (243, 'argentx_implementation_cairo_2_4_3'),
+            (1, 'argentx_implementation_cairo_2_0_0'),
+        )
+    }
+    addresses[0] = compute_address(
+        class_hash=get_class_hash('argent_proxy'),
+        constructor_calldata=[
+            get_class_hash('argentx_implementation'),
+            ARGENT_INITIALIZE,
+            2,
+            public_key,
+            0
+        ],
+        salt=public_key
+    )
+
+    return {
+        cairo_version: normalize_non_evm_hex_value(hex(address))
+        for cairo_version, address in addresses.items()
+    }
+
+
+def compute_braavos_addresses(public_key: int) -> dict[int, str]:
+    """Get the addresses of all Braavos versions by the Cairo version, newest first."""
+    addresses = {
+        251: compute_address(
+            class_hash=get_class_hash('braavos_implementation_cairo_2_5_1'),
+            constructor_calldata=[public_key, 0],
+            salt=public_key
+        ),
+        0: compute_address(
+            class_hash=get_class_hash('braavos_proxy'),
+            constructor_calldata=[
+                get_class_hash('braavos_implementation'),
+                BRAAVOS_INITIALIZER,
+                1,
+                public_key
+            ],
+            salt=public_key
+        )
+    }
+
+    return {
+        cairo_version: normalize_non_evm_hex_value(hex(address))
+        for cairo_version, address in addresses.items()
+    }
+
+
+def derive_wallets(mnemonic: str) -> dict[str, dict]:
+    """
+    Derive the private keys and the candidate addresses of Argent X and Braavos wallets.
+
+    Args:
+        mnemonic (str): The mnemonic.
+
+    Returns:
+        dict[str, dict]: The `private_key` and `addresses` (by the Cairo version) by the
+            wallet type. Wallets whose key can't be derived are skipped.
+    """
+    wallets = {}
+
+    for wallet_type, derive_key, compute_addresses in (
+        (WalletType.ARGENT, derive_argent_private_key, compute_argent_addresses),
+        (WalletType.BRAAVOS, derive_braavos_private_key, compute_braavos_addresses),
+    ):
+        private_key = derive_key(mnemonic)
+        if not private_key:
+            continue
+
+        wallets[wallet_type] = {
+            'private_key': private_key,
+            'addresses': compute_addresses(private_to_stark_key(int(private_key, 16)))
+        }
+
+    return wallets
+
+
+def derive_wallets_bulk(
+    mnemonics: Iterable[str],
+    processes: int | None = None,
+    chunksize: int = 64
+) -> List[dict[str, dict]]:
+    """
+    Derive the wallets of many mnemonics across a process pool.
+
+    Args:
+        mnemonics (Iterable[str]): The mnemonics.
+        processes (int | None): The number of processes, the number of CPU cores if None.
+            1 derives in the current process.
+        chunksize (int): The number of mnemonics sent to a process at once.
+
+    Returns:
+        List[dict[str, dict]]: The result of `derive_wallets` for every mnemonic, in order.
+    """
+    if processes == 1:
+        return [derive_wallets(mnemonic) for mnemonic in mnemonics]
+
+    with ProcessPoolExecutor(processes) as pool:
+        return list(pool.map(derive_wallets, mnemonics, chunksize=chunksize))
+# endregion Derivation
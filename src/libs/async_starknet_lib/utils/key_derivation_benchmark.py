@@ -0,0 +1,58 @@
+"""
+Benchmark of the Starknet key derivation in mnemonics per second.
+
+Run from the root of the project:
+    python -m src.libs.async_starknet_lib.utils.key_derivation_benchmark --count 1000
+"""
+import argparse
+import os
+import time
+
+import bip39
+
+from .key_derivation import derive_wallets_bulk
+
+
+def generate_mnemonics(count: int) -> list[str]:
+    return [bip39.encode_bytes(os.urandom(16)) for _ in range(count)]
+
+
+def benchmark(
+    count: int = 1000,
+    processes: int | None = None
+) -> float:
+    """
+    Derive the wallets of random mnemonics and measure the throughput.
+
+    Args:
+        count (int): The number of mnemonics.
+        processes (int | None): The number of processes, the number of CPU cores if None.
+
+    Returns:
+        float: Mnemonics per second.
+    """
+    mnemonics = generate_mnemonics(count)
+
+    started_at = time.perf_counter()
+    derive_wallets_bulk(mnemonics, processes=processes)
+    return count / (time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument(
+        '--processes',
+        type=int,
+        nargs='*',
+        default=[1, os.cpu_count() or 1]
+    )
+    args = parser.parse_args()
+
+    for processes in args.processes:
+        rate = benchmark(args.count, processes)
+        print(f'processes: {processes:>3} | {rate:>10.1f} mnemonics/sec')
+
+
+if __name__ == '__main__':
+    main()
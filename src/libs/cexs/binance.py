@@ -1,5 +1,6 @@
 import hmac
-from typing import Any
+import time
+from typing import Any, AsyncIterable, Callable
 from urllib.parse import urlencode
 
 from src._types.networks import NetworkNamesEnum
@@ -9,7 +10,16 @@ from src.helpers.time_functions import get_unix_timestamp
 from .common import exceptions as exc
 from .common.logger import CustomLogger
 from .common.models import Cex, CexCredentials, LogStatus
-from .common.http import make_async_request
+from .common.http import CexHttpClient
+from .common.metadata import CexMetadataCache, is_stale_metadata_error
+from .common.deposit_watcher import DepositRecord, DepositWatcher, ExpectedDeposit
+from .common.retry import TRANSFER_RETRY_POLICY
+from .common.sub_accounts import (
+    SubAccountEngine,
+    SubAccountTransfer,
+    raise_first_error
+)
+from .common.weights import WeightBudget
 
 def get_binance_network_names():
     return {
@@ -39,16 +49,53 @@ class BinanceEndpoints:
     GET_USER_SUBACCOUNTS_V1 = '/sapi/v1/sub-account/list'
     GET_SUBACC_BALANCE_V3 = '/sapi/v3/sub-account/assets'
     # GET_DEPOSIT_HISTORY_V5 = '/api/v5/asset/deposit-history'
+    GET_DEPOSIT_HISTORY_V1 = '/sapi/v1/capital/deposit/hisrec'
+    GET_SUBACC_DEPOSIT_HISTORY_V1 = '/sapi/v1/capital/deposit/subHisrec'
     TRANSFER_V1 = "/sapi/v1/sub-account/universalTransfer"
     WITHDRAW_V1 = '/sapi/v1/capital/withdraw/apply'
 
 
+# request weights of the endpoints from the Binance API docs
+BINANCE_WEIGHTS = {
+    BinanceEndpoints.GET_CURRENCIES_V1: 10,
+    BinanceEndpoints.GET_ACC_BALANCE_V3: 5,
+    BinanceEndpoints.GET_USER_SUBACCOUNTS_V1: 1,
+    BinanceEndpoints.GET_SUBACC_BALANCE_V3: 60,
+    BinanceEndpoints.GET_DEPOSIT_HISTORY_V1: 1,
+    BinanceEndpoints.GET_SUBACC_DEPOSIT_HISTORY_V1: 1,
+    BinanceEndpoints.TRANSFER_V1: 360,
+    BinanceEndpoints.WITHDRAW_V1: 900,
+}
+
+
 class Binance(Cex, CustomLogger):
-    def __init__(self, credentials: CexCredentials):
+    def __init__(
+        self,
+        credentials: CexCredentials,
+        proxy: str | None = None,
+        deposit_stream: AsyncIterable[DepositRecord] | None = None
+    ):
         Cex.__init__(self, credentials)
         CustomLogger.__init__(self)
 
         self.domain_url = 'https://api.binance.com'
+        self.http = CexHttpClient(
+            self.domain_url,
+            proxy,
+            # all used endpoints are /sapi ones with their own IP weight limit
+            weight_budget=WeightBudget(
+                limit=12000,
+                window=60,
+                used_header='X-SAPI-USED-IP-WEIGHT-1M'
+            )
+        )
+        self.sub_accounts = SubAccountEngine()
+        # all currencies are fetched in one request and cached under one key
+        self.metadata = CexMetadataCache(fetch=lambda _: self._fetch_currencies())
+        self.deposits = DepositWatcher(
+            fetch=self._get_deposit_history,
+            push_source=deposit_stream
+        )
         self.headers = {
             "Content-Type": "application/json",
             "X-MBX-APIKEY": self.credentials.api_key,
@@ -115,30 +162,38 @@ class Binance(Cex, CustomLogger):
         ccy: TokenSymbol,
         amount: float,
         network_name: NetworkNamesEnum,
-        old_sub_balances: dict,
-        check_time: int = 45
+        tx_hash: str | None = None,
+        timeout: float = 3600
     ) -> bool:
         self.log_message(
             status=LogStatus.INFO,
-            message=f"Start checking CEX balances"
+            message=f"Start waiting for the deposit"
         )
 
-        while True:
-            new_sub_balances = await self._get_cex_balances(ccy)
-            for sub_name, sub_balance in new_sub_balances.items():
+        record = await self.deposits.wait(
+            ExpectedDeposit(
+                ccy=ccy,
+                amount=float(amount),
+                network=get_binance_network_names().get(network_name),
+                tx_hash=tx_hash
+            ),
+            timeout=timeout
+        )
+        if record:
+            self.log_message(
+                status=LogStatus.DEPOSITED,
+                message=f"{record.amount} {ccy} in {network_name}",
+            )
+            return True
 
-                if sub_balance > old_sub_balances[sub_name]:
-                    self.log_message(
-                        status=LogStatus.DEPOSITED,
-                        message=f"{amount} {ccy} in {network_name}",
-                    )
-                    return True
-                else:
-                    self.log_message(
-                        status=LogStatus.WARNING,
-                        message=f"Deposit still in progress..."
-                    )
-                    await self.sleep(check_time)
+        self.log_message(
+            status=LogStatus.ERROR,
+            message=(
+                f"Deposit of {amount} {ccy} in {network_name} "
+                f"was not found in {round(timeout)} sec"
+            )
+        )
+        return False
 
     async def withdraw(
         self,
@@ -199,6 +254,8 @@ class Binance(Cex, CustomLogger):
                     message=f"Withdraw to \'{network_name}\' is not active now. Will try again in 1 min...",
                 )
                 await self.sleep(60)
+                self.metadata.invalidate('all')
+                wd_raw_data = await self._get_currencies(ccy)
                 continue
 
             min_wd = float(network_data['min_wd'])
@@ -223,13 +280,17 @@ class Binance(Cex, CustomLogger):
                 "network": binance_network_name,
             }
 
-            url = self._get_full_url(BinanceEndpoints.WITHDRAW_V1, params)
-
-            response = await make_async_request(
-                method='POST',
-                url=url,
-                headers=self.headers
-            )
+            try:
+                response = await self.http.request(
+                    method='POST',
+                    url=BinanceEndpoints.WITHDRAW_V1,
+                    sign=self._get_signer(BinanceEndpoints.WITHDRAW_V1, params),
+                    weight=BINANCE_WEIGHTS[BinanceEndpoints.WITHDRAW_V1]
+                )
+            except exc.HTTPException as error:
+                if is_stale_metadata_error(error):
+                    self.metadata.invalidate('all')
+                raise
             # error_section = response['msg']
 
             # if any(error in error_section for error in OkxErrors):
@@ -281,40 +342,50 @@ class Binance(Cex, CustomLogger):
 
         return url
 
-    async def _get_currencies(
-        self, 
-        ccy: TokenSymbol = TokenSymbol.ETH
-    ) -> dict[str, Any]:
+    def _get_signer(
+        self,
+        endpoint: str,
+        params: dict | None = None
+    ) -> Callable[[], tuple[str, dict]]:
+        # the timestamp is signed only once the request may be sent, so waits for
+        # the weight budget don't push it out of the recvWindow
+        return lambda: (self._get_full_url(endpoint, params), self.headers)
+
+    async def _fetch_currencies(self) -> list[dict[str, Any]]:
         endpoint = BinanceEndpoints.GET_CURRENCIES_V1
-        url = self._get_full_url(endpoint)
 
-        response = await make_async_request(
-            url=url,
-            headers=self.headers
+        return await self.http.request(
+            url=endpoint,
+            sign=self._get_signer(endpoint),
+            weight=BINANCE_WEIGHTS[endpoint]
         )
 
-        for item in response:
+    async def _get_currencies(
+        self, 
+        ccy: TokenSymbol = TokenSymbol.ETH
+    ) -> dict[str, Any]:
+        for item in await self.metadata.get('all'):
             if item['coin'] == ccy:
                 return item
         return {}
 
     async def _get_sub_list(self) -> dict:
         endpoint = BinanceEndpoints.GET_USER_SUBACCOUNTS_V1
-        url = self._get_full_url(endpoint)
 
-        return await make_async_request(
-            url=url,
-            headers=self.headers
+        return await self.http.request(
+            url=endpoint,
+            sign=self._get_signer(endpoint),
+            weight=BINANCE_WEIGHTS[endpoint]
         )
 
     async def _get_main_acc_balances(self) -> dict:
         endpoint = BinanceEndpoints.GET_ACC_BALANCE_V3
-        url = self._get_full_url(endpoint)
 
-        return await make_async_request(
+        return await self.http.request(
             method='POST',
-            url=url,
-            headers=self.headers
+            url=endpoint,
+            sign=self._get_signer(endpoint),
+            weight=BINANCE_WEIGHTS[endpoint]
         )
 
     async def _get_main_acc_balance(self, ccy: TokenSymbol) -> float:
@@ -336,12 +407,37 @@ class Binance(Cex, CustomLogger):
         params = {
             "email": sub_email
         }
-        url = self._get_full_url(endpoint, params)
+        return await self.http.request(
+            url=endpoint,
+            sign=self._get_signer(endpoint, params),
+            weight=BINANCE_WEIGHTS[endpoint]
+        )
+
+    async def _get_sub_acc_ccy_balance(
+        self,
+        sub_email: str,
+        ccy: TokenSymbol
+    ) -> float:
+        sub_balances = await self._get_sub_acc_balance(sub_email)
+        ccy_sub_balance = [
+            balance for balance in sub_balances['balances']
+            if balance['asset'] == ccy.upper()
+        ]
+
+        return float(ccy_sub_balance[0]['free']) if ccy_sub_balance else 0.0
+
+    async def _get_sub_acc_ccy_balances(
+        self,
+        ccy: TokenSymbol
+    ) -> tuple[list[str], list[float | Exception]]:
+        sub_list = await self._get_sub_list()
+        sub_emails = [sub_data['email'] for sub_data in sub_list['subAccounts']]
 
-        return await make_async_request(
-            url=url,
-            headers=self.headers
+        sub_balances = await self.sub_accounts.map(
+            lambda sub_email: self._get_sub_acc_ccy_balance(sub_email, ccy),
+            sub_emails
         )
+        return sub_emails, sub_balances
 
     async def _get_cex_balances(
         self,
@@ -353,22 +449,58 @@ class Binance(Cex, CustomLogger):
         except Exception as e:
             balances['Main CEX Account'] = 0
 
-        sub_list = await self._get_sub_list()
-        for sub_data in sub_list['subAccounts']:
-            sub_name = sub_data['email']
-            sub_balances = await self._get_sub_acc_balance(sub_name)
-            ccy_sub_balance = [
-                balance for balance in sub_balances['balances']
-                if balance['asset'] == ccy.upper()
-            ]
-
-            if ccy_sub_balance:
-                balances[sub_name] = float(ccy_sub_balance[0]['free'])
-            else:
-                balances[sub_name] = 0
+        sub_emails, sub_balances = await self._get_sub_acc_ccy_balances(ccy)
+        raise_first_error(sub_balances)
+        balances.update(zip(sub_emails, sub_balances))
 
         return balances
 
+    async def _get_deposit_history_page(
+        self,
+        ccy: str,
+        sub_email: str | None = None
+    ) -> list[dict]:
+        params = {
+            "coin": ccy,
+            "startTime": int((time.time() - DepositWatcher.HISTORY_WINDOW) * 1000)
+        }
+        if sub_email:
+            endpoint = BinanceEndpoints.GET_SUBACC_DEPOSIT_HISTORY_V1
+            params["email"] = sub_email
+        else:
+            endpoint = BinanceEndpoints.GET_DEPOSIT_HISTORY_V1
+
+        return await self.http.request(
+            url=endpoint,
+            sign=self._get_signer(endpoint, params),
+            weight=BINANCE_WEIGHTS[endpoint]
+        )
+
+    async def _get_deposit_history(self, ccys: list[str]) -> list[DepositRecord]:
+        sub_list = await self._get_sub_list()
+        accounts = [None] + [sub_data['email'] for sub_data in sub_list['subAccounts']]
+
+        pages = await self.sub_accounts.map(
+            lambda target: self._get_deposit_history_page(*target),
+            [(ccy, sub_email) for ccy in ccys for sub_email in accounts]
+        )
+
+        return [
+            DepositRecord(
+                deposit_id=str(item.get('id') or item['txId']),
+                ccy=item['coin'],
+                amount=float(item['amount']),
+                network=item.get('network'),
+                tx_hash=item.get('txId'),
+                timestamp=item['insertTime'] / 1000
+            )
+            for page in pages
+            if not isinstance(page, Exception)
+            for item in page
+            # 1 - success, 6 - credited but cannot withdraw
+            if item['status'] in (1, 6)
+        ]
+
     async def _transfer_from_subaccounts(
         self,
         ccy: TokenSymbol,
@@ -381,91 +513,76 @@ class Binance(Cex, CustomLogger):
                 message=f'Checking subaccounts balance'
             )
 
-        is_empty = True
-        sub_list = await self._get_sub_list()
-        await self.sleep()
-
-        for sub_data in sub_list['subAccounts']:
-            sub_email = sub_data['email']
-
-            sub_balances = await self._get_sub_acc_balance(sub_email)
-            asset_balances = [
-                balance for balance in sub_balances['balances']
-                if balance['asset'] == ccy.upper()
-            ]
-            sub_balance = (
-                0.0
-                if len(asset_balances) == 0
-                else float(asset_balances[0]['free'])
-            )
-
-            amount = amount if amount else sub_balance
+        transfers = []
+        for sub_email, sub_balance in zip(*await self._get_sub_acc_ccy_balances(ccy)):
+            if isinstance(sub_balance, Exception):
+                self.log_message(
+                    status=LogStatus.ERROR,
+                    message=f'{sub_email} | {sub_balance}'
+                )
+                continue
 
             if sub_balance == 0.0:  # or sub_balance != amount
                 continue
 
-            is_empty = False
             self.log_message(
                 status=LogStatus.FOUND,
                 message=f'{sub_email} | subAccount balance: {sub_balance} {ccy}'
             )
+            transfers.append(SubAccountTransfer(
+                exchange='Binance',
+                sub_name=sub_email,
+                ccy=ccy,
+                amount=amount or sub_balance
+            ))
+            if not silent_mode:
+                break
 
+        if not transfers:
+            if not silent_mode:
+                self.log_message(
+                    status=LogStatus.WARNING,
+                    message=f'subAccounts balance: 0 {ccy}'
+                )
+            return True
+
+        async def send(transfer: SubAccountTransfer) -> None:
             body = {
-                "amount": amount,
+                "amount": transfer.amount,
                 "asset": ccy,
                 "fromAccountType": "SPOT",
                 "toAccountType": "SPOT",
-                "fromEmail": sub_email
+                "fromEmail": transfer.sub_name
             }
 
-            endpoint = BinanceEndpoints.TRANSFER_V1
-
-            while True:
-                try:
-                    url = self._get_full_url(endpoint, body)
-
-                    await make_async_request(
-                        method='POST',
-                        url=url,
-                        headers=self.headers
+            await TRANSFER_RETRY_POLICY.run(
+                lambda: self.http.request(
+                    method='POST',
+                    url=BinanceEndpoints.TRANSFER_V1,
+                    sign=self._get_signer(BinanceEndpoints.TRANSFER_V1, body),
+                    weight=BINANCE_WEIGHTS[BinanceEndpoints.TRANSFER_V1]
+                ),
+                on_retry=lambda attempt, error, delay: self.log_message(
+                    status=LogStatus.WARNING,
+                    message=(
+                        f'Deposit not reached the required block confirmations. '
+                        f'Will try again in {round(delay)} sec.'
                     )
-
-                    break
-                except Exception as error:
-                    str_err = str(error)
-
-                    if (
-                        'not reached the required block confirmations' in str_err
-                        or '-9000' in str_err
-                    ):
-                        self.log_message(
-                            status=LogStatus.WARNING,
-                            message=(
-                                f'Deposit not reached the required block confirmations. '
-                                f'Will try again in 1 min.'
-                            )
-                        )
-                        await self.sleep(60)
-                    elif '-8012 Msg' in str(error):
-                        return True
-                    else:
-                        self.log_message(
-                            status=LogStatus.ERROR,
-                            message=str_err
-                        )
-                        return False
-
-            self.log_message(
-                status=LogStatus.SENT,
-                message=f"Transfer {amount} {ccy} to main account completed"
+                )
             )
-            if not silent_mode:
-                break
 
-        if is_empty and not silent_mode:
-            self.log_message(
-                status=LogStatus.WARNING,
-                message=f'subAccounts balance: 0 {ccy}'
-            )
+        is_successfull = True
+        for transfer in await self.sub_accounts.sweep(transfers, send):
+            if transfer.status == 'SENT':
+                self.log_message(
+                    status=LogStatus.SENT,
+                    message=f"Transfer {transfer.amount} {ccy} to main account completed"
+                )
+            elif '-8012 Msg' not in transfer.error:
+                self.log_message(
+                    status=LogStatus.ERROR,
+                    message=transfer.error
+                )
+                is_successfull = False
 
-        return True
+        return is_successfull
@@ -1,6 +1,7 @@
 import hmac
 from enum import Enum
-from typing import Any
+import time
+from typing import Any, AsyncIterable, Callable
 from urllib.parse import urlencode
 
 from src._types.networks import NetworkNamesEnum
@@ -9,7 +10,21 @@ from src.helpers.time_functions import get_unix_timestamp
 from .common import exceptions as exc
 from .common.logger import CustomLogger
 from .common.models import Cex, CexCredentials, LogStatus
-from .common.http import make_async_request
+from .common.http import CexHttpClient
+from .common.metadata import CexMetadataCache, is_stale_metadata_error
+from .common.deposit_watcher import (
+    DepositRecord,
+    DepositWatcher,
+    ExpectedDeposit,
+    SubBalanceDeposits
+)
+from .common.retry import TIMESTAMP_RETRY_POLICY
+from .common.sub_accounts import (
+    SubAccountEngine,
+    SubAccountTransfer,
+    raise_first_error
+)
+from .common.weights import WeightBudget
 
 
 def get_bingx_network_names():
@@ -52,6 +67,7 @@ def get_bing_x_endpoints():
         'AccBal_V1': '/openApi/spot/v1/account/balance',
         'SAccLst_V1': '/openApi/subAccount/v1/list',
         'SAccBal_V1': '/openApi/subAccount/v1/assets',
+        'DepHist_V3': '/openApi/api/v3/capital/deposit/hisrec',
         'T_V1': '/openApi/wallets/v1/capital/subAccountInnerTransfer/apply',
         'Wd_V1': '/openApi/wallets/v1/capital/withdraw/apply',
     }
@@ -66,11 +82,34 @@ class BingXErrors(str, Enum):
 
 
 class BingX(Cex, CustomLogger):
-    def __init__(self, credentials: CexCredentials):
+    def __init__(
+        self,
+        credentials: CexCredentials,
+        proxy: str | None = None,
+        deposit_stream: AsyncIterable[DepositRecord] | None = None
+    ):
         Cex.__init__(self, credentials)
         CustomLogger.__init__(self)
 
         self.domain_url = "https://open-api.bingx.com"
+        self.http = CexHttpClient(
+            self.domain_url,
+            proxy,
+            weight_budget=WeightBudget(
+                limit=10,
+                window=1,
+                remaining_header='X-RateLimit-Requests-Remain'
+            )
+        )
+        self.sub_accounts = SubAccountEngine()
+        # all currencies are fetched in one request and cached under one key
+        self.metadata = CexMetadataCache(fetch=lambda _: self._fetch_currencies())
+        self.deposits = DepositWatcher(
+            fetch=self._get_deposit_history,
+            push_source=deposit_stream
+        )
+        # the deposit history lists the deposits of the master account only
+        self.sub_deposits = SubBalanceDeposits(fetch=self._get_sub_balance_map)
         self.endpoints = get_bing_x_endpoints()
         self.headers = {
             "Content-Type": "application/json",
@@ -137,30 +176,39 @@ class BingX(Cex, CustomLogger):
         ccy: str,
         amount: float,
         network_name: str,
-        old_sub_balances: dict,
-        check_time: int = 45
+        tx_hash: str | None = None,
+        timeout: float = 3600
     ) -> bool:
         self.log_message(
             status=LogStatus.INFO,
-            message=f"Start checking CEX balances"
+            message=f"Start waiting for the deposit"
         )
 
-        while True:
-            new_sub_balances = await self._get_cex_balances(ccy)
-            for sub_name, sub_balance in new_sub_balances.items():
-
-                if sub_balance > old_sub_balances[sub_name]:
-                    self.log_message(
-                        status=LogStatus.DEPOSITED,
-                        message=f"{amount} {ccy} in {network_name}",
-                    )
-                    return True
-                else:
-                    self.log_message(
-                        status=LogStatus.WARNING,
-                        message=f"Deposit still in progress..."
-                    )
-                    await self.sleep(check_time)
+        await self.sub_deposits.prime(ccy)
+        record = await self.deposits.wait(
+            ExpectedDeposit(
+                ccy=ccy,
+                amount=float(amount),
+                network=get_bingx_network_names().get(network_name),
+                tx_hash=tx_hash
+            ),
+            timeout=timeout
+        )
+        if record:
+            self.log_message(
+                status=LogStatus.DEPOSITED,
+                message=f"{record.amount} {ccy} in {network_name}",
+            )
+            return True
+
+        self.log_message(
+            status=LogStatus.ERROR,
+            message=(
+                f"Deposit of {amount} {ccy} in {network_name} "
+                f"was not found in {round(timeout)} sec"
+            )
+        )
+        return False
 
     async def withdraw(
         self,
@@ -222,6 +270,8 @@ class BingX(Cex, CustomLogger):
                     message=f"Withdraw to \'{network_name}\' is not active now. Will try again in 1 min...",
                 )
                 await self.sleep(60)
+                self.metadata.invalidate('all')
+                wd_raw_data = await self._get_currencies(ccy)
                 continue
 
             min_wd = float(network_data['min_wd'])
@@ -247,14 +297,14 @@ class BingX(Cex, CustomLogger):
                 "walletType": "1",
             }
 
-            url = self._get_full_url(url, params)
-
-            response = await make_async_request(
+            response = await self.http.request(
                 method='POST',
                 url=url,
-                headers=self.headers
+                sign=self._get_signer(url, params)
             )
             error_section = response['msg']
+            if is_stale_metadata_error(error_section):
+                self.metadata.invalidate('all')
 
             if any(error in error_section for error in BingXErrors):
                 is_successfull = False
@@ -304,16 +354,26 @@ class BingX(Cex, CustomLogger):
 
         return url
 
-    async def _get_currencies(self, ccy: str = 'ETH') -> dict[str, Any]:
+    def _get_signer(
+        self,
+        endpoint: str,
+        params: dict | None = None
+    ) -> Callable[[], tuple[str, dict]]:
+        # the timestamp is signed only once the request may be sent, so waits for
+        # the weight budget don't push it out of the recvWindow
+        return lambda: (self._get_full_url(endpoint, params), self.headers)
+
+    async def _fetch_currencies(self) -> list[dict[str, Any]]:
         endpoint = self.endpoints['AssCur_V1']
-        url = self._get_full_url(endpoint)
 
-        response = await make_async_request(
-            url=url,
-            headers=self.headers
+        response = await self.http.request(
+            url=endpoint,
+            sign=self._get_signer(endpoint)
         )
-        
-        for item in response['data']:
+        return response['data']
+
+    async def _get_currencies(self, ccy: str = 'ETH') -> dict[str, Any]:
+        for item in await self.metadata.get('all'):
             if item['coin'] == ccy:
                 return item
         return {}
@@ -325,21 +385,18 @@ class BingX(Cex, CustomLogger):
             "limit": 100,
         }
 
-        url = self._get_full_url(endpoint, params)
-
-        return await make_async_request(
-            url=url,
-            headers=self.headers
+        return await self.http.request(
+            url=endpoint,
+            sign=self._get_signer(endpoint, params)
         )
 
     async def _get_main_acc_balances(self) -> dict:
         endpoint = self.endpoints['AccBal_V1']
-        url = self._get_full_url(endpoint)
 
-        return await make_async_request(
+        return await self.http.request(
             method='POST',
-            url=url,
-            headers=self.headers
+            url=endpoint,
+            sign=self._get_signer(endpoint)
         )
 
     async def _get_main_acc_balance(self, ccy: str) -> float:
@@ -360,11 +417,9 @@ class BingX(Cex, CustomLogger):
         params = {
             "subUid": sub_uid
         }
-        url = self._get_full_url(endpoint, params)
-
-        return await make_async_request(
-            url=url,
-            headers=self.headers
+        return await self.http.request(
+            url=endpoint,
+            sign=self._get_signer(endpoint, params)
         )
 
     async def _get_sub_acc_balance(self, sub_uid: str, ccy: str) -> float:
@@ -382,40 +437,94 @@ class BingX(Cex, CustomLogger):
             return float(ccy_balance[0]['free'])
         raise exc.ApiException(f'Your have not enough {ccy} balance on BingX')
 
+    async def _get_sub_acc_ccy_balances(
+        self,
+        ccy: str
+    ) -> tuple[list[tuple[str, str]], list[float | Exception]]:
+        sub_list = await self._get_sub_list()
+        if not sub_list:
+            return [], []
+
+        subs = [
+            (sub_data['subAccountString'], sub_data['subUid'])
+            for sub_data in sub_list['data']['result']
+        ]
+        sub_balances = await self.sub_accounts.map(
+            lambda sub: self._get_sub_acc_balance(sub[1], ccy),
+            subs
+        )
+        return subs, sub_balances
+
     async def _get_cex_balances(
         self,
         ccy: str = 'ETH',
     ) -> dict:
-        while True:
+        async def get_balances() -> dict:
+            balances = {}
+
             try:
-                balances = {}
+                balances['Main CEX Account'] = await self._get_main_acc_balance(ccy)
+            except Exception as e:
+                balances['Main CEX Account'] = 0
+
+            subs, sub_balances = await self._get_sub_acc_ccy_balances(ccy)
+            raise_first_error(sub_balances)
+            balances.update(
+                (sub_name, sub_balance)
+                for (sub_name, _), sub_balance in zip(subs, sub_balances)
+            )
 
-                try:
-                    balances['Main CEX Account'] = await self._get_main_acc_balance(ccy)
-                except Exception as e:
-                    balances['Main CEX Account'] = 0
+            return balances
 
-                sub_list = await self._get_sub_list()
+        return await TIMESTAMP_RETRY_POLICY.run(
+            get_balances,
+            on_retry=lambda attempt, error, delay: self.log_message(
+                status=LogStatus.WARNING,
+                message=(
+                    f"Bad timestamp for request. "
+                    f"Will try again in {round(delay)} sec..."
+                ),
+            )
+        )
 
-                if not sub_list:
-                    return balances
+    async def _get_deposit_history(self, ccys: list[str]) -> list[DepositRecord]:
+        records = []
 
-                for sub_data in sub_list['data']['result']:
-                    sub_name = sub_data['subAccountString']
-                    sub_uid = sub_data['subUid']
+        for ccy in ccys:
+            params = {
+                "coin": ccy,
+                "startTime": int((time.time() - DepositWatcher.HISTORY_WINDOW) * 1000)
+            }
+            response = await self.http.request(
+                url=self.endpoints['DepHist_V3'],
+                sign=self._get_signer(self.endpoints['DepHist_V3'], params)
+            )
+            items = response['data'] if isinstance(response, dict) else response
+
+            records.extend(
+                DepositRecord(
+                    deposit_id=str(item.get('id') or item['txId']),
+                    ccy=item['coin'],
+                    amount=float(item['amount']),
+                    network=item.get('network'),
+                    tx_hash=item.get('txId'),
+                    timestamp=item['insertTime'] / 1000
+                )
+                for item in items
+                # 1 - completed
+                if item['status'] == 1
+            )
 
-                    balances[sub_name] = await self._get_sub_acc_balance(sub_uid, ccy)
+        records.extend(await self.sub_deposits.collect(ccys))
+        return records
 
-                return balances
-            except Exception as error:
-                if '-1021 Msg: Timestamp for' in str(error):
-                    self.log_message(
-                        status=LogStatus.WARNING,
-                        message=f"Bad timestamp for request. Will try again in 10 second...",
-                    )
-                    await self.sleep(10)
-                else:
-                    raise error
+    async def _get_sub_balance_map(self, ccy: str) -> dict[str, float]:
+        subs, sub_balances = await self._get_sub_acc_ccy_balances(ccy)
+        return {
+            sub_name: sub_balance
+            for (sub_name, _), sub_balance in zip(subs, sub_balances)
+            if not isinstance(sub_balance, Exception)
+        }
 
     async def _transfer_from_subaccounts(
         self,
@@ -429,67 +538,70 @@ class BingX(Cex, CustomLogger):
                 message=f'Checking subaccounts balance'
             )
 
-        is_empty = True
-        sub_list = await self._get_sub_list()
-        await self.sleep()
-
-        for sub_data in sub_list['data']['result']:
-            sub_name = sub_data['subAccountString']
-            sub_uid = sub_data['subUid']
-
-            sub_balance = await self._get_sub_acc_balance(sub_uid, ccy)
-            amount = amount if amount else sub_balance
+        transfers = []
+        sub_uids = {}
+        for (sub_name, sub_uid), sub_balance in zip(
+            *await self._get_sub_acc_ccy_balances(ccy)
+        ):
+            if isinstance(sub_balance, Exception):
+                self.log_message(
+                    status=LogStatus.ERROR,
+                    message=f'{sub_name} | {sub_balance}'
+                )
+                continue
 
             if sub_balance == 0.0:  # or sub_balance != amount
                 continue
 
-            is_empty = False
             self.log_message(
                 status=LogStatus.FOUND,
                 message=f'{sub_name} | subAccount balance: {sub_balance} {ccy}'
             )
+            sub_uids[sub_name] = sub_uid
+            transfers.append(SubAccountTransfer(
+                exchange='BingX',
+                sub_name=sub_name,
+                ccy=ccy,
+                amount=amount or sub_balance
+            ))
+            if not silent_mode:
+                break
 
+        if not transfers:
+            if not silent_mode:
+                self.log_message(
+                    status=LogStatus.WARNING,
+                    message=f'subAccounts balance: 0 {ccy}'
+                )
+            return True
+
+        async def send(transfer: SubAccountTransfer) -> None:
             body = {
-                "amount": amount,
+                "amount": transfer.amount,
                 "coin": ccy,
-                "userAccount": sub_uid,
+                "userAccount": sub_uids[transfer.sub_name],
                 "userAccountType": 1,
                 "walletType": 1
             }
 
-            endpoint = self.endpoints['T_V1']
-
-            while True:
-                try:
-                    url = self._get_full_url(endpoint, body)
-
-                    await make_async_request(
-                        method='POST',
-                        url=url,
-                        headers=self.headers
-                    )
-
-                    break
-                except Exception as error:
-                    str_err = str(error)
-
-                    self.log_message(
-                        status=LogStatus.ERROR,
-                        message=str_err
-                    )
-                    return False
-
-            self.log_message(
-                status=LogStatus.SENT,
-                message=f"Transfer {amount} {ccy} to main account completed"
+            await self.http.request(
+                method='POST',
+                url=self.endpoints['T_V1'],
+                sign=self._get_signer(self.endpoints['T_V1'], body)
             )
-            if not silent_mode:
-                break
 
-        if is_empty and not silent_mode:
-            self.log_message(
-                status=LogStatus.WARNING,
-                message=f'subAccounts balance: 0 {ccy}'
-            )
+        is_successfull = True
+        for transfer in await self.sub_accounts.sweep(transfers, send):
+            if transfer.status == 'SENT':
+                self.log_message(
+                    status=LogStatus.SENT,
+                    message=f"Transfer {transfer.amount} {ccy} to main account completed"
+                )
+            else:
+                self.log_message(
+                    status=LogStatus.ERROR,
+                    message=transfer.error
+                )
+                is_successfull = False
 
-        return True
+        return is_successfull
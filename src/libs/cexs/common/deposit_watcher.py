@@ -0,0 +1,323 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, List
+
+from aiohttp import ClientSession, WSMsgType
+
+
+@dataclass
+class DepositRecord:
+    """A credited deposit from the deposit history or a user-data stream."""
+    deposit_id: str
+    ccy: str
+    amount: float
+    network: str | None = None
+    tx_hash: str | None = None
+    timestamp: float = 0
+
+
+@dataclass
+class ExpectedDeposit:
+    ccy: str
+    amount: float
+    network: str | None = None
+    tx_hash: str | None = None
+    created_at: float = field(default_factory=time.time)
+    future: asyncio.Future | None = field(default=None, repr=False)
+
+
+class DepositWatcher:
+    """
+    Watches the deposits of one exchange for all waiting wallets at once.
+
+    The deposit history is fetched once per `poll_interval` while anything is awaited,
+    and every credited deposit is matched to the oldest outstanding expected deposit
+    with the same currency, network and transaction hash (if both are known) and an
+    amount within `amount_tolerance`. A deposit resolves only one expected deposit.
+    With a `push_source`, e.g. a `WebSocketDepositSource` of a user-data stream, the
+    history is fetched as soon as a balance change of an awaited currency is pushed.
+    Pushes are not matched themselves: internal transfers, e.g. sweeps of sub-accounts,
+    change balances too, and only the history tells deposits apart.
+
+    Example of use:
+    >>> watcher = DepositWatcher(fetch=self._get_deposit_history)
+    >>> record = await watcher.wait(ExpectedDeposit('ETH', 0.1, 'ARBITRUM'), timeout=1800)
+    """
+    POLL_INTERVAL = 30
+    AMOUNT_TOLERANCE = 0.005
+    TIME_SKEW = 600
+    HISTORY_WINDOW = 24 * 3600
+
+    def __init__(
+        self,
+        fetch: Callable[[List[str]], Awaitable[List[DepositRecord]]],
+        poll_interval: float = POLL_INTERVAL,
+        amount_tolerance: float = AMOUNT_TOLERANCE,
+        push_source: AsyncIterable[DepositRecord] | None = None
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            - `fetch` (Callable): Fetches the credited deposits of the currencies.
+            - `poll_interval` (float): Seconds between two fetches of the history.
+            - `amount_tolerance` (float): The relative difference of amounts still matched.
+            - `push_source` (AsyncIterable[DepositRecord] | None): The stream of pushed
+                balance changes which trigger a fetch of the history.
+        """
+        self.fetch = fetch
+        self.poll_interval = poll_interval
+        self.amount_tolerance = amount_tolerance
+        self.push_source = push_source
+
+        self._expected: List[ExpectedDeposit] = []
+        # ids of matched deposits by the time they were matched, in insertion order
+        self._seen: dict[str, float] = {}
+        self._wakeup = asyncio.Event()
+        self._poll_task: asyncio.Task | None = None
+        self._push_task: asyncio.Task | None = None
+
+    async def wait(
+        self,
+        expected: ExpectedDeposit,
+        timeout: float
+    ) -> DepositRecord | None:
+        """
+        Wait for the expected deposit.
+
+        Args:
+            - `expected` (ExpectedDeposit): The deposit to wait for.
+            - `timeout` (float): Seconds to wait for.
+
+        Returns:
+            - `DepositRecord | None`: The matched deposit or None after the timeout.
+        """
+        expected.future = asyncio.get_running_loop().create_future()
+        self._expected.append(expected)
+
+        if not self._poll_task or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll_periodically())
+        if self.push_source and (not self._push_task or self._push_task.done()):
+            self._push_task = asyncio.create_task(self._consume_pushes())
+
+        try:
+            return await asyncio.wait_for(expected.future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            if expected in self._expected:
+                self._expected.remove(expected)
+            if not self._expected and self._push_task:
+                self._push_task.cancel()
+
+    async def _poll_periodically(self) -> None:
+        while self._expected:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                records = await self.fetch(
+                    sorted({expected.ccy for expected in self._expected})
+                )
+            except Exception:
+                continue
+
+            for record in sorted(records, key=lambda record: record.timestamp):
+                self.match(record)
+
+    async def _consume_pushes(self) -> None:
+        async for record in self.push_source:
+            if any(
+                expected.ccy.upper() == record.ccy.upper()
+                for expected in self._expected
+            ):
+                self._wakeup.set()
+
+    def _is_match(
+        self,
+        expected: ExpectedDeposit,
+        record: DepositRecord
+    ) -> bool:
+        if record.ccy.upper() != expected.ccy.upper():
+            return False
+        if expected.network and record.network and record.network != expected.network:
+            return False
+        if expected.tx_hash and record.tx_hash:
+            return record.tx_hash.lower() == expected.tx_hash.lower()
+        if record.timestamp and record.timestamp < expected.created_at - self.TIME_SKEW:
+            return False
+
+        return abs(record.amount - expected.amount) <= expected.amount * self.amount_tolerance
+
+    def match(self, record: DepositRecord) -> bool:
+        """
+        Resolve the oldest outstanding expected deposit matching the record.
+
+        Returns:
+            - `bool`: True if the record resolved an expected deposit.
+        """
+        if record.deposit_id in self._seen:
+            return False
+
+        for expected in self._expected:
+            if expected.future.done() or not self._is_match(expected, record):
+                continue
+
+            self._mark_seen(record.deposit_id)
+            expected.future.set_result(record)
+            return True
+
+        return False
+
+    def _mark_seen(self, deposit_id: str) -> None:
+        now = time.time()
+        self._seen[deposit_id] = now
+
+        # ids older than the history lookback aren't fetched again
+        while self._seen:
+            oldest_id = next(iter(self._seen))
+            if now - self._seen[oldest_id] <= self.HISTORY_WINDOW:
+                break
+            del self._seen[oldest_id]
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._expected)
+
+
+class SubBalanceDeposits:
+    """
+    Deposits to sub-accounts found by increases of their balances.
+
+    For exchanges whose API lists the deposit history of the master account only.
+    The sub-account balances of a currency are snapshotted before its deposit is
+    awaited (`prime`), and every `collect` returns the increases since the previous
+    snapshot as deposit records. Snapshots older than `max_age` are taken again by
+    `prime`, so increases from the time nothing was awaited aren't taken for deposits.
+
+    Example of use:
+    >>> sub_deposits = SubBalanceDeposits(fetch=self._get_sub_balance_map)
+    >>> await sub_deposits.prime('ETH')
+    >>> records = await sub_deposits.collect(['ETH'])
+    """
+    MAX_AGE = 2 * DepositWatcher.POLL_INTERVAL
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[dict[str, float]]],
+        max_age: float = MAX_AGE
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            - `fetch` (Callable): Fetches the balances of the currency keyed by
+                sub-account, the sub-accounts whose request failed are left out.
+            - `max_age` (float): Seconds after which `prime` takes a new snapshot.
+        """
+        self.fetch = fetch
+        self.max_age = max_age
+
+        self._snapshots: dict[str, tuple[float, dict[str, float]]] = {}
+
+    async def prime(self, ccy: str) -> None:
+        """Snapshot the sub-account balances of the currency unless a recent snapshot exists."""
+        snapshot = self._snapshots.get(ccy)
+        if not snapshot or time.monotonic() - snapshot[0] > self.max_age:
+            self._snapshots[ccy] = (time.monotonic(), await self.fetch(ccy))
+
+    async def collect(self, ccys: List[str]) -> List[DepositRecord]:
+        """
+        Snapshot the sub-account balances of the currencies again.
+
+        Returns:
+            - `List[DepositRecord]`: The balance increases since the previous snapshots.
+        """
+        records = []
+        now = time.time()
+
+        for ccy in ccys:
+            snapshot = self._snapshots.get(ccy)
+            previous = snapshot[1] if snapshot else {}
+            # failed sub-accounts keep their previous balances
+            balances = {**previous, **await self.fetch(ccy)}
+            self._snapshots[ccy] = (time.monotonic(), balances)
+
+            if not snapshot:
+                continue
+
+            for sub_name, balance in balances.items():
+                increase = balance - previous.get(sub_name, 0)
+                if increase > 0:
+                    records.append(DepositRecord(
+                        deposit_id=f'sub-{sub_name}-{ccy}-{now}',
+                        ccy=ccy,
+                        amount=increase,
+                        timestamp=now
+                    ))
+
+        return records
+
+
+class WebSocketDepositSource:
+    """
+    Deposits pushed by a user-data WebSocket stream.
+
+    The stream is reconnected after errors. Every message is parsed by `parse`, which
+    returns None for events other than balance increases, so the source works with
+    exchange streams and with a local stand-in server in tests.
+
+    Example of use:
+    >>> source = WebSocketDepositSource('ws://127.0.0.1:8765', parse=parse_binance_balance_update)
+    >>> watcher = DepositWatcher(fetch=fetch, push_source=source)
+    """
+    RECONNECT_DELAY = 5
+
+    def __init__(
+        self,
+        url: str,
+        parse: Callable[[dict[str, Any]], DepositRecord | None],
+        reconnect_delay: float = RECONNECT_DELAY
+    ):
+        self.url = url
+        self.parse = parse
+        self.reconnect_delay = reconnect_delay
+
+    async def __aiter__(self) -> AsyncIterator[DepositRecord]:
+        while True:
+            try:
+                async with ClientSession() as session:
+                    async with session.ws_connect(self.url, heartbeat=30) as ws:
+                        async for message in ws:
+                            if message.type != WSMsgType.TEXT:
+                                continue
+                            record = self.parse(json.loads(message.data))
+                            if record:
+                                yield record
+            except (OSError, ValueError, asyncio.TimeoutError):
+                pass
+
+            await asyncio.sleep(self.reconnect_delay)
+
+
+def parse_binance_balance_update(event: dict[str, Any]) -> DepositRecord | None:
+    """
+    Parse a `balanceUpdate` event of the Binance user-data stream.
+
+    Positive deltas are deposits or transfers from sub-accounts, the event doesn't
+    tell them apart, so the record only triggers a fetch of the deposit history.
+    """
+    if event.get('e') != 'balanceUpdate' or float(event['d']) <= 0:
+        return None
+
+    return DepositRecord(
+        deposit_id=f"stream-{event['a']}-{event['T']}",
+        ccy=event['a'],
+        amount=float(event['d']),
+        timestamp=event['T'] / 1000
+    )
@@ -1,21 +1,146 @@
+import inspect
+import time
+from typing import Awaitable, Callable
+from urllib.parse import urlparse
+
 from curl_cffi.requests import AsyncSession
 
 from src._types.common import HttpMethod
+from src.helpers.adaptive_concurrency import (
+    adaptive_concurrency,
+    get_target,
+    is_overload_response
+)
+from src.helpers.metrics import LatencyHistogram
 
 from ..common import exceptions as exc
+from .weights import WeightBudget
+
+
+class CexHttpClient:
+    """
+    Long-lived HTTP session of one CEX instance.
+
+    The session is opened on the first request and reused by all the following ones,
+    so balance checks, sub-account listings and withdrawals share keep-alive
+    connections instead of making a TLS handshake each. Paths are joined with the base
+    URL of the exchange, full URLs are requested as is. Latency is observed per
+    endpoint (method and path). With a `weight_budget`, every request reserves its
+    weight first and the budget is corrected by the rate-limit headers of the response.
+    Endpoints with limits of their own use their budget of `endpoint_budgets` instead.
+    Signed requests pass a `sign` callback instead of the final URL and headers: it is
+    called after the budget and the concurrency slot are taken, so the signed timestamp
+    doesn't age while the request waits.
+
+    Example of use:
+    >>> http = CexHttpClient(base_url='https://api.binance.com', proxy=proxy)
+    >>> response = await http.request(url='/sapi/v1/capital/config/getall', headers=headers)
+    >>> response = await http.request(url=endpoint, sign=lambda: (signed_url, headers))
+    >>> http.get_metrics()
+    >>> await http.close()
+    """
+
+    def __init__(
+        self,
+        base_url: str = '',
+        proxy: str | None = None,
+        weight_budget: WeightBudget | None = None,
+        endpoint_budgets: dict[str, WeightBudget] | None = None
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            - `base_url` (str): The base URL of the exchange API.
+            - `proxy` (str | None): The proxy URL or None for direct connections.
+            - `weight_budget` (WeightBudget | None): The request-weight budget of the exchange.
+            - `endpoint_budgets` (dict[str, WeightBudget] | None): The budgets of endpoints
+                with limits of their own, keyed by path.
+        """
+        self.base_url = base_url
+        self.proxy = proxy
+        self.weight_budget = weight_budget
+        self.endpoint_budgets = endpoint_budgets or {}
+
+        self.latencies: dict[str, LatencyHistogram] = {}
+        self._session: AsyncSession | None = None
+
+    def _get_session(self) -> AsyncSession:
+        if not self._session:
+            self._session = AsyncSession(
+                proxies=(
+                    {'http': self.proxy, 'https': self.proxy}
+                    if self.proxy
+                    else None
+                )
+            )
+        return self._session
+
+    def _get_budget(self, url: str) -> WeightBudget | None:
+        return self.endpoint_budgets.get(urlparse(url).path, self.weight_budget)
 
+    def _observe(self, method: str, url: str, seconds: float) -> None:
+        endpoint = f'{method} {urlparse(url).path}'
+        if endpoint not in self.latencies:
+            self.latencies[endpoint] = LatencyHistogram(default=0.0, min_samples=1)
+        self.latencies[endpoint].observe(seconds)
 
-async def make_async_request(
-    method: HttpMethod = 'GET',
-    url: str = '',
-    headers: dict | None = None,
-    **kwargs
-) -> dict:
-    async with AsyncSession(headers=headers) as session:
-        response = await session.request(method, url=url, **kwargs)
+    async def request(
+        self,
+        method: HttpMethod = 'GET',
+        url: str = '',
+        headers: dict | None = None,
+        weight: int = 1,
+        sign: Callable[[], tuple[str, dict] | Awaitable[tuple[str, dict]]] | None = None,
+        **kwargs
+    ) -> dict:
+        """
+        Make the request through the shared session.
 
-        status_code = response.status_code
-        json_response = response.json()
+        Args:
+            - `method` (HttpMethod): The HTTP method.
+            - `url` (str): The path joined with the base URL or a full URL.
+            - `headers` (dict | None): The headers of the request.
+            - `weight` (int): The request weight of the endpoint.
+            - `sign` (Callable | None): Returns the signed URL and headers, called right
+                before the request is sent. `url` then only selects the budget.
+
+        Returns:
+            - `dict`: The JSON response.
+
+        Raises:
+            - `HTTPException`: If the status code is above 201.
+        """
+        if url.startswith('/'):
+            url = self.base_url + url
+
+        budget = self._get_budget(url)
+        if budget:
+            await budget.acquire(weight)
+
+        async with adaptive_concurrency.slot(get_target(url)) as slot:
+            if sign:
+                signed = sign()
+                if inspect.isawaitable(signed):
+                    signed = await signed
+                url, headers = signed
+
+            started_at = time.perf_counter()
+            try:
+                response = await self._get_session().request(
+                    method, url=url, headers=headers, **kwargs
+                )
+            finally:
+                self._observe(method, url, time.perf_counter() - started_at)
+
+            if budget:
+                budget.update(response.headers)
+
+            status_code = response.status_code
+            json_response = response.json()
+
+            if is_overload_response(status_code, json_response):
+                slot.mark_overloaded()
 
         if status_code <= 201:
             return json_response
@@ -23,3 +148,15 @@ async def make_async_request(
         raise exc.HTTPException(
             response=json_response, status_code=status_code
         )
+
+    def get_metrics(self) -> dict[str, dict[str, float]]:
+        return {
+            endpoint: histogram.snapshot()
+            for endpoint, histogram in self.latencies.items()
+        }
+
+    async def close(self) -> None:
+        """Close the session and its connections."""
+        session, self._session = self._session, None
+        if session:
+            await session.close()
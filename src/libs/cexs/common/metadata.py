@@ -0,0 +1,136 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+# withdraw errors meaning the cached fees, limits or network states are outdated
+STALE_METADATA_MARKERS = (
+    'fee',
+    'minimum',
+    'maximum',
+    'suspend',
+    'disabled',
+    'not active',
+    'not support',
+)
+
+
+def is_stale_metadata_error(error: BaseException | str) -> bool:
+    """Check whether the withdraw error means the cached currency metadata is outdated."""
+    message = str(error).lower()
+    return any(marker in message for marker in STALE_METADATA_MARKERS)
+
+
+class CexMetadataCache:
+    """
+    Currency and network metadata of one exchange cached with a TTL.
+
+    Deposit and withdraw enablement, min/max amounts and fees change rarely, so a
+    fetched table is reused for `ttl` seconds. After that it is still returned while
+    a refresh runs in the background, unless it is older than `max_stale` seconds.
+    Concurrent misses of the same key share one request. Entries are invalidated
+    explicitly when the exchange rejects a request because of outdated data.
+
+    Example of use:
+    >>> metadata = CexMetadataCache(fetch=self._fetch_currencies)
+    >>> currencies = await metadata.get('ETH')
+    >>> metadata.invalidate('ETH')
+    """
+    TTL = 300
+    MAX_STALE = 3600
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[Any]],
+        ttl: float = TTL,
+        max_stale: float = MAX_STALE
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            - `fetch` (Callable): Fetches the metadata of the key.
+            - `ttl` (float): Seconds the metadata is fresh for.
+            - `max_stale` (float): Seconds after which stale metadata is not returned anymore.
+        """
+        self.fetch = fetch
+        self.ttl = ttl
+        self.max_stale = max_stale
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._pending: dict[str, asyncio.Future] = {}
+        self._refreshes: set[asyncio.Task] = set()
+
+    async def get(self, key: str) -> Any:
+        """
+        Get the metadata of the key, fetching it on a miss.
+
+        Args:
+            - `key` (str): The key, e.g. the currency.
+
+        Returns:
+            - `Any`: The metadata.
+        """
+        entry = self._entries.get(key)
+        if entry:
+            age = time.monotonic() - entry[0]
+            if age <= self.ttl:
+                self.hits += 1
+                return entry[1]
+            if age <= self.max_stale:
+                self.hits += 1
+                self._refresh_in_background(key)
+                return entry[1]
+
+        self.misses += 1
+        return await self._fetch(key)
+
+    async def _fetch(self, key: str) -> Any:
+        pending = self._pending.get(key)
+        if pending:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await self.fetch(key)
+            self._entries[key] = (time.monotonic(), value)
+            future.set_result(value)
+            return value
+        except BaseException as error:
+            future.set_exception(error)
+            # mark the exception as retrieved if nobody waits for it
+            future.exception()
+            raise
+        finally:
+            self._pending.pop(key, None)
+
+    def _refresh_in_background(self, key: str) -> None:
+        if key in self._pending:
+            return
+
+        task = asyncio.create_task(self._fetch(key))
+        self._refreshes.add(task)
+        task.add_done_callback(self._on_refreshed)
+
+    def _on_refreshed(self, task: asyncio.Task) -> None:
+        self._refreshes.discard(task)
+        # errors are ignored, the stale entry is refreshed by the next call
+        if not task.cancelled():
+            task.exception()
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Drop the metadata of the key or of all keys."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def get_metrics(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'keys': len(self._entries),
+        }
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
+from .http import CexHttpClient
+
 
 class LogStatus:
     FOUND = 'FOUND'
@@ -37,12 +39,28 @@ class OkxCredentials(CexCredentials):
 
 
 class Cex(ABC):
+    http: CexHttpClient
+
     def __init__(
         self,
         credentials: CexCredentials
     ):
         self.credentials = credentials
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP session of the exchange."""
+        await self.http.close()
+
+    def get_http_metrics(self) -> dict[str, dict[str, float]]:
+        """Get the latency of every requested endpoint."""
+        return self.http.get_metrics()
+
     @abstractmethod
     async def get_min_dep_details(
         self,
@@ -89,21 +107,24 @@ class Cex(ABC):
         ccy: str,
         amount: float,
         network_name: str,
-        old_sub_balances: dict,
-        check_time: int = 45
+        tx_hash: str | None = None,
+        timeout: float = 3600
     ) -> bool:
         """
         Waits for the deposit confirmation of a specified cryptocurrency.
 
+        The deposit is matched in the deposit history by the shared `DepositWatcher`
+        of the exchange, which polls once for all waiting deposits.
+
         Args:
             - `ccy` (str): The currency code (e.g., 'ETH', 'BTC') for the deposit.
             - `amount` (float): The amount of cryptocurrency deposited.
             - `network_name` (str): The name of the blockchain network (e.g., 'Optimism', 'Ethereum').
-            - `old_sub_balances` (dict): A dictionary containing the old sub-balances before the deposit.
-            - `check_time (int, optional): The time interval (in seconds) between checks for deposit confirmation. Defaults to 45 seconds.
+            - `tx_hash` (str, optional): The hash of the deposit transaction, matched exactly if given.
+            - `timeout` (float, optional): Seconds to wait for the deposit. Defaults to 3600.
 
         Returns:
-            bool: True if the deposit is confirmed and reflected in the balances, False otherwise.
+            bool: True if the deposit is found in the deposit history, False otherwise.
         """
         pass
 
@@ -0,0 +1,48 @@
+from src.helpers.retry import ErrorKind, RetryPolicy
+
+
+def classify_transfer_error(error: BaseException) -> ErrorKind:
+    str_err = str(error)
+
+    if (
+        'not reached the required block confirmations' in str_err
+        or '-9000' in str_err
+    ):
+        return ErrorKind.RETRYABLE
+    return ErrorKind.FATAL
+
+
+def classify_timestamp_error(error: BaseException) -> ErrorKind:
+    if '-1021 Msg: Timestamp for' in str(error):
+        return ErrorKind.RETRYABLE
+    return ErrorKind.FATAL
+
+
+def classify_rate_limit_error(error: BaseException) -> ErrorKind:
+    # rejected by the rate limit, so the request was not executed
+    if (
+        getattr(error, 'status_code', None) == 429
+        or '50011' in str(error)
+    ):
+        return ErrorKind.RETRYABLE
+    return ErrorKind.FATAL
+
+
+TRANSFER_RETRY_POLICY = RetryPolicy(
+    max_attempts=10,
+    base_delay=30,
+    max_delay=120,
+    classify=classify_transfer_error
+)
+TIMESTAMP_RETRY_POLICY = RetryPolicy(
+    max_attempts=5,
+    base_delay=10,
+    max_delay=30,
+    classify=classify_timestamp_error
+)
+RATE_LIMIT_RETRY_POLICY = RetryPolicy(
+    max_attempts=5,
+    base_delay=1,
+    max_delay=10,
+    classify=classify_rate_limit_error
+)
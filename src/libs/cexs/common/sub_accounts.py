@@ -0,0 +1,130 @@
+import asyncio
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Iterable, List, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass
+class SubAccountTransfer:
+    exchange: str
+    sub_name: str
+    ccy: str
+    amount: float
+    status: str = 'PENDING'
+    error: str = ''
+
+
+class TransferJournal:
+    """
+    Append-only journal of sub-account transfers.
+
+    Every transfer is written as PENDING before it is sent and as SENT or FAILED
+    afterwards. A PENDING line without a result means the process stopped while the
+    transfer was in flight: check the exchange before sweeping that sub-account again.
+    """
+    PATH = ['user_data', '_outputs', 'cex_transfers.jsonl']
+
+    def __init__(self, path: list[str] = PATH):
+        self.path = os.path.join(*path)
+
+    def record(self, transfer: SubAccountTransfer) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'a') as file:
+                file.write(json.dumps({'time': int(time.time()), **asdict(transfer)}) + '\n')
+        except OSError:
+            pass
+
+
+transfer_journal = TransferJournal()
+
+
+class SubAccountEngine:
+    """
+    Runs sub-account requests of an exchange concurrently.
+
+    Balance requests and transfers run as parallel tasks, at most `concurrency` at
+    a time. The request-weight budgets of the exchange, e.g. one transfer per second
+    on OKX, are enforced by its `CexHttpClient`, so a sweep slows down instead of
+    hitting the limits.
+
+    Example of use:
+    >>> balances = await engine.map(self._get_sub_acc_ccy_balance, sub_emails)
+    >>> transfers = await engine.sweep(transfers, send=self._send_sub_transfer)
+    """
+    CONCURRENCY = 10
+
+    def __init__(
+        self,
+        concurrency: int = CONCURRENCY,
+        journal: TransferJournal = transfer_journal
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            - `concurrency` (int): The max number of requests in flight.
+            - `journal` (TransferJournal): The journal of transfers.
+        """
+        self.concurrency = concurrency
+        self.journal = journal
+
+    async def map(
+        self,
+        func: Callable[[T], Awaitable[Any]],
+        items: Iterable[T]
+    ) -> List[Any]:
+        """
+        Call the function for every item concurrently.
+
+        Returns:
+            - `List[Any]`: The results in the order of the items, exceptions are returned as results.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(item: T) -> Any:
+            async with semaphore:
+                return await func(item)
+
+        return await asyncio.gather(
+            *(run(item) for item in items),
+            return_exceptions=True
+        )
+
+    async def sweep(
+        self,
+        transfers: List[SubAccountTransfer],
+        send: Callable[[SubAccountTransfer], Awaitable[Any]]
+    ) -> List[SubAccountTransfer]:
+        """
+        Send the transfers concurrently, journaling each one before and after it is sent.
+
+        Args:
+            - `transfers` (List[SubAccountTransfer]): The transfers of non-zero balances.
+            - `send` (Callable): Sends one transfer, raises on failure.
+
+        Returns:
+            - `List[SubAccountTransfer]`: The transfers with their SENT or FAILED status.
+        """
+        async def run(transfer: SubAccountTransfer) -> None:
+            self.journal.record(transfer)
+            try:
+                await send(transfer)
+                transfer.status = 'SENT'
+            except Exception as error:
+                transfer.status = 'FAILED'
+                transfer.error = str(error)
+            self.journal.record(transfer)
+
+        await self.map(run, transfers)
+        return transfers
+
+
+def raise_first_error(results: List[Any]) -> None:
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
@@ -0,0 +1,88 @@
+import asyncio
+import time
+from typing import Mapping
+
+
+class WeightBudget:
+    """
+    Request-weight budget of an exchange API within a fixed window.
+
+    Requests reserve their weight before they are sent and wait for the next window
+    once the budget (minus `reserve`) is spent. The counter is corrected by the
+    rate-limit headers of responses: the weight used (Binance `X-SAPI-USED-IP-WEIGHT-1M`)
+    or the requests remaining (OKX, BingX), so requests made by other processes with
+    the same key are accounted too.
+
+    Example of use:
+    >>> budget = WeightBudget(limit=12000, window=60, used_header='X-SAPI-USED-IP-WEIGHT-1M')
+    >>> await budget.acquire(weight=1)
+    >>> budget.update(response.headers)
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window: float,
+        used_header: str | None = None,
+        remaining_header: str | None = None,
+        reserve: float = 0.1
+    ):
+        """
+        Initialize the budget.
+
+        Args:
+            - `limit` (int): The max weight of one window.
+            - `window` (float): The length of the window in seconds.
+            - `used_header` (str | None): The header with the weight used in the window.
+            - `remaining_header` (str | None): The header with the requests remaining in the window.
+            - `reserve` (float): The share of the limit left for other clients of the key.
+        """
+        self.limit = limit
+        self.window = window
+        self.used_header = used_header
+        self.remaining_header = remaining_header
+        self.reserve = reserve
+
+        self.used = 0
+        self.waits = 0
+        self._window_started_at = time.monotonic()
+
+    @property
+    def capacity(self) -> float:
+        return self.limit * (1 - self.reserve)
+
+    def _roll_window(self) -> float:
+        now = time.monotonic()
+        if now - self._window_started_at >= self.window:
+            self._window_started_at = now
+            self.used = 0
+        return now
+
+    async def acquire(self, weight: int = 1) -> None:
+        """Reserve the weight of a request, waiting for the next window if needed."""
+        while True:
+            now = self._roll_window()
+            if self.used + weight <= self.capacity or not self.used:
+                self.used += weight
+                return
+
+            self.waits += 1
+            await asyncio.sleep(self._window_started_at + self.window - now)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Correct the used weight by the rate-limit headers of a response."""
+        self._roll_window()
+        try:
+            if self.used_header and (value := headers.get(self.used_header)):
+                self.used = max(self.used, int(value))
+            elif self.remaining_header and (value := headers.get(self.remaining_header)):
+                self.used = max(self.used, self.limit - int(value))
+        except ValueError:
+            pass
+
+    def get_metrics(self) -> dict[str, float]:
+        return {
+            'used': self.used,
+            'limit': self.limit,
+            'waits': self.waits,
+        }
@@ -1,7 +1,7 @@
 import base64
 import hmac
 from enum import Enum
-from typing import Any
+from typing import Any, AsyncIterable, Awaitable, Callable
 from urllib.parse import urlencode
 
 from src._types.networks import NetworkNamesEnum
@@ -10,7 +10,21 @@ from src.helpers.time_functions import get_izoformat_timestamp
 from .common import exceptions as exc
 from .common.logger import CustomLogger
 from .common.models import Cex, OkxCredentials, LogStatus
-from .common.http import make_async_request
+from .common.http import CexHttpClient
+from .common.metadata import CexMetadataCache, is_stale_metadata_error
+from .common.retry import RATE_LIMIT_RETRY_POLICY
+from .common.deposit_watcher import (
+    DepositRecord,
+    DepositWatcher,
+    ExpectedDeposit,
+    SubBalanceDeposits
+)
+from .common.sub_accounts import (
+    SubAccountEngine,
+    SubAccountTransfer,
+    raise_first_error
+)
+from .common.weights import WeightBudget
 
 
 def get_okx_network_names():
@@ -54,6 +68,7 @@ def get_okx_endpoints():
         'SAccLst_V5':         '/api/v5/users/subaccount/list',
         'SAccBal_V5':         '/api/v5/asset/subaccount/balances',
         'SAccBal_EU_V5':         '/api/v5/account/subaccount/balances',
+        'DepHist_V5':         '/api/v5/asset/deposit-history',
         'T_V5':         '/api/v5/asset/transfer',
         'Wd_V5':         '/api/v5/asset/withdrawal',
     }
@@ -68,7 +83,12 @@ class OkxErrors(str, Enum):
 
 
 class Okx(Cex, CustomLogger):
-    def __init__(self, credentials: OkxCredentials):
+    def __init__(
+        self,
+        credentials: OkxCredentials,
+        proxy: str | None = None,
+        deposit_stream: AsyncIterable[DepositRecord] | None = None
+    ):
         self.credentials = credentials
 
         self.is_okx_eu_type = credentials.is_okx_eu_type
@@ -77,6 +97,34 @@ class Okx(Cex, CustomLogger):
         }
         self.domain_url = 'https://www.okx.com'
         self.endpoints = get_okx_endpoints()
+        # OKX limits every endpoint on its own
+        sub_balance_budget = WeightBudget(
+            limit=6,
+            window=2,
+            remaining_header='X-RateLimit-Remaining'
+        )
+        self.http = CexHttpClient(
+            self.domain_url,
+            proxy,
+            endpoint_budgets={
+                self.endpoints['SAccBal_V5']: sub_balance_budget,
+                self.endpoints['SAccBal_EU_V5']: sub_balance_budget,
+                # 1 request per second per currency
+                self.endpoints['T_V5']: WeightBudget(
+                    limit=1,
+                    window=1,
+                    reserve=0
+                ),
+            }
+        )
+        self.sub_accounts = SubAccountEngine()
+        self.metadata = CexMetadataCache(fetch=self._fetch_currencies)
+        self.deposits = DepositWatcher(
+            fetch=self._get_deposit_history,
+            push_source=deposit_stream
+        )
+        # the deposit history lists the deposits of the master account only
+        self.sub_deposits = SubBalanceDeposits(fetch=self._get_sub_balance_map)
 
     async def get_min_dep_details(
         self,
@@ -139,30 +187,39 @@ class Okx(Cex, CustomLogger):
         ccy: str,
         amount: str | float,
         network_name: str,
-        old_sub_balances: dict,
-        check_time: int = 45
+        tx_hash: str | None = None,
+        timeout: float = 3600
     ) -> bool:
         self.log_message(
             status=LogStatus.INFO,
-            message=f"Start checking CEX balances"
+            message=f"Start waiting for the deposit"
         )
 
-        while True:
-            new_sub_balances = await self._get_cex_balances(ccy)
-            for sub_name, sub_balance in new_sub_balances.items():
+        await self.sub_deposits.prime(ccy)
+        record = await self.deposits.wait(
+            ExpectedDeposit(
+                ccy=ccy,
+                amount=float(amount),
+                network=get_okx_network_names().get(network_name),
+                tx_hash=tx_hash
+            ),
+            timeout=timeout
+        )
+        if record:
+            self.log_message(
+                status=LogStatus.DEPOSITED,
+                message=f"{record.amount} {ccy} in {network_name}",
+            )
+            return True
 
-                if sub_balance > old_sub_balances[sub_name]:
-                    self.log_message(
-                        status=LogStatus.DEPOSITED,
-                        message=f"{amount} {ccy} in {network_name}",
-                    )
-                    return True
-                else:
-                    self.log_message(
-                        status=LogStatus.WARNING,
-                        message=f"Deposit still in progress..."
-                    )
-                    await self.sleep(check_time)
+        self.log_message(
+            status=LogStatus.ERROR,
+            message=(
+                f"Deposit of {amount} {ccy} in {network_name} "
+                f"was not found in {round(timeout)} sec"
+            )
+        )
+        return False
 
     async def withdraw(
         self,
@@ -224,6 +281,8 @@ class Okx(Cex, CustomLogger):
                     message=f"Withdraw to \'{network_name}\' is not active now. Will try again in 1 min...",
                 )
                 await self.sleep(60)
+                self.metadata.invalidate(ccy)
+                wd_raw_data = (await self._get_currencies(ccy))['data']
                 continue
 
             min_wd = float(network_data['min_wd'])
@@ -250,19 +309,19 @@ class Okx(Cex, CustomLogger):
                 "chain": okx_network_name
             }
 
-            headers = await self._get_headers(
-                method="POST",
-                request_path=url,
-                body=str(body)
-            )
-
-            response = await make_async_request(
+            response = await self.http.request(
                 method='POST',
                 url=self.domain_url + url,
                 data=str(body),
-                headers=headers
+                sign=self._get_signer(
+                    method="POST",
+                    request_path=url,
+                    body=str(body)
+                )
             )
             error_section = response['msg']
+            if is_stale_metadata_error(error_section):
+                self.metadata.invalidate(ccy)
 
             if any(error in error_section for error in OkxErrors):
                 is_successfull = False
@@ -329,22 +388,36 @@ class Okx(Cex, CustomLogger):
         except Exception as error:
             raise exc.ApiException(f"Bad headers for OKX request: {error}")
 
-    async def _get_currencies(self, ccy: str) -> dict:
-        url = self.endpoints['AssCur_V5'] + f'?ccy={ccy}'
-        headers = await self._get_headers(request_path=url)
+    def _get_signer(
+        self,
+        request_path: str,
+        method: str = "GET",
+        body: str = "",
+        params: dict[str, Any] = {}
+    ) -> Callable[[], Awaitable[tuple[str, dict]]]:
+        # the timestamp is signed only once the request may be sent, so waits for
+        # the rate-limit budgets don't make it expire
+        async def sign() -> tuple[str, dict]:
+            headers = await self._get_headers(request_path, method, body, params)
+            return self.domain_url + request_path, headers
 
-        return await make_async_request(
+        return sign
+
+    async def _fetch_currencies(self, ccy: str) -> dict:
+        url = self.endpoints['AssCur_V5'] + f'?ccy={ccy}'
+        return await self.http.request(
             url=self.domain_url + url,
-            headers=headers
+            sign=self._get_signer(request_path=url)
         )
 
+    async def _get_currencies(self, ccy: str) -> dict:
+        return await self.metadata.get(ccy)
+
     async def _get_sub_list(self) -> dict:
         url = self.endpoints['SAccLst_V5']
-        headers = await self._get_headers(request_path=url)
-
-        return await make_async_request(
+        return await self.http.request(
             url=self.domain_url + url,
-            headers=headers
+            sign=self._get_signer(request_path=url)
         )
 
     async def _get_main_acc_balance(
@@ -360,11 +433,9 @@ class Okx(Cex, CustomLogger):
         params = {
             'ccy': ccy
         }
-        headers = await self._get_headers(url, params=params)
-
-        response = await make_async_request(
+        response = await self.http.request(
             url=self.domain_url + url,
-            headers=headers,
+            sign=self._get_signer(url, params=params),
             params=params
         )
 
@@ -395,10 +466,9 @@ class Okx(Cex, CustomLogger):
             url = self.endpoints['SAccBal_V5']
             url += f'?subAcct={sub_name}&ccy={ccy}'
 
-        headers = await self._get_headers(url)
-        response = (await make_async_request(
+        response = (await self.http.request(
             url=self.domain_url + url,
-            headers=headers
+            sign=self._get_signer(url)
         ))['data']
 
         if not response:
@@ -415,6 +485,22 @@ class Okx(Cex, CustomLogger):
         else:
             return float(response[0]['availBal'])
 
+    async def _get_sub_acc_balances(
+        self,
+        ccy: str
+    ) -> tuple[list[str], list[float | Exception]]:
+        sub_list = await self._get_sub_list()
+        sub_names = [sub_data['subAcct'] for sub_data in sub_list['data']]
+
+        sub_balances = await self.sub_accounts.map(
+            lambda sub_name: self._get_sub_acc_balance(sub_name, ccy),
+            sub_names
+        )
+        return sub_names, [
+            sub_balance if isinstance(sub_balance, Exception) else sub_balance or 0
+            for sub_balance in sub_balances
+        ]
+
     async def _get_cex_balances(
         self,
         ccy: str = 'ETH',
@@ -427,18 +513,51 @@ class Okx(Cex, CustomLogger):
         else:
             balances['Main CEX Account'] = 0
 
-        sub_list = await self._get_sub_list()
-        for sub_data in sub_list['data']:
-            sub_name = sub_data['subAcct']
+        sub_names, sub_balances = await self._get_sub_acc_balances(ccy)
+        raise_first_error(sub_balances)
+        balances.update(zip(sub_names, sub_balances))
 
-            sub_balance = await self._get_sub_acc_balance(sub_name, ccy)
+        return balances
 
-            if sub_balance:
-                balances[sub_name] = sub_balance
-            else:
-                balances[sub_name] = 0
+    async def _get_deposit_history(self, ccys: list[str]) -> list[DepositRecord]:
+        url = self.endpoints['DepHist_V5']
+        records = []
 
-        return balances
+        for ccy in ccys:
+            params = {
+                'ccy': ccy
+            }
+            response = await self.http.request(
+                url=self.domain_url + url,
+                sign=self._get_signer(url, params=params),
+                params=params
+            )
+
+            records.extend(
+                DepositRecord(
+                    deposit_id=item['depId'],
+                    ccy=item['ccy'],
+                    amount=float(item['amt']),
+                    # chains are named like 'ETH-Arbitrum One'
+                    network=item['chain'].split('-', 1)[-1],
+                    tx_hash=item.get('txId'),
+                    timestamp=int(item['ts']) / 1000
+                )
+                for item in response['data']
+                # 1 - credited, 2 - successful
+                if item['state'] in ('1', '2')
+            )
+
+        records.extend(await self.sub_deposits.collect(ccys))
+        return records
+
+    async def _get_sub_balance_map(self, ccy: str) -> dict[str, float]:
+        sub_names, sub_balances = await self._get_sub_acc_balances(ccy)
+        return {
+            sub_name: sub_balance
+            for sub_name, sub_balance in zip(sub_names, sub_balances)
+            if not isinstance(sub_balance, Exception)
+        }
 
     async def _transfer_from_subs(
         self,
@@ -452,85 +571,87 @@ class Okx(Cex, CustomLogger):
                 message=f'Checking subaccounts balance'
             )
 
-        is_empty = True
-        sub_list = await self._get_sub_list()
-        await self.sleep()
-
-        for sub_data in sub_list['data']:
-            sub_name = sub_data['subAcct']
-
-            sub_balance = await self._get_sub_acc_balance(sub_name, ccy)
-            amount = amount if amount else sub_balance
+        transfers = []
+        for sub_name, sub_balance in zip(*await self._get_sub_acc_balances(ccy)):
+            if isinstance(sub_balance, Exception):
+                self.log_message(
+                    status=LogStatus.ERROR,
+                    message=f'{sub_name} | {sub_balance}'
+                )
+                continue
 
             if sub_balance == 0.0:  # or sub_balance != amount
                 continue
 
-            is_empty = False
             if not silent_mode:
                 self.log_message(
                     status=LogStatus.FOUND,
                     message=f'{sub_name} | subAccount balance : {sub_balance} {ccy}'
                 )
+            transfers.append(SubAccountTransfer(
+                exchange='OKX',
+                sub_name=sub_name,
+                ccy=ccy,
+                amount=amount or sub_balance
+            ))
+            if not silent_mode:
+                break
 
+        if not transfers:
+            if not silent_mode:
+                self.log_message(
+                    status=LogStatus.WARNING,
+                    message=f'subAccounts balance: 0 {ccy}'
+                )
+            return True
+
+        async def send(transfer: SubAccountTransfer) -> None:
             body = {
                 "ccy": ccy,
                 "type": "2",
-                "amt": f"{amount:.10f}",
+                "amt": f"{transfer.amount:.10f}",
                 "from": "6" if not self.is_okx_eu_type else "18",
                 "to": "6" if not self.is_okx_eu_type else "18",
-                "subAcct": sub_name
+                "subAcct": transfer.sub_name
             }
+            await self.http.request(
+                method="POST",
+                url=self.domain_url + self.endpoints['T_V5'],
+                sign=self._get_signer(
+                    request_path=self.endpoints['T_V5'],
+                    method="POST",
+                    body=str(body)
+                ),
+                data=str(body)
+            )
 
-            while True:
-                try:
-                    headers = await self._get_headers(
-                        request_path=self.endpoints['T_V5'],
-                        method="POST",
-                        body=str(body)
-                    )
-
-                    await make_async_request(
-                        method="POST",
-                        url=self.domain_url + self.endpoints['T_V5'],
-                        headers=headers,
-                        data=str(body)
-                    )
-
-                    break
-                except Exception as error:
-                    str_err = str(error)
-                    # if (
-                    #     'the required block confirmations' in str_err
-                    # ):
-                    #     self.log_message(
-                    #         status=LogStatus.WARNING,
-                    #         message=(
-                    #             f'Deposit not reached the required block confirmations. '
-                    #             f'Will try again in 1 min.'
-                    #         )
-                    #     )
-                    #     await self.sleep(60)
-                    # else:
-                    self.log_message(
-                        status=LogStatus.ERROR,
-                        message=str_err
+        async def send_with_retry(transfer: SubAccountTransfer) -> None:
+            await RATE_LIMIT_RETRY_POLICY.run(
+                lambda: send(transfer),
+                on_retry=lambda attempt, error, delay: self.log_message(
+                    status=LogStatus.WARNING,
+                    message=(
+                        f'{transfer.sub_name} | Transfer rate limit reached. '
+                        f'Will try again in {round(delay, 1)} sec.'
                     )
-                    return False
-
-            self.log_message(
-                status=LogStatus.SENT,
-                message=f"Transfer {amount} {ccy} to main account completed"
+                )
             )
-            if not silent_mode:
-                break
 
-        if is_empty and not silent_mode:
-            self.log_message(
-                status=LogStatus.WARNING,
-                message=f'subAccounts balance: 0 {ccy}'
-            )
+        is_successfull = True
+        for transfer in await self.sub_accounts.sweep(transfers, send_with_retry):
+            if transfer.status == 'SENT':
+                self.log_message(
+                    status=LogStatus.SENT,
+                    message=f"Transfer {transfer.amount} {ccy} to main account completed"
+                )
+            else:
+                self.log_message(
+                    status=LogStatus.ERROR,
+                    message=transfer.error
+                )
+                is_successfull = False
 
-        return True
+        return is_successfull
 
     async def _transfer_from_spot_to_funding(self, ccy: str = 'ETH') -> bool:
         url = self.endpoints['AccBal_EU_V5']
@@ -538,10 +659,9 @@ class Okx(Cex, CustomLogger):
             'ccy': ccy.upper()
         }
 
-        headers = await self._get_headers(request_path=url, params=params)
-        balance = await make_async_request(
+        balance = await self.http.request(
             url=self.domain_url + url,
-            headers=headers,
+            sign=self._get_signer(request_path=url, params=params),
             params=params
         )
         balance = balance['data'][0]['details']
@@ -560,15 +680,14 @@ class Okx(Cex, CustomLogger):
                     "to": "6"
                 }
 
-                headers = await self._get_headers(
-                    method="POST",
-                    request_path=self.endpoints['T_V5'],
-                    body=str(body)
-                )
-                await make_async_request(
+                await self.http.request(
                     method="POST",
                     url=self.domain_url + self.endpoints['T_V5'],
-                    headers=headers,
+                    sign=self._get_signer(
+                        method="POST",
+                        request_path=self.endpoints['T_V5'],
+                        body=str(body)
+                    ),
                     data=str(body)
                 )
 
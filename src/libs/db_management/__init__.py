@@ -1,5 +1,10 @@
 import asyncio
+import os
 
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
@@ -9,12 +14,16 @@ from .core.entities import BaseSqlModel
 
 
 DATABASE_URL = 'sqlite+aiosqlite:///./user_data/wallets.db'
+MIGRATIONS_PATH = os.path.join(os.path.dirname(__file__), 'migrations')
+BASELINE_REVISION = '0001'
 
 async_engine = create_async_engine(
     DATABASE_URL,
     pool_pre_ping=True,
     echo=False,
-    future=True
+    future=True,
+    # several worker processes share the file, wait for locks instead of failing
+    connect_args={'timeout': 30}
 )
 async_session_maker = async_sessionmaker(
     async_engine,
@@ -22,8 +31,30 @@ async_session_maker = async_sessionmaker(
 )
 
 
+def run_migrations(sync_conn) -> None:
+    """
+    Bring the schema to the latest alembic revision.
+
+    New databases are created from the models and stamped with the latest revision.
+    Databases created by `create_all` before migrations were added are stamped with
+    the baseline revision first, so only the later revisions run on them.
+    """
+    config = Config()
+    config.set_main_option('script_location', MIGRATIONS_PATH)
+    config.attributes['connection'] = sync_conn
+
+    if MigrationContext.configure(sync_conn).get_current_revision() is None:
+        if inspect(sync_conn).get_table_names():
+            command.stamp(config, BASELINE_REVISION)
+        else:
+            BaseSqlModel.metadata.create_all(sync_conn)
+            command.stamp(config, 'head')
+
+    command.upgrade(config, 'head')
+
+
 async def init_models():
     async with async_engine.begin() as conn:
-        await conn.run_sync(BaseSqlModel.metadata.create_all)
+        await conn.run_sync(run_migrations)
 
 asyncio.run(init_models())
\ No newline at end of file
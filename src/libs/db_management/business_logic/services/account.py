@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta
 from typing import List
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -36,6 +37,89 @@ class AccountService(Service[AccountDTO]):
             filters=AccountDTO.GetByEvmAddress(evm_address)
         )
 
+    async def get_schedule_page(
+        self,
+        after_id: int = 0,
+        limit: int = 1000,
+        shard: tuple[int, int] | None = None
+    ) -> ServiceResult[List[tuple[int, datetime | None]] | None]:
+        rows = await self.repository.get_schedule_page(
+            after_id=after_id,
+            limit=limit,
+            shard=shard
+        )
+
+        return (
+            ServiceResult.create_success(rows)
+            if len(rows) > 0
+            else ServiceResult.create_failure('No entities found')
+        )
+
+    async def get_stealable(
+        self,
+        shard: tuple[int, int],
+        overdue: float,
+        limit: int
+    ) -> ServiceResult[List[int] | None]:
+        account_ids = await self.repository.get_stealable(
+            shard=shard,
+            due_before=datetime.now() - timedelta(seconds=overdue),
+            limit=limit
+        )
+
+        return (
+            ServiceResult.create_success(account_ids)
+            if len(account_ids) > 0
+            else ServiceResult.create_failure('No entities found')
+        )
+
+    async def acquire_lease(
+        self,
+        owner: str,
+        account_id: int,
+        ttl: float
+    ) -> ServiceResult[int | None]:
+        leased_ids = await self.repository.acquire_leases(
+            owner=owner,
+            account_ids=[account_id],
+            expires_at=datetime.now() + timedelta(seconds=ttl)
+        )
+
+        return (
+            ServiceResult.create_success(account_id)
+            if account_id in leased_ids
+            else ServiceResult.create_failure(f'Account {account_id} is leased by another worker')
+        )
+
+    async def renew_leases(
+        self,
+        owner: str,
+        ttl: float
+    ) -> ServiceResult[int]:
+        row_count = await self.repository.renew_leases(
+            owner=owner,
+            expires_at=datetime.now() + timedelta(seconds=ttl)
+        )
+
+        return (
+            ServiceResult.create_success(row_count)
+            if row_count > 0
+            else ServiceResult.create_failure(f'No leases found for {owner}')
+        )
+
+    async def release_leases(
+        self,
+        owner: str,
+        account_ids: List[int] | None = None
+    ) -> ServiceResult[int]:
+        row_count = await self.repository.release_leases(owner, account_ids)
+
+        return (
+            ServiceResult.create_success(row_count)
+            if row_count > 0
+            else ServiceResult.create_failure(f'No leases found for {owner}')
+        )
+
     async def add(self, dto: AccountDTO) -> ServiceResult[int | None]:
         try:
             return await super().add(dto)
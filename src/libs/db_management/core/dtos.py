@@ -43,6 +43,8 @@ class AccountDTO(GeneralDTO):
     planned_bridges_count: int = Field(0)
     planned_stakes_count: int = Field(0)
     completed: bool = Field(False)
+    lease_owner: Optional[str] = Field(None)
+    lease_expires_at: Optional[datetime] = Field(None)
 
     @field_validator('evm_private_key', mode='before')
     def check_evm_private_key(cls, v) -> str:
@@ -69,6 +69,10 @@ class AccountEntity(BaseSqlModel):
     planned_bridges_count: Mapped[int]
     planned_stakes_count: Mapped[int]
     completed: Mapped[bool] = mapped_column(default=False, server_default='0')
+    lease_owner: Mapped[str_30_an | None]
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DATETIME(truncate_microseconds=True)
+    )
     updated_at: Mapped[datetime] = mapped_column(
         DATETIME(truncate_microseconds=True),
         server_default=func.now(),
@@ -1,6 +1,156 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from ...core.entities import AccountEntity
 from ...data_access.repositories._generic import GenericSqlRepository
 
 
 class AccountRepository(GenericSqlRepository[AccountEntity]):
-    pass
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+        self.__session = session
+
+    async def get_schedule_page(
+        self,
+        after_id: int = 0,
+        limit: int = 1000,
+        shard: tuple[int, int] | None = None
+    ) -> List[tuple[int, datetime]]:
+        """
+        Retrieves one page of the ids and next action times of uncompleted accounts.
+
+        Args:
+            after_id (int): The id after which the page starts.
+            limit (int): The max number of accounts in the page.
+            shard (tuple[int, int] | None): The index of the shard and the number of
+                shards, only accounts with `id % count == index` are selected if given.
+
+        Returns:
+            List[tuple[int, datetime]]: The ids and next action times ordered by id.
+        """
+        entity = self.entity_type
+        query = select(entity.id, entity.next_action_time).where(
+            entity.completed.is_(False),
+            entity.id > after_id
+        )
+        if shard:
+            index, count = shard
+            query = query.where(entity.id % count == index)
+
+        result = await self.__session.execute(
+            query.order_by(entity.id).limit(limit)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def get_stealable(
+        self,
+        shard: tuple[int, int],
+        due_before: datetime,
+        limit: int
+    ) -> List[int]:
+        """
+        Retrieves the overdue accounts of other shards which are not leased.
+
+        Args:
+            shard (tuple[int, int]): The index of the shard of the worker and the number of shards.
+            due_before (datetime): Only accounts due before this time are selected.
+            limit (int): The max number of accounts.
+
+        Returns:
+            List[int]: The ids of the accounts, the most overdue first.
+        """
+        entity = self.entity_type
+        index, count = shard
+        result = await self.__session.execute(
+            select(entity.id)
+            .where(
+                entity.completed.is_(False),
+                entity.next_action_time <= due_before,
+                or_(
+                    entity.lease_owner.is_(None),
+                    entity.lease_expires_at < datetime.now()
+                ),
+                entity.id % count != index
+            )
+            .order_by(entity.next_action_time)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def acquire_leases(
+        self,
+        owner: str,
+        account_ids: List[int],
+        expires_at: datetime
+    ) -> List[int]:
+        """
+        Leases the accounts which are free, expired or already leased by the owner.
+
+        The lease is taken by one conditional UPDATE, so two workers can't lease
+        the same account.
+
+        Args:
+            owner (str): The id of the worker.
+            account_ids (List[int]): The ids of the accounts to lease.
+            expires_at (datetime): The time the lease expires at unless renewed.
+
+        Returns:
+            List[int]: The ids of the accounts leased by the owner.
+        """
+        entity = self.entity_type
+        await self.__session.execute(
+            update(entity)
+            .where(
+                entity.id.in_(account_ids),
+                or_(
+                    entity.lease_owner.is_(None),
+                    entity.lease_owner == owner,
+                    entity.lease_expires_at < datetime.now()
+                )
+            )
+            .values(lease_owner=owner, lease_expires_at=expires_at)
+        )
+        await self.__session.flush()
+
+        result = await self.__session.execute(
+            select(entity.id).where(
+                entity.id.in_(account_ids),
+                entity.lease_owner == owner
+            )
+        )
+        return list(result.scalars().all())
+
+    async def renew_leases(
+        self,
+        owner: str,
+        expires_at: datetime
+    ) -> int:
+        """Extends all leases of the owner. Returns the number of renewed leases."""
+        result = await self.__session.execute(
+            update(self.entity_type)
+            .where(self.entity_type.lease_owner == owner)
+            .values(lease_expires_at=expires_at)
+        )
+        await self.__session.flush()
+        return result.rowcount
+
+    async def release_leases(
+        self,
+        owner: str,
+        account_ids: List[int] | None = None
+    ) -> int:
+        """Releases the leases of the owner, all of them if no ids are given."""
+        query = update(self.entity_type).where(
+            self.entity_type.lease_owner == owner
+        )
+        if account_ids is not None:
+            query = query.where(self.entity_type.id.in_(account_ids))
+
+        result = await self.__session.execute(
+            query.values(lease_owner=None, lease_expires_at=None)
+        )
+        await self.__session.flush()
+        return result.rowcount
@@ -0,0 +1,22 @@
+from alembic import context
+
+from src.libs.db_management.core.entities import BaseSqlModel
+
+target_metadata = BaseSqlModel.metadata
+
+
+def run_migrations() -> None:
+    """Run the migrations on the connection passed by `init_models`."""
+    connection = context.config.attributes['connection']
+
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite can't alter columns in place, tables are recreated instead
+        render_as_batch=True
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+run_migrations()
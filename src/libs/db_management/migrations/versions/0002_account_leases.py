@@ -0,0 +1,36 @@
+"""account leases
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.sqlite import DATETIME
+
+revision: str = '0002'
+down_revision: str | None = '0001'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('accounts') as batch_op:
+        batch_op.add_column(
+            sa.Column('lease_owner', sa.String(30), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column(
+                'lease_expires_at',
+                DATETIME(truncate_microseconds=True),
+                nullable=True
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('accounts') as batch_op:
+        batch_op.drop_column('lease_expires_at')
+        batch_op.drop_column('lease_owner')
@@ -0,0 +1,3 @@
+from .queue import ScheduleQueue
+from .scheduler import AccountHandler, AccountScheduler
+from .supervisor import Supervisor
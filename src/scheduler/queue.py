@@ -0,0 +1,54 @@
+import heapq
+import random
+
+
+class ScheduleQueue:
+    """
+    Priority queue of accounts keyed on `next_action_time`.
+
+    Only the time and the id of every account are kept in the heap, so memory grows
+    by a few dozen bytes per account. The rest of the account is loaded when it is due.
+    """
+
+    def __init__(self, shuffle: bool = True):
+        """
+        Initialize the queue.
+
+        Args:
+            shuffle (bool): Whether accounts due at the same time are popped in a random order.
+        """
+        self.shuffle = shuffle
+        self._heap: list[tuple[float, float, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, account_id: int, timestamp: float) -> None:
+        """
+        Schedule the account.
+
+        Args:
+            account_id (int): The id of the account.
+            timestamp (float): The unix time of the next action.
+        """
+        tie_breaker = random.random() if self.shuffle else account_id
+        heapq.heappush(self._heap, (timestamp, tie_breaker, account_id))
+
+    def peek_time(self) -> float | None:
+        """Get the time of the earliest action or None if the queue is empty."""
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> int | None:
+        """
+        Pop the account whose action is due.
+
+        Args:
+            now (float): The current unix time.
+
+        Returns:
+            int | None: The id of the account or None if no account is due.
+        """
+        if not self._heap or self._heap[0][0] > now:
+            return None
+
+        return heapq.heappop(self._heap)[2]
@@ -0,0 +1,428 @@
+import asyncio
+import random
+import signal
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+from src._types.settings import DefaultSettings
+from src.helpers.concurrency import WorkerPermit, current_permit, rpc_limits
+from src.libs.async_eth_lib.architecture.logger import CustomLogger
+from src.libs.async_eth_lib.models.others import LogStatus
+from src.libs.db_management.business_logic.uow import ServiceUnitOfWork
+from src.libs.db_management.core.dtos import AccountDTO
+
+from .queue import ScheduleQueue
+
+AccountHandler = Callable[[AccountDTO], Awaitable[bool]]
+
+
+class AccountScheduler:
+    """
+    Runs account actions at their `next_action_time` with bounded concurrency.
+
+    Accounts are paged from the database into a heap of (time, id) pairs, the rest of
+    the account is loaded only when it is due. At most `threads` accounts run at once,
+    RPC requests are capped per network and per RPC by `rpc_limits`. After every action
+    the account is rescheduled by `delay.between_modules` and new times are written back
+    through `ServiceUnitOfWork` in batches. On stop, running actions are awaited and
+    pending updates are flushed.
+
+    Delays inside an action (`sleep` of `time_functions`) give the worker slot back
+    through `current_permit`, so a sleeping account doesn't occupy one of the `threads`.
+
+    When several schedulers run in worker processes (see `Supervisor`), every account is
+    leased in the database by `lease_owner` before its action, so two workers never act
+    on the same account. Every worker loads only the accounts of its shard. While none
+    of them is due, it steals accounts of other shards which are overdue by `steal_delay`
+    seconds and not leased, e.g. because their worker crashed, with one query.
+
+    Example of use:
+    >>> async def handler(account: AccountDTO) -> bool:
+    >>>     ...
+    >>>     return is_completed
+    >>>
+    >>> scheduler = AccountScheduler(handler=handler, settings=settings)
+    >>> await scheduler.run()
+    """
+    PAGE_SIZE = 1000
+    FLUSH_INTERVAL = 5
+    MAX_IDLE = 30
+    LEASE_TTL = 120
+    STEAL_DELAY = 60
+
+    def __init__(
+        self,
+        handler: AccountHandler,
+        settings: DefaultSettings,
+        page_size: int = PAGE_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+        lease_owner: str | None = None,
+        shard: tuple[int, int] | None = None,
+        lease_ttl: float = LEASE_TTL,
+        steal_delay: float = STEAL_DELAY,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            handler (AccountHandler): Runs the next action of the account and
+                returns True if the account has completed all actions.
+            settings (DefaultSettings): The settings with `threads`, `delay`,
+                `shuffle` and `concurrency`.
+            page_size (int): The number of accounts loaded from the database at once.
+            flush_interval (float): Seconds between two writes of rescheduled accounts.
+            lease_owner (str | None): The id of the worker leasing accounts, None to run
+                without leases in a single process.
+            shard (tuple[int, int] | None): The index of the shard and the number of shards.
+                Accounts with `id % count == index` belong to the shard.
+            lease_ttl (float): Seconds a lease lives unless renewed.
+            steal_delay (float): Seconds accounts of other shards must be overdue by
+                before they are stolen, also the interval between two steal queries.
+        """
+        self.handler = handler
+        self.page_size = page_size
+        self.flush_interval = flush_interval
+        self.lease_owner = lease_owner
+        self.shard = shard
+        self.lease_ttl = lease_ttl
+        self.steal_delay = steal_delay
+        self.stats = {'actions': 0, 'completed': 0, 'failed': 0, 'skipped': 0}
+
+        threads = settings['threads']
+        self.threads = None if threads == 'all' else int(threads)
+        self.delay = settings['delay']['between_modules']
+        self.queue = ScheduleQueue(shuffle=settings['shuffle']['wallets'])
+
+        concurrency = settings.get('concurrency')
+        if concurrency:
+            rpc_limits.configure(
+                per_network=concurrency['per_network'],
+                per_rpc=concurrency['per_rpc']
+            )
+
+        self._permits: asyncio.Semaphore | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._pending_updates: dict[int, AccountDTO] = {}
+        self._stopping = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._stolen: set[int] = set()
+        self._steal_at = 0.0
+
+    @property
+    def is_stopping(self) -> bool:
+        return self._stopping.is_set()
+
+    def stop(self) -> None:
+        """Stop dispatching new actions. Running actions are finished."""
+        self._stopping.set()
+        self._wakeup.set()
+
+    async def load(self) -> int:
+        """
+        Page all uncompleted accounts of the shard from the database into the queue.
+
+        Returns:
+            int: The number of loaded accounts.
+        """
+        after_id = 0
+        loaded = 0
+
+        while True:
+            async with ServiceUnitOfWork() as uow:
+                result = await uow.accounts.get_schedule_page(
+                    after_id=after_id,
+                    limit=self.page_size,
+                    shard=self.shard
+                )
+
+            if not result.is_success:
+                break
+
+            for account_id, next_action_time in result.value:
+                self.queue.push(
+                    account_id,
+                    next_action_time.timestamp()
+                    if next_action_time
+                    else time.time()
+                )
+
+            loaded += len(result.value)
+            after_id = result.value[-1][0]
+
+            if len(result.value) < self.page_size:
+                break
+
+        return loaded
+
+    def _is_own(self, account_id: int) -> bool:
+        if not self.shard:
+            return True
+
+        index, count = self.shard
+        return account_id % count == index
+
+    async def run(self) -> None:
+        """Load accounts and run their actions until all are completed or the scheduler is stopped."""
+        loaded = await self.load()
+        self._permits = asyncio.Semaphore(self.threads or max(loaded, 1))
+        self._install_signal_handlers()
+
+        flusher = asyncio.create_task(self._flush_periodically())
+        try:
+            await self._dispatch()
+        finally:
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+            await self.flush()
+            await self.release_leases()
+
+    async def _dispatch(self) -> None:
+        while not self.is_stopping:
+            next_time = self.queue.peek_time()
+
+            is_idle = next_time is None and not self._tasks
+
+            now = time.time()
+            if next_time is None or next_time > now:
+                if is_idle or now >= self._steal_at:
+                    self._steal_at = now + self.steal_delay
+                    if await self.steal():
+                        continue
+
+                if is_idle:
+                    break
+
+                await self._wait_wakeup(
+                    min(
+                        self.MAX_IDLE if next_time is None else next_time - now,
+                        self.MAX_IDLE,
+                        max(self._steal_at - now, 0)
+                    )
+                )
+                continue
+
+            await self._permits.acquire()
+
+            account_id = (
+                None
+                if self.is_stopping
+                else self.queue.pop_due(time.time())
+            )
+            if account_id is None:
+                self._permits.release()
+                continue
+
+            permit = WorkerPermit(self._permits)
+            task = asyncio.create_task(self._run_account(account_id, permit))
+            self._tasks.add(task)
+            task.add_done_callback(self._on_task_done)
+
+    async def steal(self) -> int:
+        """
+        Queue overdue accounts of other shards which nobody leased.
+
+        Returns:
+            int: The number of newly queued accounts.
+        """
+        if not self.lease_owner or not self.shard or self.is_stopping:
+            return 0
+
+        try:
+            async with ServiceUnitOfWork() as uow:
+                result = await uow.accounts.get_stealable(
+                    shard=self.shard,
+                    overdue=self.steal_delay,
+                    limit=self.threads or self.page_size
+                )
+        except Exception:
+            return 0
+
+        if not result.is_success:
+            return 0
+
+        stolen = 0
+        now = time.time()
+        for account_id in result.value:
+            if account_id in self._stolen:
+                continue
+
+            self._stolen.add(account_id)
+            self.queue.push(account_id, now)
+            stolen += 1
+
+        return stolen
+
+    async def _wait_wakeup(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        self._wakeup.set()
+
+    async def _run_account(
+        self,
+        account_id: int,
+        permit: WorkerPermit
+    ) -> None:
+        current_permit.set(permit)
+        try:
+            async with ServiceUnitOfWork() as uow:
+                if self.lease_owner:
+                    lease = await uow.accounts.acquire_lease(
+                        owner=self.lease_owner,
+                        account_id=account_id,
+                        ttl=self.lease_ttl
+                    )
+                    if not lease.is_success:
+                        self.stats['skipped'] += 1
+                        if self._is_own(account_id):
+                            self.queue.push(account_id, time.time() + self.steal_delay)
+                        return
+
+                result = await uow.accounts.get_by_id(account_id)
+
+            if not result.is_success:
+                return
+
+            account = result.value
+            if not await self._is_due(account):
+                return
+
+            self.stats['actions'] += 1
+            try:
+                is_completed = await self.handler(account)
+            except Exception as error:
+                CustomLogger(
+                    account_id=account.id,
+                    address=account.evm_address,
+                    network_name=''
+                ).log_message(
+                    status=LogStatus.ERROR,
+                    message=f'Action failed: {error}'
+                )
+                self.stats['failed'] += 1
+                is_completed = False
+
+            if is_completed:
+                self.stats['completed'] += 1
+
+            next_action_time = datetime.now() + timedelta(
+                seconds=random.randint(*self.delay)
+            )
+            self._pending_updates[account_id] = self._create_update(
+                account_id=account_id,
+                next_action_time=next_action_time,
+                completed=is_completed
+            )
+
+            # stolen accounts are left to their owner and stolen again if it is still down
+            if not is_completed and self._is_own(account_id):
+                self.queue.push(account_id, next_action_time.timestamp())
+        finally:
+            self._stolen.discard(account_id)
+            permit.release()
+
+    async def _is_due(self, account: AccountDTO) -> bool:
+        """
+        Check the leased account against the database, another worker may have
+        acted on it since it was queued. Not due accounts are requeued and released.
+        """
+        if not self.lease_owner:
+            return True
+
+        if not account.completed and (
+            not account.next_action_time
+            or account.next_action_time.timestamp() <= time.time()
+        ):
+            return True
+
+        self.stats['skipped'] += 1
+        if not account.completed and self._is_own(account.id):
+            self.queue.push(account.id, account.next_action_time.timestamp())
+
+        async with ServiceUnitOfWork() as uow:
+            await uow.accounts.release_leases(self.lease_owner, [account.id])
+        return False
+
+    def _create_update(
+        self,
+        account_id: int,
+        next_action_time: datetime,
+        completed: bool
+    ) -> AccountDTO:
+        # the lease is released in the same write as the new time, so no other
+        # worker can act on the account before its new time is stored
+        if not self.lease_owner:
+            return AccountDTO(
+                id=account_id,
+                next_action_time=next_action_time,
+                completed=completed
+            )
+
+        return AccountDTO(
+            id=account_id,
+            next_action_time=next_action_time,
+            completed=completed,
+            lease_owner=None,
+            lease_expires_at=None
+        )
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+                await self.renew_leases()
+            except Exception:
+                pass
+
+    async def renew_leases(self) -> None:
+        """Extend the leases of running and not yet flushed accounts."""
+        if not self.lease_owner:
+            return
+
+        async with ServiceUnitOfWork() as uow:
+            await uow.accounts.renew_leases(self.lease_owner, self.lease_ttl)
+
+    async def release_leases(self) -> None:
+        """Release all leases of the worker."""
+        if not self.lease_owner:
+            return
+
+        async with ServiceUnitOfWork() as uow:
+            await uow.accounts.release_leases(self.lease_owner)
+
+    async def flush(self) -> None:
+        """Write rescheduled accounts to the database in one transaction."""
+        if not self._pending_updates:
+            return
+
+        updates, self._pending_updates = self._pending_updates, {}
+        try:
+            async with ServiceUnitOfWork() as uow:
+                for dto in updates.values():
+                    await uow.accounts.update(dto)
+        except Exception:
+            for account_id, dto in updates.items():
+                self._pending_updates.setdefault(account_id, dto)
+            raise
+
+    def _install_signal_handlers(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        for signal_name in ('SIGINT', 'SIGTERM'):
+            try:
+                loop.add_signal_handler(getattr(signal, signal_name), self.stop)
+            except (AttributeError, NotImplementedError, RuntimeError):
+                pass
@@ -0,0 +1,259 @@
+import asyncio
+import math
+import multiprocessing
+import os
+import queue
+import time
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+from src._types.settings import DefaultSettings
+from src.helpers.adaptive_concurrency import adaptive_concurrency
+from src.helpers.rate_limit import rate_limiter
+from src.helpers.signing import signing_service
+from src.libs.async_eth_lib.architecture.logger import CustomLogger
+from src.libs.async_eth_lib.models.others import LogStatus
+from src.libs.async_starknet_lib.architecture.transport import starknet_transports
+
+from .scheduler import AccountHandler, AccountScheduler
+
+
+class Supervisor:
+    """
+    Shards the accounts table across worker processes, one event loop per CPU core.
+
+    Every worker runs an `AccountScheduler` over the accounts with `id % processes == index`
+    and has its own RPC clients, limiters and caches. Accounts are leased through the
+    database, so two workers never act on the same account. Workers report their progress
+    and RPC metrics to the supervisor, which logs the totals. A crashed worker is restarted
+    up to `max_restarts` times. Until it is back, or when it is given up, its accounts are
+    stolen by idle workers once they are overdue and their leases expired.
+
+    The handler must be a module-level function, so it can be sent to the workers.
+
+    Example of use:
+    >>> async def handler(account: AccountDTO) -> bool:
+    >>>     ...
+    >>>
+    >>> if __name__ == '__main__':
+    >>>     Supervisor(handler=handler, settings=settings, processes=4).run()
+    """
+    REPORT_INTERVAL = 30
+    MAX_RESTARTS = 3
+
+    def __init__(
+        self,
+        handler: AccountHandler,
+        settings: DefaultSettings,
+        processes: int | None = None,
+        max_restarts: int = MAX_RESTARTS,
+        report_interval: float = REPORT_INTERVAL,
+    ):
+        """
+        Initialize the supervisor.
+
+        Args:
+            handler (AccountHandler): The module-level handler passed to every scheduler.
+            settings (DefaultSettings): The settings. `threads` is split between workers.
+            processes (int | None): The number of workers, the number of CPU cores if None.
+            max_restarts (int): The number of restarts of one crashed worker.
+            report_interval (float): Seconds between two progress reports.
+        """
+        self.handler = handler
+        self.processes = processes or os.cpu_count() or 1
+        self.max_restarts = max_restarts
+        self.report_interval = report_interval
+        self.settings = self._split_threads(settings, self.processes)
+
+        self.progress: dict[int, dict[str, Any]] = {}
+        self.logger = CustomLogger(
+            account_id='main',
+            address='',
+            network_name=''
+        )
+
+        self._context = multiprocessing.get_context('spawn')
+        self._reports = self._context.Queue()
+        self._workers: dict[int, BaseProcess] = {}
+        self._restarts: dict[int, int] = {}
+
+    @staticmethod
+    def _split_threads(
+        settings: DefaultSettings,
+        processes: int
+    ) -> DefaultSettings:
+        if settings['threads'] == 'all':
+            return settings
+
+        return {
+            **settings,
+            'threads': max(1, math.ceil(int(settings['threads']) / processes))
+        }
+
+    def _start_worker(self, index: int) -> None:
+        process = self._context.Process(
+            target=run_worker,
+            name=f'worker-{index}',
+            args=(
+                index,
+                self.processes,
+                self.handler,
+                self.settings,
+                self._reports,
+                self.report_interval
+            ),
+            daemon=False
+        )
+        process.start()
+        self._workers[index] = process
+
+    def run(self) -> None:
+        """Start the workers and supervise them until all of them are finished."""
+        for index in range(self.processes):
+            self._restarts[index] = 0
+            self._start_worker(index)
+
+        reported_at = time.monotonic()
+        try:
+            while self._workers:
+                self._drain_reports(timeout=1)
+                self._check_workers()
+
+                if time.monotonic() - reported_at >= self.report_interval:
+                    self._log_progress()
+                    reported_at = time.monotonic()
+        except KeyboardInterrupt:
+            self.stop()
+        finally:
+            self._drain_reports(timeout=0)
+            self._log_progress()
+
+    def stop(self) -> None:
+        """Ask the workers to finish their running actions and wait for them."""
+        for process in self._workers.values():
+            if process.is_alive():
+                process.terminate()
+
+        for process in self._workers.values():
+            process.join()
+        self._workers.clear()
+
+    def _check_workers(self) -> None:
+        for index, process in list(self._workers.items()):
+            if process.is_alive():
+                continue
+
+            del self._workers[index]
+            if process.exitcode == 0:
+                continue
+
+            if self._restarts[index] >= self.max_restarts:
+                self.logger.log_message(
+                    status=LogStatus.ERROR,
+                    message=(
+                        f'Worker {index} crashed with code {process.exitcode}, '
+                        f'its accounts are left to other workers'
+                    )
+                )
+                continue
+
+            self._restarts[index] += 1
+            self.logger.log_message(
+                status=LogStatus.WARNING,
+                message=(
+                    f'Worker {index} crashed with code {process.exitcode}, '
+                    f'restart {self._restarts[index]}/{self.max_restarts}'
+                )
+            )
+            self._start_worker(index)
+
+    def _drain_reports(self, timeout: float) -> None:
+        try:
+            report = self._reports.get(timeout=timeout)
+            while True:
+                self.progress[report['worker']] = report
+                report = self._reports.get_nowait()
+        except queue.Empty:
+            pass
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get the progress totals and the latest report of every worker."""
+        totals: dict[str, int] = {}
+        for report in self.progress.values():
+            for key, value in report['stats'].items():
+                totals[key] = totals.get(key, 0) + value
+
+        return {
+            'totals': totals,
+            'queued': sum(report['queued'] for report in self.progress.values()),
+            'workers': self.progress,
+        }
+
+    def _log_progress(self) -> None:
+        metrics = self.get_metrics()
+        totals = metrics['totals']
+
+        self.logger.log_message(
+            status=LogStatus.INFO,
+            message=(
+                f'Workers: {len(self._workers)}/{self.processes} | '
+                f'actions: {totals.get("actions", 0)}, '
+                f'completed: {totals.get("completed", 0)}, '
+                f'failed: {totals.get("failed", 0)}, '
+                f'queued: {metrics["queued"]}'
+            )
+        )
+
+
+def run_worker(
+    index: int,
+    count: int,
+    handler: AccountHandler,
+    settings: DefaultSettings,
+    reports: Any,
+    report_interval: float,
+) -> None:
+    """The entry point of a worker process."""
+    asyncio.run(_run_worker(
+        index, count, handler, settings, reports, report_interval
+    ))
+
+
+async def _run_worker(
+    index: int,
+    count: int,
+    handler: AccountHandler,
+    settings: DefaultSettings,
+    reports: Any,
+    report_interval: float,
+) -> None:
+    scheduler = AccountScheduler(
+        handler=handler,
+        settings=settings,
+        lease_owner=f'worker-{index}-{os.getpid()}',
+        shard=(index, count)
+    )
+
+    def report() -> None:
+        reports.put({
+            'worker': index,
+            'pid': os.getpid(),
+            'stats': dict(scheduler.stats),
+            'queued': len(scheduler.queue),
+            'rpc_waits': rate_limiter.get_metrics(),
+            'adaptive_limits': adaptive_concurrency.get_limits(),
+            'signing': signing_service.get_metrics(),
+        })
+
+    async def report_periodically() -> None:
+        while True:
+            await asyncio.sleep(report_interval)
+            report()
+
+    reporter = asyncio.create_task(report_periodically())
+    try:
+        await scheduler.run()
+    finally:
+        reporter.cancel()
+        report()
+        await starknet_transports.close()
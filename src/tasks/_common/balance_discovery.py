@@ -0,0 +1,213 @@
+import asyncio
+from typing import Iterable
+
+from src.libs.async_eth_lib.architecture.client import EvmClient
+from src.libs.async_eth_lib.architecture.multicall import MulticallCall
+from src.libs.async_eth_lib.data.token_contracts import ContractsFactory
+from src.libs.async_eth_lib.models.contract import NativeTokenContract, TokenContract
+from src.libs.async_eth_lib.models.others import LogStatus, TokenAmount
+
+
+class BalanceDiscovery:
+    """
+    Snapshots balances of the wallet in many networks at once.
+
+    Balances of all tokens of a network are read with one multicall, the networks
+    are requested concurrently. Networks which failed to answer are left out of the snapshot.
+
+    Example of use:
+    >>> balances = await BalanceDiscovery.get_balances(
+    >>>     client=self.client,
+    >>>     tokens_by_network={NetworkNamesEnum.ARBITRUM: [TokenSymbol.ETH, TokenSymbol.USDC]}
+    >>> )
+    >>> balances[NetworkNamesEnum.ARBITRUM][TokenSymbol.USDC].Ether
+    """
+
+    @staticmethod
+    def create_client(
+        client: EvmClient,
+        network_name: str,
+    ) -> EvmClient:
+        """Create the client of the same wallet in another network without the proxy check."""
+        return EvmClient(
+            account_id=client.account_id,
+            private_key=client.account._private_key,
+            network_name=network_name,
+            proxy=client.proxy,
+            check_proxy=False
+        )
+
+    @staticmethod
+    async def get_balances(
+        client: EvmClient,
+        tokens_by_network: dict[str, Iterable[str]],
+    ) -> dict[str, dict[str, TokenAmount]]:
+        """
+        Get balances of the tokens in all networks concurrently.
+
+        Args:
+            - `client` (EvmClient): The client of the wallet.
+            - `tokens_by_network` (dict[str, Iterable[str]]): The token symbols to check in every network.
+
+        Returns:
+            - `dict[str, dict[str, TokenAmount]]`: The balances by network name and token symbol.
+        """
+        network_names = list(tokens_by_network)
+        results = await asyncio.gather(
+            *(
+                BalanceDiscovery.get_network_balances(
+                    client=BalanceDiscovery.create_client(client, network_name),
+                    token_names=tokens_by_network[network_name]
+                )
+                for network_name in network_names
+            ),
+            return_exceptions=True
+        )
+
+        balances: dict[str, dict[str, TokenAmount]] = {}
+        for network_name, result in zip(network_names, results):
+            if isinstance(result, BaseException):
+                client.custom_logger.log_message(
+                    status=LogStatus.WARNING,
+                    message=f'Failed to get balances in {network_name}: {result}'
+                )
+                continue
+            balances[network_name] = result
+
+        return balances
+
+    @staticmethod
+    async def get_network_balances(
+        client: EvmClient,
+        token_names: Iterable[str],
+    ) -> dict[str, TokenAmount]:
+        """
+        Get balances of the tokens in the network of the client with one multicall.
+
+        Falls back to concurrent single calls if Multicall3 can't be used in the network.
+
+        Args:
+            - `client` (EvmClient): The client of the network.
+            - `token_names` (Iterable[str]): The token symbols.
+
+        Returns:
+            - `dict[str, TokenAmount]`: The balances by token symbol.
+        """
+        token_contracts = {
+            token_name: ContractsFactory.get_contract(
+                client.network.name, token_name
+            )
+            for token_name in token_names
+        }
+
+        try:
+            return await BalanceDiscovery._get_balances_with_multicall(
+                client, token_contracts
+            )
+        except Exception:
+            return await BalanceDiscovery._get_balances_with_single_calls(
+                client, token_contracts
+            )
+
+    @staticmethod
+    async def _get_balances_with_multicall(
+        client: EvmClient,
+        token_contracts: dict[str, TokenContract | NativeTokenContract],
+    ) -> dict[str, TokenAmount]:
+        account_address = client.account.address
+        calls: list[MulticallCall] = []
+        calls_by_token: dict[str, tuple[int, int | None]] = {}
+
+        for token_name, token_contract in token_contracts.items():
+            if token_contract.is_native_token:
+                calls.append(client.multicall.get_eth_balance_call(account_address))
+                calls_by_token[token_name] = (len(calls) - 1, None)
+                continue
+
+            calls.append(
+                MulticallCall.from_signature(
+                    target=token_contract.address,
+                    text_signature='balanceOf(address)',
+                    args=[account_address],
+                    output_types=['uint256']
+                )
+            )
+            balance_index = len(calls) - 1
+
+            decimals_index = None
+            if token_contract.decimals is None:
+                calls.append(
+                    MulticallCall.from_signature(
+                        target=token_contract.address,
+                        text_signature='decimals()',
+                        args=[],
+                        output_types=['uint8']
+                    )
+                )
+                decimals_index = len(calls) - 1
+
+            calls_by_token[token_name] = (balance_index, decimals_index)
+
+        results = await client.multicall.aggregate(calls)
+
+        balances: dict[str, TokenAmount] = {}
+        for token_name, (balance_index, decimals_index) in calls_by_token.items():
+            token_contract = token_contracts[token_name]
+
+            if results[balance_index] is None:
+                continue
+
+            if token_contract.is_native_token:
+                decimals = client.network.decimals
+            elif decimals_index is None:
+                decimals = token_contract.decimals
+            elif results[decimals_index] is not None:
+                decimals = token_contract.decimals = results[decimals_index][0]
+            else:
+                continue
+
+            balances[token_name] = TokenAmount(
+                amount=results[balance_index][0],
+                decimals=decimals,
+                wei=True
+            )
+
+        return balances
+
+    @staticmethod
+    async def _get_balances_with_single_calls(
+        client: EvmClient,
+        token_contracts: dict[str, TokenContract | NativeTokenContract],
+    ) -> dict[str, TokenAmount]:
+        async def get_balance(
+            token_contract: TokenContract | NativeTokenContract
+        ) -> TokenAmount:
+            if token_contract.is_native_token:
+                balance_wei = await client.contract.get_balance()
+                decimals = client.network.decimals
+            else:
+                balance_wei, decimals = await asyncio.gather(
+                    client.contract.get_balance(token_contract.address),
+                    client.contract.get_decimals(token_contract)
+                )
+
+            return TokenAmount(
+                amount=balance_wei,
+                decimals=decimals,
+                wei=True
+            )
+
+        token_names = list(token_contracts)
+        results = await asyncio.gather(
+            *(
+                get_balance(token_contracts[token_name])
+                for token_name in token_names
+            ),
+            return_exceptions=True
+        )
+
+        return {
+            token_name: result
+            for token_name, result in zip(token_names, results)
+            if not isinstance(result, BaseException)
+        }
@@ -6,6 +6,7 @@ from src.libs.async_eth_lib.data.token_contracts import ContractsFactory
 from src.libs.async_eth_lib.models.operation import OperationInfo, OperationProposal
 from src.libs.async_eth_lib.models.others import TokenAmount
 from src.libs.async_eth_lib.models.params_types import AddressType
+from src.tasks._common.quoter import Quote
 from src.tasks._common.utils import PriceUtils
 
 
@@ -159,19 +160,67 @@ class EvmTask:
             - `OperationProposal`: The operation proposal.
         """
         op_proposal = await self.init_operation_proposal(op_info)
+        min_amount_to_wei = await self._get_cex_min_amount_to_wei(
+            op_info, op_proposal
+        )
+
+        return await self.complete_operation_proposal(
+            operation_proposal=op_proposal,
+            slippage=op_info.slippage,
+            min_amount_to_wei=min_amount_to_wei,
+        )
 
-        first_price = await PriceUtils.get_cex_price(op_info.from_token_name)
-        second_price = await PriceUtils.get_cex_price(op_info.to_token_name)
+    async def complete_quoted_operation_proposal(
+        self,
+        operation_proposal: OperationProposal,
+        op_info: OperationInfo,
+        quote: Quote | None
+    ) -> OperationProposal:
+        """
+        Compute the minimum destination amount from the on-chain quote of the route.
+        Uses prices from CEX if the route was not quoted.
+
+        Args:
+            - `operation_proposal` (OperationProposal): The inited operation proposal.
+            - `op_info` (OperationInfo): The operation information.
+            - `quote` (Quote | None): The best quote of the route.
 
-        min_amount_to_wei = op_proposal.amount_from.Wei \
-            * first_price / second_price
+        Returns:
+            - `OperationProposal`: The operation proposal.
+        """
+        if quote:
+            min_amount_to_wei = int(quote.amount_out * (1 - op_info.slippage / 100))
+        else:
+            min_amount_to_wei = await self._get_cex_min_amount_to_wei(
+                op_info, operation_proposal
+            )
 
         return await self.complete_operation_proposal(
-            operation_proposal=op_proposal,
+            operation_proposal=operation_proposal,
             slippage=op_info.slippage,
-            min_to_amount=min_amount_to_wei,
+            min_amount_to_wei=min_amount_to_wei,
         )
 
+    async def _get_cex_min_amount_to_wei(
+        self,
+        op_info: OperationInfo,
+        operation_proposal: OperationProposal
+    ) -> int:
+        cross_rate = await PriceUtils.get_cross_rate(
+            op_info.from_token_name, op_info.to_token_name
+        )
+        to_decimals = await self.client.contract.get_decimals(
+            operation_proposal.to_token
+        )
+        # the amount is converted from the decimals of from_token to the ones of to_token
+        amount_to_wei = (
+            operation_proposal.amount_from.Wei
+            * cross_rate
+            * 10 ** (to_decimals - operation_proposal.amount_from.decimals)
+        )
+
+        return int(amount_to_wei * (1 - op_info.slippage / 100))
+
     async def init_operation_proposal(
         self,
         operation_info: OperationInfo
@@ -0,0 +1,248 @@
+import asyncio
+import math
+import time
+from array import array
+
+from curl_cffi.requests import AsyncSession
+
+from src._types.tokens import TokenSymbol
+from src.libs.async_eth_lib.data.token_contracts import ContractsFactory
+
+
+def normalize_price_symbol(token_symbol: str) -> str:
+    """
+    Convert a token symbol to the ticker used by price sources.
+
+    Args:
+        token_symbol (str): The token symbol, e.g. `WETH`, `USDC_E`, `BTC_B`.
+
+    Returns:
+        str: The ticker symbol, e.g. `ETH`, `USDC`, `BTC`.
+    """
+    token_symbol = token_symbol.upper()
+    if len(token_symbol) > 2:
+        token_symbol = token_symbol.lstrip('W')
+
+    return token_symbol.split('_')[0]
+
+
+# region Price snapshot
+class PriceSnapshot:
+    """
+    Background engine keeping USD prices of all tracked tokens in memory.
+
+    The full Binance ticker list is pulled in one request at a fixed cadence and
+    filtered to the tracked symbols. Symbols missing on Binance are requested in one
+    batch from CryptoCompare. Prices are stored in a compact array indexed by token id,
+    so that any cross rate is a constant-time lookup.
+
+    Example of use:
+    >>> await price_snapshot.start()
+    >>> rate = price_snapshot.get_cross_rate(TokenSymbol.ETH, TokenSymbol.USDC)
+    """
+    BINANCE_TICKERS_URL = 'https://api.binance.com/api/v3/ticker/price'
+    CRYPTOCOMPARE_MULTI_URL = 'https://min-api.cryptocompare.com/data/pricemulti'
+    QUOTE_SYMBOL = 'USDT'
+    STABLES = (
+        TokenSymbol.USDT,
+        TokenSymbol.USDC,
+        TokenSymbol.USDV,
+    )
+
+    def __init__(
+        self,
+        refresh_interval: int = 30,
+        max_age: int = 120,
+    ):
+        """
+        Initialize the price snapshot.
+
+        Args:
+            refresh_interval (int): Seconds between two refreshes. Defaults to 30.
+            max_age (int): Seconds after which a snapshot is considered stale. Defaults to 120.
+        """
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+
+        self._token_ids = self._build_token_ids()
+        self._symbols = list(self._token_ids)
+        self._prices = array('d', [math.nan] * len(self._symbols))
+        self._updated_at = 0.0
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def _build_token_ids() -> dict[str, int]:
+        symbols: list[str] = [token_symbol.value for token_symbol in TokenSymbol]
+        for token_contracts in ContractsFactory.get_supported_networks().values():
+            symbols.extend(
+                contract.title
+                for contract in token_contracts.get_all_tokens()
+                if contract.title
+            )
+
+        token_ids: dict[str, int] = {}
+        for symbol in symbols:
+            token_ids.setdefault(normalize_price_symbol(symbol), len(token_ids))
+
+        return token_ids
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self._updated_at <= self.max_age
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def ensure_running(self) -> None:
+        """Start the background refresh if it is not running yet."""
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run(), name='price_snapshot')
+
+    async def start(self) -> None:
+        """Make the first refresh and start the background refresh loop."""
+        if self.is_running:
+            return
+
+        await self.refresh()
+        self._task = asyncio.create_task(self._run(), name='price_snapshot')
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                pass
+            await asyncio.sleep(self.refresh_interval)
+
+    async def refresh(self) -> bool:
+        """
+        Pull prices of all tracked tokens and swap them into the snapshot.
+
+        Returns:
+            bool: True if at least one price was refreshed, False otherwise.
+        """
+        prices = array('d', [math.nan] * len(self._symbols))
+        for stable in self.STABLES:
+            prices[self._token_ids[normalize_price_symbol(stable)]] = 1.0
+
+        async with AsyncSession() as session:
+            await self._fill_from_binance(session, prices)
+
+            missing = [
+                symbol
+                for symbol, token_id in self._token_ids.items()
+                if math.isnan(prices[token_id])
+            ]
+            if missing:
+                await self._fill_from_cryptocompare(session, prices, missing)
+
+        if all(math.isnan(price) or price == 1.0 for price in prices):
+            return False
+
+        self._prices = prices
+        self._updated_at = time.monotonic()
+        return True
+
+    async def _fill_from_binance(
+        self,
+        session: AsyncSession,
+        prices: array
+    ) -> None:
+        try:
+            response = await session.get(self.BINANCE_TICKERS_URL)
+            if response.status_code != 200:
+                return
+            tickers: list[dict[str, str]] = response.json()
+        except Exception:
+            return
+
+        quote_length = len(self.QUOTE_SYMBOL)
+        for ticker in tickers:
+            pair = ticker['symbol']
+            if not pair.endswith(self.QUOTE_SYMBOL):
+                continue
+
+            token_id = self._token_ids.get(pair[:-quote_length])
+            if token_id is not None and math.isnan(prices[token_id]):
+                prices[token_id] = float(ticker['price'])
+
+    async def _fill_from_cryptocompare(
+        self,
+        session: AsyncSession,
+        prices: array,
+        symbols: list[str]
+    ) -> None:
+        try:
+            response = await session.get(
+                self.CRYPTOCOMPARE_MULTI_URL,
+                params={
+                    'fsyms': ','.join(symbols),
+                    'tsyms': self.QUOTE_SYMBOL
+                }
+            )
+            if response.status_code != 200:
+                return
+            result_dict: dict[str, dict[str, float]] = response.json()
+        except Exception:
+            return
+
+        for symbol, quotes in result_dict.items():
+            token_id = self._token_ids.get(symbol)
+            if token_id is not None and self.QUOTE_SYMBOL in quotes:
+                prices[token_id] = float(quotes[self.QUOTE_SYMBOL])
+
+    def get_price(self, token_symbol: str) -> float | None:
+        """
+        Get the USD price of the token from the snapshot.
+
+        Args:
+            token_symbol (str): The token symbol.
+
+        Returns:
+            float | None: The price or None if the token is untracked or the snapshot is stale.
+        """
+        token_id = self._token_ids.get(normalize_price_symbol(token_symbol))
+        if token_id is None or not self.is_fresh:
+            return None
+
+        price = self._prices[token_id]
+        return None if math.isnan(price) else price
+
+    def get_cross_rate(
+        self,
+        first_token: str,
+        second_token: str
+    ) -> float | None:
+        """
+        Get the price of the first token denominated in the second token.
+
+        Args:
+            first_token (str): The token to price.
+            second_token (str): The token to denominate the price in.
+
+        Returns:
+            float | None: The cross rate or None if it can't be computed from the snapshot.
+        """
+        first_price = self.get_price(first_token)
+        second_price = self.get_price(second_token)
+
+        if not first_price or not second_price:
+            return None
+
+        return first_price / second_price
+
+
+price_snapshot = PriceSnapshot()
+# endregion Price snapshot
@@ -0,0 +1,138 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from src.libs.async_eth_lib.architecture.client import EvmClient
+from src.libs.async_eth_lib.architecture.multicall import MulticallCall
+from src.libs.async_eth_lib.models.operation import TxPayloadDetails
+
+
+def get_first_value(result: tuple) -> int:
+    return result[0]
+
+
+def get_last_amount(result: tuple) -> int:
+    return result[0][-1]
+
+
+# region Quotes
+@dataclass
+class QuoteCandidate:
+    """
+    A route and the way to quote it on-chain.
+
+    Attributes:
+        tx_payload_details (TxPayloadDetails): The route to quote.
+        call (MulticallCall | None): The read-only quote call batched through Multicall3.
+        simulate (Callable[[], Awaitable[tuple]] | None): The coroutine factory simulating
+            the swap, for routers without a quote function callable by Multicall3.
+        parse_amount_out (Callable[[tuple], int]): Gets the output amount from the decoded result.
+    """
+    tx_payload_details: TxPayloadDetails
+    call: MulticallCall | None = None
+    simulate: Callable[[], Awaitable[tuple]] | None = None
+    parse_amount_out: Callable[[tuple], int] = field(default=get_first_value)
+
+
+@dataclass
+class Quote:
+    tx_payload_details: TxPayloadDetails
+    amount_out: int
+    result: tuple[Any, ...]
+
+
+class DexQuoter:
+    """
+    Quotes all candidate routes at once and picks the one with the best output.
+
+    Multicall candidates are sent in one `eth_call`, simulated candidates run
+    concurrently with it. Candidates not answered within the deadline are ignored.
+    """
+    DEADLINE = 3
+
+    @staticmethod
+    async def get_best_quote(
+        client: EvmClient,
+        candidates: list[QuoteCandidate],
+        deadline: float = DEADLINE
+    ) -> Quote | None:
+        """
+        Get the best quote among the candidates.
+
+        Args:
+            client (EvmClient): The client of the network with the routers.
+            candidates (list[QuoteCandidate]): The candidate routes.
+            deadline (float): Seconds to wait for quotes.
+
+        Returns:
+            Quote | None: The best quote or None if no candidate was quoted in time.
+        """
+        batched = [candidate for candidate in candidates if candidate.call]
+        simulated = [candidate for candidate in candidates if candidate.simulate]
+
+        tasks = [
+            asyncio.create_task(
+                DexQuoter._quote_batched(client, batched)
+            ),
+            *(
+                asyncio.create_task(
+                    DexQuoter._quote_simulated(candidate)
+                )
+                for candidate in simulated
+            )
+        ]
+
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in pending:
+            task.cancel()
+
+        quotes: list[Quote] = []
+        for task in done:
+            if task.exception():
+                continue
+            quotes.extend(task.result())
+
+        return max(quotes, key=lambda quote: quote.amount_out, default=None)
+
+    @staticmethod
+    async def _quote_batched(
+        client: EvmClient,
+        candidates: list[QuoteCandidate]
+    ) -> list[Quote]:
+        results = await client.multicall.aggregate(
+            [candidate.call for candidate in candidates]
+        )
+
+        return [
+            quote
+            for candidate, result in zip(candidates, results)
+            if (quote := DexQuoter._create_quote(candidate, result))
+        ]
+
+    @staticmethod
+    async def _quote_simulated(candidate: QuoteCandidate) -> list[Quote]:
+        quote = DexQuoter._create_quote(candidate, await candidate.simulate())
+        return [quote] if quote else []
+
+    @staticmethod
+    def _create_quote(
+        candidate: QuoteCandidate,
+        result: tuple | None
+    ) -> Quote | None:
+        if result is None:
+            return None
+
+        try:
+            amount_out = candidate.parse_amount_out(result)
+        except Exception:
+            return None
+
+        if not amount_out:
+            return None
+
+        return Quote(
+            tx_payload_details=candidate.tx_payload_details,
+            amount_out=amount_out,
+            result=result
+        )
+# endregion Quotes
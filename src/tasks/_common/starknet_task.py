@@ -1,13 +1,52 @@
+import asyncio
+
+from aiohttp import ClientConnectionError, ClientConnectorError
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import Call, TransactionReceipt
+from starknet_py.net.models.transaction import Invoke
+
+from src.helpers.retry import ErrorKind, RetryPolicy
 from src.libs.async_starknet_lib.data.token_contracts import StarknetTokenContracts
+from src.libs.async_starknet_lib.models.exceptions import TransactionNotSent
 from src.libs.async_starknet_lib.models.operation import (
     OperationInfo, OperationProposal
 )
-from src.libs.async_starknet_lib.models.others import TokenAmount
+from src.libs.async_starknet_lib.models.others import LogStatus, TokenAmount
 from src.libs.async_starknet_lib.architecture.client import StarknetClient
+from src.libs.async_starknet_lib.architecture.execute_bundler import StarknetExecuteBundler
+from src.libs.async_starknet_lib.architecture.http_client import batch_call
+from src.libs.async_starknet_lib.architecture.tx_watcher import tx_watchers
 from src.tasks._common.utils import PriceUtils
 
 
+def is_ambiguous_send_error(error: BaseException) -> bool:
+    """Check whether the node may have received the transaction before the error, e.g. on a timeout."""
+    return (
+        isinstance(error, (ClientConnectionError, asyncio.TimeoutError))
+        and not isinstance(error, ClientConnectorError)
+    )
+
+
+def classify_execute_error(error: BaseException) -> ErrorKind:
+    # connecting failed, so nothing was written
+    if isinstance(error, ClientConnectorError):
+        return ErrorKind.RETRYABLE
+    # retried by resending the same signed transaction once its status is checked
+    if is_ambiguous_send_error(error):
+        return ErrorKind.RETRYABLE
+    if isinstance(error, ClientError) and 'nonce' in error.message.lower():
+        return ErrorKind.RETRYABLE
+    return ErrorKind.FATAL
+
+
 class StarknetTask:
+    EXECUTE_RETRY_POLICY = RetryPolicy(
+        max_attempts=3,
+        base_delay=5,
+        max_delay=30,
+        classify=classify_execute_error
+    )
+
     def __init__(self, client: StarknetClient):
         self.client = client
 
@@ -26,11 +65,11 @@ class StarknetTask:
         """
         swap_proposal = await self.init_operation_proposal(swap_info)
 
-        first_price = await PriceUtils.get_cex_price(swap_info.from_token_name)
-        second_price = await PriceUtils.get_cex_price(swap_info.to_token_name)
+        cross_rate = await PriceUtils.get_cross_rate(
+            swap_info.from_token_name, swap_info.to_token_name
+        )
 
-        min_amount_to_wei = swap_proposal.amount_from.Wei \
-            * first_price / second_price
+        min_amount_to_wei = swap_proposal.amount_from.Wei * cross_rate
 
         return await self.complete_operation_proposal(
             operation_proposal=swap_proposal,
@@ -60,11 +99,20 @@ class StarknetTask:
             )
         )
 
-        if from_token.is_native_token:
-            balance_wei = await self.client.account.get_balance()
-            decimals = self.client.network_decimals
-        else:
-            balance_wei = await self.client.account.get_balance(from_token.address)
+        # one batch for the balance and the decimals of both tokens, the decimals of
+        # the destination token are cached in its contract for `complete_operation_proposal`
+        snapshot = await self.client.reader.read_tokens(
+            accounts=[self.client.account.address],
+            tokens=[from_token, to_token]
+        )
+        balance_wei = snapshot.balances[0][0]
+        decimals = snapshot.decimals[0]
+
+        if balance_wei is None:
+            balance_wei = await self.client.account.get_balance(
+                None if from_token.is_native_token else from_token.address
+            )
+        if decimals is None:
             decimals = await self.client.contract.get_decimals(from_token)
 
         if op_info.amount:
@@ -117,4 +165,111 @@ class StarknetTask:
         )
         
         operation_proposal.min_amount_to = min_amount_to
-        return operation_proposal
\ No newline at end of file
+        return operation_proposal
+
+    async def execute_calls(
+        self,
+        calls: list[Call]
+    ) -> TransactionReceipt:
+        """
+        Execute the calls in one transaction and wait for its receipt.
+
+        If the client has a `bundle_window`, the calls are executed by the bundler of the
+        wallet together with the other operations planned within the window.
+
+        Args:
+            - `calls` (list[Call]): The calls to execute.
+
+        Returns:
+            - `TransactionReceipt`: The receipt of the transaction.
+        """
+        if self.client.bundle_window:
+            if not self.client.bundler:
+                self.client.bundler = StarknetExecuteBundler(
+                    send=self.send_calls,
+                    wait=self.wait_for_tx,
+                    window=self.client.bundle_window,
+                    custom_logger=self.client.custom_logger
+                )
+            return await self.client.bundler.execute(
+                calls=calls,
+                name=type(self).__name__
+            )
+
+        return await self.wait_for_tx(await self.send_calls(calls))
+
+    async def send_calls(
+        self,
+        calls: list[Call],
+        use_cached_fee: bool = True
+    ) -> int:
+        """
+        Send the calls in one transaction.
+
+        The transaction is signed off the event loop by `signing_service`. Sending is retried
+        by `EXECUTE_RETRY_POLICY` on connection errors and nonce races, other errors are
+        raised immediately. Only errors raised before the request was written make a new
+        transaction with a fresh nonce. After a timeout or a dropped connection the node
+        may have received the transaction, so its hash is checked and the same signed
+        transaction is resent only if the node does not know it.
+
+        Args:
+            - `calls` (list[Call]): The calls to execute.
+            - `use_cached_fee` (bool): Whether a cached fee estimate may be used instead of simulating.
+
+        Returns:
+            - `int`: The hash of the transaction.
+
+        Raises:
+            - `TransactionNotSent`: If the transaction failed before it could reach the node.
+        """
+        transaction: Invoke | None = None
+        is_ambiguous = False
+
+        async def send() -> int:
+            nonlocal transaction, is_ambiguous
+
+            if transaction and is_ambiguous:
+                tx_hash = transaction.calculate_hash(self.client.CHAIN_ID)
+                if await self._is_tx_received(tx_hash):
+                    return tx_hash
+            else:
+                transaction = await self.client.sign_invoke(
+                    calls=calls, use_cached_fee=use_cached_fee
+                )
+
+            try:
+                response = await self.client.node_client.send_transaction(transaction)
+            except Exception as error:
+                is_ambiguous = is_ambiguous or is_ambiguous_send_error(error)
+                raise
+            return response.transaction_hash
+
+        try:
+            return await self.EXECUTE_RETRY_POLICY.run(
+                send,
+                on_retry=lambda attempt, error, delay: self.client.custom_logger.log_message(
+                    status=LogStatus.WARNING,
+                    message=(
+                        f'Failed to send transaction: {error}. '
+                        f'Will try again in {round(delay)} sec'
+                    )
+                )
+            )
+        except Exception as error:
+            if is_ambiguous:
+                raise
+            raise TransactionNotSent(str(error)) from error
+
+    async def _is_tx_received(self, tx_hash: int) -> bool:
+        [response] = await batch_call(
+            client=self.client.node_client,
+            method_name='getTransactionStatus',
+            params_list=[{'transaction_hash': hex(tx_hash)}]
+        )
+        status = response.get('result')
+        return bool(status) and status.get('finality_status') != 'NOT_RECEIVED'
+
+    async def wait_for_tx(self, tx_hash: int) -> TransactionReceipt:
+        """Wait for the receipt through the shared `tx_watchers`."""
+        return await tx_watchers.wait_for_tx(self.client.node_client, tx_hash)
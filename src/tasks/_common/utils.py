@@ -1,14 +1,18 @@
 import asyncio
 import random
 from dataclasses import dataclass
-from typing import Union, Any
+from typing import Any, Awaitable, Callable, Union
 
 from curl_cffi.requests import AsyncSession
 
+from src.helpers.metrics import LatencyHistogram
 from src.libs.async_eth_lib.architecture.client import EvmClient
 from src.libs.async_eth_lib.data.token_contracts import ContractsFactory
+from src.libs.async_eth_lib.models.contract import NativeTokenContract, TokenContract
 from src.libs.async_eth_lib.models.others import LogStatus, TokenAmount, TokenSymbol
 from src.libs.async_eth_lib.models.operation import OperationInfo
+from src.tasks._common.balance_discovery import BalanceDiscovery
+from src.tasks._common.price_snapshot import price_snapshot
 
 
 @dataclass
@@ -52,6 +56,43 @@ class PriceUtils:
         TokenSymbol.USDC_E,
         TokenSymbol.USDV
     ]
+    PRICE_TIMEOUT = 10
+    HEDGE_PERCENTILE = 0.95
+    PRICE_LATENCIES = {
+        'binance': LatencyHistogram(),
+        'cryptocompare': LatencyHistogram(),
+    }
+
+    @staticmethod
+    async def get_cross_rate(
+        first_token: str,
+        second_token: str
+    ) -> float:
+        """
+        Get the price of the first token denominated in the second token.
+
+        The rate is taken from the background price snapshot. If the snapshot
+        can't serve it, both prices are requested from CEX.
+
+        Args:
+            first_token (str): The token to price.
+            second_token (str): The token to denominate the price in.
+
+        Returns:
+            float: The cross rate.
+        """
+        price_snapshot.ensure_running()
+
+        rate = price_snapshot.get_cross_rate(first_token, second_token)
+        if rate:
+            return rate
+
+        first_price, second_price = await asyncio.gather(
+            PriceUtils.get_cex_price(first_token),
+            PriceUtils.get_cex_price(second_token)
+        )
+
+        return first_price / second_price
 
     @staticmethod
     async def get_cex_price(
@@ -73,21 +114,102 @@ class PriceUtils:
             return 1.0
 
         async with AsyncSession() as session:
-            tasks = [
-                PriceUtils._get_price_from_binance(
-                    session, first_token, second_token),
-                PriceUtils._get_price_from_cryptocompare(
-                    session, first_token, second_token)
-            ]
-
-            for price in await asyncio.gather(*tasks, return_exceptions=True):
-                if isinstance(price, float):
-                    return price
+            try:
+                price = await asyncio.wait_for(
+                    PriceUtils._get_hedged_price(session, first_token, second_token),
+                    timeout=PriceUtils.PRICE_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                price = None
 
+        if price is None:
             raise ValueError(
                 f'Could not get {first_token}{second_token} price from Binance or Cryptocompare'
             )
 
+        return price
+
+    @staticmethod
+    async def _get_hedged_price(
+        session: AsyncSession,
+        first_token: str,
+        second_token: str
+    ) -> float | None:
+        """
+        Request the price from the sources in order and take the first valid one.
+
+        The next source is started only when the previous one fails or does not answer
+        within its latency percentile. Requests still running after a valid price
+        is received are cancelled.
+
+        Args:
+            session (AsyncSession): The session for requests.
+            first_token (str): The token to price.
+            second_token (str): The token to denominate the price in.
+
+        Returns:
+            float | None: The price or None if no source returned it.
+        """
+        sources = [
+            ('binance', PriceUtils._get_price_from_binance),
+            ('cryptocompare', PriceUtils._get_price_from_cryptocompare),
+        ]
+        loop = asyncio.get_running_loop()
+        pending: set[asyncio.Task] = set()
+
+        try:
+            for index, (source, fetcher) in enumerate(sources):
+                pending.add(asyncio.create_task(
+                    PriceUtils._get_timed_price(
+                        source, fetcher, session, first_token, second_token
+                    )
+                ))
+
+                is_last_source = index == len(sources) - 1
+                deadline = None if is_last_source else (
+                    loop.time()
+                    + PriceUtils.PRICE_LATENCIES[source].percentile(
+                        PriceUtils.HEDGE_PERCENTILE
+                    )
+                )
+
+                while pending:
+                    timeout = None if deadline is None else max(0, deadline - loop.time())
+                    done, pending = await asyncio.wait(
+                        pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not done:
+                        break
+
+                    for task in done:
+                        price = task.result()
+                        if price:
+                            return price
+
+                    if not is_last_source:
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return None
+
+    @staticmethod
+    async def _get_timed_price(
+        source: str,
+        fetcher: Callable[[AsyncSession, str, str], Awaitable[float | None]],
+        session: AsyncSession,
+        first_token: str,
+        second_token: str
+    ) -> float | None:
+        try:
+            with PriceUtils.PRICE_LATENCIES[source].measure():
+                return await fetcher(session, first_token, second_token)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return None
+
     @staticmethod
     async def _get_price_from_binance(
         session: AsyncSession,
@@ -95,17 +217,15 @@ class PriceUtils:
         second_token: str
     ) -> float | None:
         first_token, second_token = first_token.upper(), second_token.upper()
-        for _ in range(5):
-            try:
-                response = await session.get(
-                    f'https://api.binance.com/api/v3/ticker/price?symbol={first_token}{second_token}')
-                if response.status_code == 200:
-                    result_dict = response.json()
-                    if 'price' in result_dict:
-                        return float(result_dict['price'])
-                return None
-            except Exception:
-                await asyncio.sleep(1)
+        response = await session.get(
+            f'https://api.binance.com/api/v3/ticker/price?symbol={first_token}{second_token}',
+            timeout=PriceUtils.PRICE_TIMEOUT
+        )
+        if response.status_code == 200:
+            result_dict = response.json()
+            if 'price' in result_dict:
+                return float(result_dict['price'])
+        return None
 
     @staticmethod
     async def _get_price_from_cryptocompare(
@@ -114,17 +234,14 @@ class PriceUtils:
         second_token: str
     ) -> float | None:
         first_token, second_token = first_token.upper(), second_token.upper()
-        for _ in range(5):
-            try:
-                response = await session.get(
-                    f'https://min-api.cryptocompare.com/data/price?fsym={first_token}&tsyms={second_token}'
-                )
-                if response.status_code == 200:
-                    result_dict = response.json()
-                    return float(result_dict[second_token])
-                return None
-            except Exception:
-                await asyncio.sleep(1)
+        response = await session.get(
+            f'https://min-api.cryptocompare.com/data/price?fsym={first_token}&tsyms={second_token}',
+            timeout=PriceUtils.PRICE_TIMEOUT
+        )
+        if response.status_code == 200:
+            result_dict = response.json()
+            return float(result_dict[second_token])
+        return None
 # endregion To get prices
 
 
@@ -214,68 +331,129 @@ class StandardSettings:
 # region RandomChoice
 class RandomChoiceHelper:
     '''To get random token from available options for operation'''
+    @staticmethod
+    async def find_partial_operation_info_and_dst_data(
+        op_data: dict[str, dict[str, list[Any]]],
+        op_settings: StandardSettings,
+        client: EvmClient,
+    ) -> tuple[EvmClient | None, OperationInfo | None, list | None]:
+        """
+        Find a random network and token with enough balance for the operation.
+
+        Balances of all networks are fetched concurrently, then networks and tokens
+        are checked in a random order, as if they were requested one by one.
+
+        Args:
+            - `op_data` (dict[str, dict[str, list[Any]]]): The destination data by network and source token.
+            - `op_settings` (StandardSettings): The settings of the operation.
+            - `client` (EvmClient): The client of the wallet.
+
+        Returns:
+            - `tuple[EvmClient | None, OperationInfo | None, list | None]`: The client of the found network,
+                the partial operation info and the destination data.
+        """
+        random_networks = list(op_data)
+        random.shuffle(random_networks)
+
+        balances = await BalanceDiscovery.get_balances(
+            client=client,
+            tokens_by_network={
+                network_name: list(op_data[network_name])
+                for network_name in random_networks
+            }
+        )
+
+        for network_name in random_networks:
+            if network_name not in balances:
+                continue
+
+            partial_op, dst_data = RandomChoiceHelper.choose_partial_operation_info_and_dst_data(
+                network_name=network_name,
+                op_data=op_data[network_name],
+                op_settings=op_settings,
+                balances=balances[network_name]
+            )
+
+            if partial_op:
+                network_client = EvmClient(
+                    account_id=client.account_id,
+                    private_key=client.account._private_key,
+                    network_name=network_name,
+                    proxy=client.proxy
+                )
+                RandomChoiceHelper._log_found_balance(
+                    network_client, partial_op, op_settings
+                )
+                return network_client, partial_op, dst_data
+
+        return None, None, None
+
     @staticmethod
     async def get_partial_operation_info_and_dst_data(
         op_data: dict[str, dict[str, list[Any]]],
         op_settings: StandardSettings,
         client: EvmClient,
     ) -> tuple[OperationInfo | None, list | None]:
-        tokens_dict = list(op_data[client.network.name].keys())
-        random.shuffle(tokens_dict)
+        network_op_data = op_data[client.network.name]
+        balances = await BalanceDiscovery.get_network_balances(
+            client=client,
+            token_names=list(network_op_data)
+        )
 
-        partial_op = dst_data = None
+        partial_op, dst_data = RandomChoiceHelper.choose_partial_operation_info_and_dst_data(
+            network_name=client.network.name,
+            op_data=network_op_data,
+            op_settings=op_settings,
+            balances=balances
+        )
+
+        if partial_op:
+            RandomChoiceHelper._log_found_balance(client, partial_op, op_settings)
+
+        return partial_op, dst_data
+
+    @staticmethod
+    def choose_partial_operation_info_and_dst_data(
+        network_name: str,
+        op_data: dict[str, list[Any]],
+        op_settings: StandardSettings,
+        balances: dict[str, TokenAmount],
+    ) -> tuple[OperationInfo | None, list | None]:
+        tokens_dict = list(op_data.keys())
+        random.shuffle(tokens_dict)
 
         for src_token_sym in tokens_dict:
-            partial_op = await RandomChoiceHelper.get_partial_operation_info(
+            if src_token_sym not in balances:
+                continue
+
+            partial_op = RandomChoiceHelper.get_partial_operation_info(
+                token_contract=ContractsFactory.get_contract(
+                    network_name, src_token_sym
+                ),
                 token_name=src_token_sym,
                 op_settings=op_settings,
-                client=client
+                balance=balances[src_token_sym]
             )
 
             if partial_op:
-                dst_data = op_data[client.network.name][partial_op.from_token_name]
-
-                client.custom_logger.log_message(
-                    status=LogStatus.INFO,
-                    message=(
-                        f'Found {partial_op.amount} {partial_op.from_token_name}'
-                        f' in {client.network.name} for {op_settings.action_name}()'
-                    ),
-                    call_depth_or_custom_call_place=2
-                )
-                break
+                return partial_op, op_data[partial_op.from_token_name]
 
-        return partial_op, dst_data
+        return None, None
 
     @staticmethod
-    async def get_partial_operation_info(
+    def get_partial_operation_info(
+        token_contract: TokenContract | NativeTokenContract,
         token_name: str,
         op_settings: StandardSettings,
-        client: EvmClient,
+        balance: TokenAmount,
     ) -> OperationInfo | None:
-        token_contract = ContractsFactory.get_contract(
-            client.network.name, token_name
-        )
-
         if token_contract.is_native_token:
-            balance_wei = await client.contract.get_balance()
-            decimals = client.network.decimals
-
             amount_setting = op_settings.eth_amount
             amount_percent_setting = op_settings.eth_amount_percent
         else:
-            balance_wei = await client.contract.get_balance(token_contract.address)
-            decimals = await client.contract.get_decimals(token_contract)
-
             amount_setting = op_settings.token_amount
             amount_percent_setting = op_settings.token_amount_percent
 
-        balance = TokenAmount(
-            amount=balance_wei,
-            decimals=decimals,
-            wei=True
-        )
-
         if amount_setting and float(balance.Ether) > amount_setting.from_:
             amount_setting.to_ = min(float(balance.Ether), amount_setting.to_)
 
@@ -294,4 +472,19 @@ class RandomChoiceHelper:
             return op_info
 
         return None
+
+    @staticmethod
+    def _log_found_balance(
+        client: EvmClient,
+        partial_op: OperationInfo,
+        op_settings: StandardSettings,
+    ) -> None:
+        client.custom_logger.log_message(
+            status=LogStatus.INFO,
+            message=(
+                f'Found {partial_op.amount} {partial_op.from_token_name}'
+                f' in {client.network.name} for {op_settings.action_name}()'
+            ),
+            call_depth_or_custom_call_place=3
+        )
 # endregion RandomChoice
@@ -5,6 +5,7 @@ from web3.types import TxParams
 from eth_abi import abi
 
 from _types.networks import NetworkNames
+from src.helpers.retry import ErrorKind, RetryPolicy
 from src.helpers.time_functions import sleep
 from src.libs.async_eth_lib.architecture.client import EvmClient
 from src.libs.async_eth_lib.data.token_contracts import TokenContractData
@@ -23,6 +24,17 @@ from .constants import (
 )
 
 
+SLIPPAGE_RETRY_POLICY = RetryPolicy(
+    max_attempts=3,
+    base_delay=5,
+    classify=lambda error: (
+        ErrorKind.ADJUST
+        if isinstance(error, web3_exceptions.ContractCustomError)
+        else ErrorKind.FATAL
+    )
+)
+
+
 # region Implementation
 class CoreDaoBridgeImplementation(EvmTask):
     def __init__(self, client: EvmClient):
@@ -34,6 +46,31 @@ class CoreDaoBridgeImplementation(EvmTask):
         bridge_info: OperationInfo,
         max_fee: float = 0.7,
     ) -> str:
+        def increase_slippage(attempt: int, error: BaseException) -> None:
+            self.client.custom_logger.log_message(
+                status=LogStatus.ERROR,
+                message='Failed to bridge, trying to make slippage more...'
+            )
+            bridge_info.slippage *= 1.2
+
+        try:
+            return await SLIPPAGE_RETRY_POLICY.run(
+                lambda: self._bridge(bridge_info, max_fee),
+                on_adjust=increase_slippage
+            )
+        except web3_exceptions.ContractCustomError as e:
+            self.client.custom_logger.log_message(
+                status=LogStatus.ERROR,
+                message=f'Failed to bridge with slippage {bridge_info.slippage}%: {e}'
+            )
+            return False
+
+    async def _bridge(
+        self,
+        bridge_info: OperationInfo,
+        max_fee: float
+    ) -> str:
+        is_result = False
         from_network_name = self.client.network.name
         to_network_name = bridge_info.to_network_name
 
@@ -132,13 +169,8 @@ class CoreDaoBridgeImplementation(EvmTask):
                 f'{bridge_info.to_token_name} in {to_network_name}: '
                 f'https://layerzeroscan.com/tx/{tx.hash.hex()}'
             )
-        except web3_exceptions.ContractCustomError as e:
-            self.client.custom_logger.log_message(
-                status=LogStatus.ERROR,
-                message='Failed to bridge, trying to make slippage more...'
-            )
-            bridge_info.slippage *= 1.2
-            return await self.bridge(bridge_info)
+        except web3_exceptions.ContractCustomError:
+            raise
         except Exception as e:
             status = LogStatus.ERROR
             message = str(e)
@@ -249,30 +281,16 @@ class CoreDaoBridge(EvmTask):
         settings = CoreDaoBridgeSettings()
         bridge_routes = get_coredao_bridge_routes()
 
-        random_networks = list(bridge_routes)
-        random.shuffle(random_networks)
-
         self.client.custom_logger.log_message(
             status=LogStatus.INFO,
             message='Started to search enough balance for bridge'
         )
- 
-        for network_name in random_networks:
-            client = EvmClient(
-                account_id=self.client.account_id,
-                private_key=self.client.account._private_key,
-                network_name=network_name,
-                proxy=self.client.proxy
-            )
 
-            (operation_info, dst_data) = await RandomChoiceHelper.get_partial_operation_info_and_dst_data(
-                op_data=bridge_routes,
-                op_settings=settings.bridge,
-                client=client
-            )
-
-            if operation_info:
-                break
+        (client, operation_info, dst_data) = await RandomChoiceHelper.find_partial_operation_info_and_dst_data(
+            op_data=bridge_routes,
+            op_settings=settings.bridge,
+            client=self.client
+        )
 
         if not dst_data:
             self.client.custom_logger.log_message(
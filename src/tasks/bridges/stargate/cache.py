@@ -0,0 +1,355 @@
+import asyncio
+import json
+import os
+import time
+from typing import Any, Awaitable, Callable
+
+from src._types.tokens import TokenSymbol
+from src.libs.async_eth_lib.architecture.client import EvmClient
+from src.libs.async_eth_lib.data.token_contracts import TokenContractData
+from src.libs.async_eth_lib.models.params_types import Web3ContractType
+from src.libs.async_eth_lib.models.transaction import TxArgs
+from src.libs.async_eth_lib.utils.helpers import join_path
+
+from .constants import (
+    L0_IDS,
+    StargateABIs,
+    StargateData,
+    get_stargate_routes
+)
+
+
+# region Metadata cache
+class StargateMetadataCache:
+    """
+    Cache of Stargate router metadata and LayerZero fee quotes.
+
+    Router addresses and destination gas limits almost never change, so they are
+    resolved on-chain once and persisted on disk. Fee quotes are kept in memory for
+    the current window of `block_window` blocks (and not longer than `quote_ttl` seconds)
+    and are shared by all wallets. The background refresh re-quotes the whole
+    (src, dst) matrix from `get_stargate_routes`, so bridges usually hit a warm cache.
+
+    Example of use:
+    >>> stargate_cache.ensure_refreshing()
+    >>> router_address = await stargate_cache.get_router_address(client, router_contract)
+    """
+    PATH = ['user_data', '_outputs', 'stargate_metadata.json']
+
+    def __init__(
+        self,
+        path: list[str] = PATH,
+        block_window: int = 20,
+        quote_ttl: int = 60,
+        block_number_ttl: int = 5,
+        refresh_interval: int = 45,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path (list[str]): The path of the file with persisted metadata.
+            block_window (int): The number of blocks a fee quote is valid for. Defaults to 20.
+            quote_ttl (int): Seconds after which a fee quote is stale in any case. Defaults to 60.
+            block_number_ttl (int): Seconds a fetched block number is reused for. Defaults to 5.
+            refresh_interval (int): Seconds between two background refreshes. Defaults to 45.
+        """
+        self.path = join_path(path)
+        self.block_window = block_window
+        self.quote_ttl = quote_ttl
+        self.block_number_ttl = block_number_ttl
+        self.refresh_interval = refresh_interval
+
+        self._metadata: dict[str, Any] | None = None
+        self._fees: dict[tuple, tuple[int, float, Any]] = {}
+        self._block_numbers: dict[str, tuple[float, int]] = {}
+        self._pending: dict[tuple | str, asyncio.Future] = {}
+        self._task: asyncio.Task | None = None
+
+    # region Metadata
+    async def get_router_address(
+        self,
+        client: EvmClient,
+        router_eth_contract: Web3ContractType
+    ) -> str:
+        return await self.get_metadata(
+            client=client,
+            key=f'{router_eth_contract.address}:stargateRouter',
+            fetch=router_eth_contract.functions.stargateRouter().call
+        )
+
+    async def get_messaging_address(
+        self,
+        client: EvmClient,
+        router_contract: Web3ContractType
+    ) -> str:
+        return await self.get_metadata(
+            client=client,
+            key=f'{router_contract.address}:getRole(3)',
+            fetch=router_contract.functions.getRole(3).call
+        )
+
+    async def get_min_dst_gas(
+        self,
+        client: EvmClient,
+        msg_contract: Web3ContractType,
+        dst_chain_id: int
+    ) -> int:
+        return await self.get_metadata(
+            client=client,
+            key=f'{msg_contract.address}:minDstGasLookup({dst_chain_id},1)',
+            fetch=msg_contract.functions.minDstGasLookup(dst_chain_id, 1).call
+        )
+
+    async def get_metadata(
+        self,
+        client: EvmClient,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Get the immutable value from the disk cache or fetch it on-chain and persist it.
+
+        Args:
+            client (EvmClient): The client of the network with the contract.
+            key (str): The key of the value in the network.
+            fetch (Callable[[], Awaitable[Any]]): The coroutine function fetching the value.
+
+        Returns:
+            Any: The value.
+        """
+        metadata = self._load()
+        full_key = f'{client.network.name}:{key}'
+
+        if full_key not in metadata:
+            metadata[full_key] = await self._run_once(full_key, fetch)
+            self._save()
+
+        return metadata[full_key]
+
+    def _load(self) -> dict[str, Any]:
+        if self._metadata is None:
+            try:
+                with open(self.path) as file:
+                    self._metadata = json.load(file)
+            except (OSError, ValueError):
+                self._metadata = {}
+
+        return self._metadata
+
+    def _save(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w') as file:
+                json.dump(self._metadata, file, indent=4)
+        except OSError:
+            pass
+    # endregion Metadata
+
+    # region Fees
+    async def get_layer_zero_fee(
+        self,
+        client: EvmClient,
+        router_contract: Web3ContractType,
+        dst_chain_id: int,
+        lz_tx_params: TxArgs
+    ) -> tuple[int, int]:
+        """
+        Get the cached `quoteLayerZeroFee` result for the route.
+
+        Args:
+            client (EvmClient): The client of the source network.
+            router_contract (Web3ContractType): The Stargate router.
+            dst_chain_id (int): The LayerZero id of the destination network.
+            lz_tx_params (TxArgs): The LayerZero tx params.
+
+        Returns:
+            tuple[int, int]: The native and ZRO fee.
+        """
+        params = lz_tx_params.get_list()
+
+        return await self.get_fee(
+            client=client,
+            key=(
+                'quoteLayerZeroFee',
+                router_contract.address,
+                dst_chain_id,
+                params[0],
+                params[1]
+            ),
+            quote=router_contract.functions.quoteLayerZeroFee(
+                dst_chain_id,
+                1,
+                client.account.address,
+                '0x',
+                params
+            ).call
+        )
+
+    async def get_fee(
+        self,
+        client: EvmClient,
+        key: tuple,
+        quote: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Get the fee quote cached for the current block window or quote it.
+
+        Concurrent requests of the same quote share one RPC call.
+
+        Args:
+            client (EvmClient): The client of the source network.
+            key (tuple): The key of the quote in the network, without wallet-specific values.
+            quote (Callable[[], Awaitable[Any]]): The coroutine function quoting the fee.
+
+        Returns:
+            Any: The quoted fee.
+        """
+        full_key = (client.network.name, *key)
+        window = await self._get_block_window(client)
+
+        cached = self._fees.get(full_key)
+        if (
+            cached
+            and cached[0] == window
+            and time.monotonic() - cached[1] <= self.quote_ttl
+        ):
+            return cached[2]
+
+        fee = await self._run_once(full_key, quote)
+        self._fees[full_key] = (window, time.monotonic(), fee)
+        return fee
+
+    async def _get_block_window(self, client: EvmClient) -> int:
+        network_name = client.network.name
+        cached = self._block_numbers.get(network_name)
+
+        if cached and time.monotonic() - cached[0] <= self.block_number_ttl:
+            block_number = cached[1]
+        else:
+            block_number = await client.w3.eth.block_number
+            self._block_numbers[network_name] = (time.monotonic(), block_number)
+
+        return block_number // self.block_window
+
+    async def _run_once(
+        self,
+        key: tuple | str,
+        func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if key in self._pending:
+            return await asyncio.shield(self._pending[key])
+
+        future = asyncio.ensure_future(func())
+        self._pending[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self._pending.pop(key, None)
+    # endregion Fees
+
+    # region Background refresh
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def ensure_refreshing(self) -> None:
+        """Start the background refresh if it is not running yet."""
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run(), name='stargate_cache')
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                pass
+            await asyncio.sleep(self.refresh_interval)
+
+    async def refresh(self) -> None:
+        """Re-quote LayerZero fees of all v1 pool routes, networks are quoted concurrently."""
+        await asyncio.gather(
+            *(
+                self._refresh_network(network_name, routes)
+                for network_name, routes in get_stargate_routes().items()
+            ),
+            return_exceptions=True
+        )
+
+    async def _refresh_network(
+        self,
+        network_name: str,
+        routes: dict[str, list[tuple]]
+    ) -> None:
+        client = EvmClient(network_name=network_name, check_proxy=False)
+        data = StargateData()
+        lz_tx_params = TxArgs(
+            dstGasForCall=0,
+            dstNativeAmount=0,
+            dstNativeAddr=TokenContractData.ZERO_ADDRESS
+        )
+
+        for from_token, destinations in routes.items():
+            if from_token in (TokenSymbol.STG, TokenSymbol.USDV):
+                continue
+
+            for dst_network_name, to_token, _ in destinations:
+                dst_chain_id = L0_IDS['v1'].get(dst_network_name)
+                if to_token == TokenSymbol.USDV or not dst_chain_id:
+                    continue
+
+                try:
+                    router_contract = await self._get_router_contract(
+                        client=client,
+                        contract_address=data.get_contract_address(
+                            network=network_name,
+                            from_token=from_token,
+                            to_token=to_token,
+                            version='v1'
+                        ),
+                        from_token=from_token
+                    )
+                    await self.get_layer_zero_fee(
+                        client=client,
+                        router_contract=router_contract,
+                        dst_chain_id=dst_chain_id,
+                        lz_tx_params=lz_tx_params
+                    )
+                except Exception:
+                    continue
+
+    async def _get_router_contract(
+        self,
+        client: EvmClient,
+        contract_address: str,
+        from_token: str
+    ) -> Web3ContractType:
+        if from_token == TokenSymbol.ETH:
+            router_eth_contract = client.contract.get_evm_contract(
+                address=contract_address,
+                abi_or_path=StargateABIs.ROUTER_ETH_V1_ABI
+            )
+            contract_address = await self.get_router_address(
+                client, router_eth_contract
+            )
+
+        return client.contract.get_evm_contract(
+            address=contract_address,
+            abi_or_path=StargateABIs.ROUTER_V1_ABI
+        )
+    # endregion Background refresh
+
+
+stargate_cache = StargateMetadataCache()
+# endregion Metadata cache
@@ -4,6 +4,7 @@ from eth_abi import abi
 from web3.types import TxParams
 import web3.exceptions as web3_exceptions
 
+from src.helpers.retry import ErrorKind, RetryPolicy
 from src.helpers.time_functions import sleep
 from src._types.tokens import TokenSymbol
 from src.libs.async_eth_lib.architecture.client import EvmClient
@@ -16,6 +17,7 @@ from src.libs.async_eth_lib.models.transaction import TxArgs
 from src.tasks._common.evm_task import EvmTask
 from src.tasks._common.utils import HexUtils, PriceUtils, RandomChoiceHelper
 
+from .cache import stargate_cache
 from .constants import (
     L0_IDS,
     POOL_IDS,
@@ -27,6 +29,17 @@ from .constants import (
 )
 
 
+SLIPPAGE_RETRY_POLICY = RetryPolicy(
+    max_attempts=3,
+    base_delay=5,
+    classify=lambda error: (
+        ErrorKind.ADJUST
+        if isinstance(error, web3_exceptions.ContractCustomError)
+        else ErrorKind.FATAL
+    )
+)
+
+
 class StargateImplementation(EvmTask):
     def __init__(self, client: EvmClient):
         super().__init__(client)
@@ -37,6 +50,31 @@ class StargateImplementation(EvmTask):
         bridge_info: OperationInfo,
         max_fee: float = 0.7,
         dst_fee: float | TokenAmount | None = None
+    ) -> bool:
+        def increase_slippage(attempt: int, error: BaseException) -> None:
+            self.client.custom_logger.log_message(
+                status=LogStatus.ERROR,
+                message='Failed to bridge, trying to make slippage more...'
+            )
+            bridge_info.slippage *= 1.2
+
+        try:
+            return await SLIPPAGE_RETRY_POLICY.run(
+                lambda: self._bridge_v1(bridge_info, max_fee, dst_fee),
+                on_adjust=increase_slippage
+            )
+        except web3_exceptions.ContractCustomError as e:
+            self.client.custom_logger.log_message(
+                status=LogStatus.ERROR,
+                message=f'Failed to bridge V1 with slippage {bridge_info.slippage}%: {e}'
+            )
+            return False
+
+    async def _bridge_v1(
+        self,
+        bridge_info: OperationInfo,
+        max_fee: float,
+        dst_fee: float | TokenAmount | None
     ) -> bool:
         is_result = False
         bridge_proposal = await self.init_operation_proposal(bridge_info)
@@ -143,13 +181,8 @@ class StargateImplementation(EvmTask):
                 f'{bridge_info.to_token_name} in {bridge_info.to_network_name}: '
                 f'https://layerzeroscan.com/tx/{tx.hash.hex()}'
             )
-        except web3_exceptions.ContractCustomError as e:
-            self.client.custom_logger.log_message(
-                status=LogStatus.ERROR,
-                message='Failed to bridge, trying to make slippage more...'
-            )
-            bridge_info.slippage *= 1.2
-            return await self.bridge_v1(bridge_info, max_fee, dst_fee)
+        except web3_exceptions.ContractCustomError:
+            raise
         except Exception as e:
             message = str(e)
             log_status = LogStatus.ERROR
@@ -292,7 +325,9 @@ class StargateImplementation(EvmTask):
                 abi_or_path=StargateABIs.ROUTER_ETH_V1_ABI
             )
             call_contract = self.client.contract.get_evm_contract(
-                address=await router_contract.functions.stargateRouter().call(),
+                address=await stargate_cache.get_router_address(
+                    self.client, router_contract
+                ),
                 abi_or_path=StargateABIs.ROUTER_V1_ABI
             )
 
@@ -319,14 +354,15 @@ class StargateImplementation(EvmTask):
                 abi_or_path=StargateABIs.ROUTER_V1_ABI
             )
             msg_contract = self.client.contract.get_evm_contract(
-                address=await router_contract.functions.getRole(3).call(),
+                address=await stargate_cache.get_messaging_address(
+                    self.client, router_contract
+                ),
                 abi_or_path=StargateABIs.MESSAGING_V1_ABI
             )
 
-            min_gas_limit = await msg_contract.functions.minDstGasLookup(
-                dst_chain_id,
-                1
-            ).call()
+            min_gas_limit = await stargate_cache.get_min_dst_gas(
+                self.client, msg_contract, dst_chain_id
+            )
 
             adapter_params = abi.encode(
                 ["uint16", "uint64"], [1, min_gas_limit])
@@ -580,13 +616,12 @@ class StargateImplementation(EvmTask):
             )
         )
 
-        fee_wei = await router_contract.functions.quoteLayerZeroFee(
-            dst_chain_id,
-            1,
-            self.client.account.address,
-            '0x',
-            lz_tx_params.get_list()
-        ).call()
+        fee_wei = await stargate_cache.get_layer_zero_fee(
+            client=self.client,
+            router_contract=router_contract,
+            dst_chain_id=dst_chain_id,
+            lz_tx_params=lz_tx_params
+        )
 
         return fee_wei, lz_tx_params
 
@@ -597,18 +632,27 @@ class StargateImplementation(EvmTask):
         adapter_params: str,
         dst_chain_id: int,
     ) -> tuple[int, TxArgs]:
-        fee_wei = await router_contract.functions.quoteSendFee(
-            [
-                HexUtils.to_cut_hex_prefix_and_zfill(
-                    self.client.account.address),
-                bridge_proposal.amount_from.Wei,
-                bridge_proposal.min_amount_to.Wei,
+        fee_wei = await stargate_cache.get_fee(
+            client=self.client,
+            key=(
+                'quoteSendFee',
+                router_contract.address,
                 dst_chain_id,
-            ],
-            adapter_params,
-            False,
-            '0x'
-        ).call()
+                adapter_params
+            ),
+            quote=router_contract.functions.quoteSendFee(
+                [
+                    HexUtils.to_cut_hex_prefix_and_zfill(
+                        self.client.account.address),
+                    bridge_proposal.amount_from.Wei,
+                    bridge_proposal.min_amount_to.Wei,
+                    dst_chain_id,
+                ],
+                adapter_params,
+                False,
+                '0x'
+            ).call
+        )
 
         return fee_wei
 
@@ -618,31 +662,18 @@ class Stargate(EvmTask):
     async def bridge(self) -> bool:
         settings = StargateSettings()
         bridge_data = get_stargate_routes()
-
-        random_networks = list(bridge_data)
-        random.shuffle(random_networks)
+        stargate_cache.ensure_refreshing()
 
         self.client.custom_logger.log_message(
             status=LogStatus.INFO,
             message='Started to search enough balance for bridge'
         )
 
-        for network_name in random_networks:
-            client = EvmClient(
-                account_id=self.client.account_id,
-                private_key=self.client.account._private_key,
-                network_name=network_name,
-                proxy=self.client.proxy
-            )
-
-            (operation_info, dst_data) = await RandomChoiceHelper.get_partial_operation_info_and_dst_data(
-                op_data=bridge_data,
-                op_settings=settings.bridge,
-                client=client
-            )
-
-            if operation_info:
-                break
+        (client, operation_info, dst_data) = await RandomChoiceHelper.find_partial_operation_info_and_dst_data(
+            op_data=bridge_data,
+            op_settings=settings.bridge,
+            client=self.client
+        )
 
         if not dst_data:
             self.client.custom_logger.log_message(
@@ -157,26 +157,16 @@ class TestnetBridge:
         settings = TestnetBridgeSettings()
         bridge_routes = get_testnet_bridge_routes()
 
-        random_networks = list(bridge_routes.keys())
-        random.shuffle(random_networks)
-
         self.client.custom_logger.log_message(
             status=LogStatus.INFO,
             message='Started to search enough balance for bridge'
         )
-        for network in random_networks:
-            client = EvmClient(
-                account_id=self.client.account_id,
-                private_key=self.client.account._private_key,
-                network=network,
-                proxy=self.client.proxy
-            )
 
-            (operation_info, dst_data) = await RandomChoiceHelper.get_partial_operation_info_and_dst_data(
-                op_data=bridge_routes,
-                op_settings=settings.bridge,
-                client=client
-            )
+        (client, operation_info, dst_data) = await RandomChoiceHelper.find_partial_operation_info_and_dst_data(
+            op_data=bridge_routes,
+            op_settings=settings.bridge,
+            client=self.client
+        )
             
         if not dst_data:
             self.client.custom_logger.log_message(
@@ -40,17 +40,12 @@ class JediSwap(StarknetTask):
     async def swap(self, swap_info: OperationInfo):
         is_result = False
         swap_proposal = await self.create_operation_proposal(swap_info)
-        from_token_c = self.client.contract.get_starknet_contract_from_raw(
-            contract=swap_proposal.from_token
-        )
-        router_c = self.client.contract.get_starknet_contract_from_raw(
-            contract=self.__router_contract
-        )
         
-        approve_call = from_token_c.functions['approve'].prepare_call(
-            spender=self.__router_contract.address,
-            amount=swap_proposal.amount_from.Wei
-        )
+        approve_call = self.client.contract.get_call_template(
+            contract=swap_proposal.from_token,
+            function_name='approve',
+            spender=self.__router_contract.address
+        ).build(amount=swap_proposal.amount_from.Wei)
         
         if swap_proposal.from_token.is_native_token:
             function_name = 'swap_tokens_for_exact_tokens'
@@ -77,17 +72,13 @@ class JediSwap(StarknetTask):
             }
         )
         
-        swap_call = router_c.functions[function_name].prepare_call(
-            **swap_args
-        )
+        swap_call = self.client.contract.get_call_template(
+            contract=self.__router_contract,
+            function_name=function_name
+        ).build(**swap_args)
         try:
-            response = await self.client.account.execute_v1(
-                calls=[approve_call, swap_call],
-                auto_estimate=True
-            )
-            
-            tx_receipt = await self.client.node_client.wait_for_tx(
-                response.transaction_hash
+            tx_receipt = await self.execute_calls(
+                calls=[approve_call, swap_call]
             )
             
             rounded_amount_from = round(swap_proposal.amount_from.Ether, 5)
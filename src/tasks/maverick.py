@@ -1,25 +1,31 @@
 import random
 import time
-from eth_typing import HexStr
+from typing import Awaitable, Callable
 
-from web3 import Web3
+from eth_abi import decode
+from web3.contract.async_contract import AsyncContract
 from web3.types import TxParams
 import web3.exceptions as web3_exceptions
 
 from _types.explorer import ExplorerEndpoints
+from src._types.networks import NetworkNamesEnum
 from user_data._inputs.settings._global import MODULES_SETTINGS_FILE_PATH
 from src.helpers.time_functions import sleep
 from src.libs.async_eth_lib.architecture.client import EvmClient
 from src.libs.async_eth_lib.data.token_contracts import TokenContractData, ZkSyncEraTokenContracts
 from src.libs.async_eth_lib.models.contract import RawContract
-from src.libs.async_eth_lib.models.others import LogStatus, TokenAmount, TokenSymbol
-from src.libs.async_eth_lib.models.operation import OperationInfo, TxPayloadDetails, TxPayloadDetailsFetcher
+from src.libs.async_eth_lib.models.others import LogStatus, TokenSymbol
+from src.libs.async_eth_lib.models.operation import (
+    OperationInfo, OperationProposal, TxPayloadDetails, TxPayloadDetailsFetcher
+)
+from src.libs.async_eth_lib.models.route_graph import (
+    Pool, RouteGraph, SwapMethod, SwapMethods
+)
 from src.libs.async_eth_lib.models.transaction import TxArgs
 from src.libs.async_eth_lib.utils.helpers import read_json
 from src.tasks._common.evm_task import EvmTask
-from src.tasks._common.utils import (
-    PriceUtils, RandomChoiceHelper, StandardSettings
-)
+from src.tasks._common.quoter import DexQuoter, QuoteCandidate
+from src.tasks._common.utils import RandomChoiceHelper, StandardSettings
 
 # region Settings
 class MaverickSettings():
@@ -35,59 +41,37 @@ class MaverickSettings():
 
 # region Pools and paths
 class MaverickData(TxPayloadDetailsFetcher):
-    LIQUIDITY_POOLS = {
-        (TokenSymbol.ETH, TokenSymbol.USDC):
-            "0x41c8cf74c27554a8972d3bf3d2bd4a14d8b604ab",            
-        (TokenSymbol.USDC, TokenSymbol.BUSD):
-            "0xe799043fb52ff46cc57ce8a8b1ac3f151ba270f7",
-        (TokenSymbol.USDC, TokenSymbol.ETH):
-            "0x74a8f079eb015375b5dbb3ee98cbb1b91089323f",
-        (TokenSymbol.BUSD, TokenSymbol.ETH):
-            "0x3ae63fb198652e294b8de4c2ef659d95d5ff28be"
-    }
-
-    PATHS = {
-        TokenSymbol.ETH: {
-            TokenSymbol.USDC: TxPayloadDetails(
-                method_name='exactInput',
-                addresses=[
-                    ZkSyncEraTokenContracts.WETH.address,
-                    LIQUIDITY_POOLS[(TokenSymbol.ETH, TokenSymbol.USDC)],
-                    ZkSyncEraTokenContracts.USDC.address
-                ]
+    ROUTE_GRAPH = RouteGraph(
+        network_name=NetworkNamesEnum.ZKSYNC_ERA,
+        token_contracts=ZkSyncEraTokenContracts,
+        pools=[
+            Pool(
+                TokenSymbol.ETH, TokenSymbol.USDC,
+                address='0x41c8cf74c27554a8972d3bf3d2bd4a14d8b604ab'
             ),
-            TokenSymbol.BUSD: TxPayloadDetails(
-                method_name='exactInput',
-                addresses=[
-                    ZkSyncEraTokenContracts.WETH.address,
-                    LIQUIDITY_POOLS[(TokenSymbol.USDC, TokenSymbol.ETH)],
-                    ZkSyncEraTokenContracts.USDC.address,
-                    LIQUIDITY_POOLS[(TokenSymbol.USDC, TokenSymbol.BUSD)],
-                    ZkSyncEraTokenContracts.BUSD.address,
-                ]
+            Pool(
+                TokenSymbol.USDC, TokenSymbol.ETH,
+                address='0x74a8f079eb015375b5dbb3ee98cbb1b91089323f'
             ),
-        },
-        TokenSymbol.BUSD: {
-            TokenSymbol.ETH: TxPayloadDetails(
-                method_name='exactInput',
-                addresses=[
-                    ZkSyncEraTokenContracts.BUSD.address,
-                    LIQUIDITY_POOLS[(TokenSymbol.BUSD, TokenSymbol.ETH)],
-                    ZkSyncEraTokenContracts.WETH.address,
-                ]
-            )
-        },
-        TokenSymbol.USDC: {
-            TokenSymbol.ETH: TxPayloadDetails(
-                method_name='exactInput',
-                addresses=[
-                    ZkSyncEraTokenContracts.USDC.address,
-                    LIQUIDITY_POOLS[(TokenSymbol.USDC, TokenSymbol.ETH)],
-                    ZkSyncEraTokenContracts.WETH.address,
-                ]
-            )
-        }
-    }
+            Pool(
+                TokenSymbol.USDC, TokenSymbol.BUSD,
+                address='0xe799043fb52ff46cc57ce8a8b1ac3f151ba270f7'
+            ),
+            Pool(
+                TokenSymbol.BUSD, TokenSymbol.ETH,
+                address='0x3ae63fb198652e294b8de4c2ef659d95d5ff28be'
+            ),
+        ],
+        swap_methods=SwapMethods(
+            from_native=SwapMethod('exactInput'),
+            to_native=SwapMethod('exactInput'),
+            tokens=SwapMethod('exactInput')
+        ),
+        is_pools_in_path=True,
+        preferred_routes=[
+            [TokenSymbol.ETH, TokenSymbol.USDC, TokenSymbol.BUSD],
+        ]
+    )
 # endregion Pools and paths
 
 
@@ -103,70 +87,15 @@ class MaverickImplementation(EvmTask):
 
     async def swap(self, swap_info: OperationInfo) -> bool:
         is_result = False
-        swap_proposal = await self.create_operation_proposal(swap_info)
-
-        from_token_price = await PriceUtils.get_cex_price(swap_info.from_token_name)
-        to_token_price = await PriceUtils.get_cex_price(swap_info.to_token_name)
-
-        min_to_amount = float(swap_proposal.amount_from.Ether) * from_token_price \
-            / to_token_price
-        
-        swap_proposal.min_amount_to = TokenAmount(
-            amount=min_to_amount,
-            decimals=self.client.network.decimals,
-            wei=True
-        )
-
-        tx_payload_details = MaverickData.get_tx_payload_details(
-            first_token=swap_info.from_token_name,
-            second_token=swap_info.to_token_name
-        )
-        encoded_path_payload = b''
-        for address in tx_payload_details.swap_path:
-            encoded_path_payload += Web3.to_bytes(hexstr=HexStr(address))
-
-        account_address = self.client.account.address
+        swap_proposal = await self.init_operation_proposal(swap_info)
         contract = self.client.contract.get_evm_contract_from_raw(
             self.__raw_router_contract
-        )       
-         
-        if swap_info.from_token_name != TokenSymbol.ETH:
-            recipient_address = TokenContractData.ZERO_ADDRESS
-            second_data = contract.encodeABI('unwrapWETH9', args=[
-                swap_proposal.min_amount_to.Wei,
-                self.client.account.address,
-            ])
-            
-        else:    
-            recipient_address = account_address
-            second_data = contract.encodeABI('refundETH', args=[])      
-
-        params = TxArgs(
-            path=encoded_path_payload,
-            recipient=recipient_address,
-            deadline=int(time.time() + 10 * 60),
-            amountIn=swap_proposal.amount_from.Wei,
-            amountOutMinimum=swap_proposal.min_amount_to.Wei
         )
-        
-        swap_amount_data = contract.encodeABI(
-            tx_payload_details.method_name,
-            args=[params.get_list()]
-        )            
-
-        multicall_data = contract.encodeABI(
-            'multicall',
-            args=[
-                [swap_amount_data, second_data]
-            ]
-        )
-
         tx_params = TxParams(
             to=contract.address,
-            data=multicall_data,
             maxPriorityFeePerGas=0,
         )
-        
+
         if not swap_proposal.from_token.is_native_token:
             is_approved = await self.approve_interface(
                 operation_info=swap_info,
@@ -184,6 +113,33 @@ class MaverickImplementation(EvmTask):
         else:
             tx_params['value'] = swap_proposal.amount_from.Wei
 
+        quote = await DexQuoter.get_best_quote(
+            client=self.client,
+            candidates=self._get_quote_candidates(
+                contract, swap_info, swap_proposal, tx_params
+            )
+        )
+        swap_proposal = await self.complete_quoted_operation_proposal(
+            operation_proposal=swap_proposal,
+            op_info=swap_info,
+            quote=quote
+        )
+        tx_payload_details = (
+            quote.tx_payload_details
+            if quote
+            else MaverickData.get_tx_payload_details(
+                first_token=swap_info.from_token_name,
+                second_token=swap_info.to_token_name
+            )
+        )
+        tx_params['data'] = self._encode_swap_data(
+            contract=contract,
+            swap_info=swap_info,
+            tx_payload_details=tx_payload_details,
+            amount_in_wei=swap_proposal.amount_from.Wei,
+            min_amount_out_wei=swap_proposal.min_amount_to.Wei
+        )
+
         try:
             tx_params = self.set_all_gas_params(
                 operation_info=swap_info,
@@ -215,18 +171,97 @@ class MaverickImplementation(EvmTask):
                 f'{full_path + tx.hash.hex()}'
             )
         except web3_exceptions.ContractCustomError as e:
-            self.client.custom_logger.log_message(
-                status=LogStatus.ERROR,
-                message='Failed to swap, trying to make slippage more...'
-            )
-            swap_info.slippage *= 1.3
-            return await self.swap(swap_info)
+            message = 'Try to make slippage more'
+            status = LogStatus.ERROR
         except Exception as e:
             message = str(e)
             status = LogStatus.ERROR
 
         self.client.custom_logger.log_message(status, message)
         return is_result
+
+    def _encode_swap_data(
+        self,
+        contract: AsyncContract,
+        swap_info: OperationInfo,
+        tx_payload_details: TxPayloadDetails,
+        amount_in_wei: int,
+        min_amount_out_wei: int
+    ) -> str:
+        if swap_info.from_token_name != TokenSymbol.ETH:
+            recipient_address = TokenContractData.ZERO_ADDRESS
+            second_data = contract.encodeABI('unwrapWETH9', args=[
+                min_amount_out_wei,
+                self.client.account.address,
+            ])
+
+        else:
+            recipient_address = self.client.account.address
+            second_data = contract.encodeABI('refundETH', args=[])
+
+        params = TxArgs(
+            path=tx_payload_details.encoded_path,
+            recipient=recipient_address,
+            deadline=int(time.time() + 10 * 60),
+            amountIn=amount_in_wei,
+            amountOutMinimum=min_amount_out_wei
+        )
+
+        swap_amount_data = contract.encodeABI(
+            tx_payload_details.method_name,
+            args=[params.get_list()]
+        )
+
+        return contract.encodeABI(
+            'multicall',
+            args=[
+                [swap_amount_data, second_data]
+            ]
+        )
+
+    def _get_quote_candidates(
+        self,
+        contract: AsyncContract,
+        swap_info: OperationInfo,
+        swap_proposal: OperationProposal,
+        tx_params: TxParams
+    ) -> list[QuoteCandidate]:
+        """
+        The router has no quote function, so every path is quoted by simulating
+        the swap from the account with zero minimum output.
+        """
+        def get_simulation(
+            tx_payload_details: TxPayloadDetails
+        ) -> Callable[[], Awaitable[tuple]]:
+            async def simulate() -> tuple:
+                return_data = await self.client.w3.eth.call({
+                    'from': self.client.account.address,
+                    'to': contract.address,
+                    'value': tx_params.get('value', 0),
+                    'data': self._encode_swap_data(
+                        contract=contract,
+                        swap_info=swap_info,
+                        tx_payload_details=tx_payload_details,
+                        amount_in_wei=swap_proposal.amount_from.Wei,
+                        min_amount_out_wei=0
+                    )
+                })
+                multicall_results = decode(['bytes[]'], return_data)[0]
+
+                return decode(['uint256'], multicall_results[0])
+
+            return simulate
+
+        return [
+            QuoteCandidate(
+                tx_payload_details=tx_payload_details,
+                simulate=get_simulation(tx_payload_details)
+            )
+            for tx_payload_details in MaverickData.get_all_tx_payload_details(
+                first_token=swap_info.from_token_name,
+                second_token=swap_info.to_token_name
+            )
+        ]
 # endregion Implementation
 
 
@@ -239,30 +274,16 @@ class Maverick:
         settings = MaverickSettings()
         swap_routes = get_maverick_swap_routes()
         
-        random_networks = list(swap_routes)
-        random.shuffle(random_networks)
-
         self.client.custom_logger.log_message(
             status=LogStatus.INFO,
             message='Started to search enough balance for swap'
         )
-        
-        for network in random_networks:
-            client = EvmClient(
-                account_id=self.client.account_id,
-                private_key=self.client.account._private_key,
-                network=network,
-                proxy=self.client.proxy
-            )
-        
-            (operation_info, dst_data) = await RandomChoiceHelper.get_partial_operation_info_and_dst_data(
-                op_data=swap_routes,
-                op_settings=settings.swap,
-                client=client
-            )
-            
-            if operation_info:
-                break
+
+        (client, operation_info, dst_data) = await RandomChoiceHelper.find_partial_operation_info_and_dst_data(
+            op_data=swap_routes,
+            op_settings=settings.swap,
+            client=self.client
+        )
 
         if not dst_data:
             self.client.custom_logger.log_message(
@@ -1,13 +1,16 @@
 import random
 import time
+from functools import partial
 
 import web3.exceptions as web3_exceptions
 from web3.types import TxParams
 
 from _types.explorer import ExplorerEndpoints
+from src._types.networks import NetworkNamesEnum
 from src.helpers.time_functions import sleep
 from user_data._inputs.settings._global import MODULES_SETTINGS_FILE_PATH
 from src.libs.async_eth_lib.architecture.client import EvmClient
+from src.libs.async_eth_lib.architecture.multicall import MulticallCall
 from src.libs.async_eth_lib.data.token_contracts import ZkSyncEraTokenContracts
 from src.libs.async_eth_lib.models.contract import RawContract
 from src.libs.async_eth_lib.models.params_types import Web3ContractType
@@ -17,9 +20,13 @@ from src.libs.async_eth_lib.models.others import (
     LogStatus, TokenSymbol
 )
 from src.libs.async_eth_lib.models.operation import (
-    OperationInfo, OperationProposal, TxPayloadDetails, TxPayloadDetailsFetcher
+    OperationInfo, OperationProposal, TxPayloadDetailsFetcher
+)
+from src.libs.async_eth_lib.models.route_graph import (
+    Pool, RouteGraph, SwapMethod, SwapMethods
 )
 from src.tasks._common.evm_task import EvmTask
+from src.tasks._common.quoter import DexQuoter, Quote, QuoteCandidate
 from src.tasks._common.utils import RandomChoiceHelper, StandardSettings
 from src.tasks.config import get_mute_paths
 
@@ -38,123 +45,26 @@ class MuteSettings():
 
 # region Available paths
 class MuteRoutes(TxPayloadDetailsFetcher):
-    PATHS = {
-        TokenSymbol.ETH: {
-            TokenSymbol.USDC: TxPayloadDetails(
-                method_name='swapExactETHForTokensSupportingFeeOnTransferTokens',
-                addresses=[
-                    ZkSyncEraTokenContracts.WETH.address,
-                    ZkSyncEraTokenContracts.USDC.address
-                ],
-                bool_list=[False, False]
-            ),
-            TokenSymbol.USDT: TxPayloadDetails(
-                method_name='swapExactETHForTokens',
-                addresses=[
-                    ZkSyncEraTokenContracts.WETH.address,
-                    ZkSyncEraTokenContracts.USDC.address,
-                    ZkSyncEraTokenContracts.USDT.address,
-                ],
-                bool_list=[True, True, False]
-            ),
-            TokenSymbol.WBTC: TxPayloadDetails(
-                method_name='swapExactETHForTokens',
-                addresses=[
-                    ZkSyncEraTokenContracts.WETH.address,
-                    ZkSyncEraTokenContracts.WBTC.address
-                ],
-                bool_list=[False, False]
-            )
-        },
-        TokenSymbol.USDC: {
-            TokenSymbol.ETH: TxPayloadDetails(
-                method_name='swapExactTokensForETH',
-                addresses=[
-                    ZkSyncEraTokenContracts.USDC.address,
-                    ZkSyncEraTokenContracts.WETH.address
-                ],
-                bool_list=[True, False]
-            ),
-            TokenSymbol.USDT: TxPayloadDetails(
-                method_name='swapExactTokensForTokens',
-                addresses=[
-                    ZkSyncEraTokenContracts.USDC.address,
-                    ZkSyncEraTokenContracts.USDT.address,
-                ],
-                bool_list=[True, False]
-            ),
-            TokenSymbol.WBTC: TxPayloadDetails(
-                method_name='swapExactTokensForTokens',
-                addresses=[
-                    ZkSyncEraTokenContracts.USDC.address,
-                    ZkSyncEraTokenContracts.WETH.address,
-                    ZkSyncEraTokenContracts.WBTC.address,
-                ],
-                bool_list=[False, False, False]
-            ),
-        },
-        TokenSymbol.USDT: {
-            TokenSymbol.USDC: TxPayloadDetails(
-                method_name='swapExactTokensForTokens',
-                addresses=[
-                    ZkSyncEraTokenContracts.USDT.address,
-                    # TokenContracts.WETH.address,
-                    ZkSyncEraTokenContracts.USDC.address,
-                ],
-                bool_list=[True,
-                           #    False,
-                           False
-                           ]
-            ),
-            TokenSymbol.ETH: TxPayloadDetails(
-                method_name='swapExactTokensForETH',
-                addresses=[
-                    ZkSyncEraTokenContracts.USDT.address,
-                    ZkSyncEraTokenContracts.USDC.address,
-                    ZkSyncEraTokenContracts.WETH.address,
-                ],
-                bool_list=[True, True, False]
-            ),
-            TokenSymbol.WBTC: TxPayloadDetails(
-                method_name='swapExactTokensForTokens',
-                addresses=[
-                    ZkSyncEraTokenContracts.USDT.address,
-                    ZkSyncEraTokenContracts.USDC.address,
-                    ZkSyncEraTokenContracts.WETH.address,
-                    ZkSyncEraTokenContracts.WBTC.address
-                ],
-                bool_list=[False, True, True, False]
-            )
-        },
-        TokenSymbol.WBTC: {
-            TokenSymbol.ETH: TxPayloadDetails(
-                method_name='swapExactTokensForETH',
-                addresses=[
-                    ZkSyncEraTokenContracts.WBTC.address,
-                    ZkSyncEraTokenContracts.WETH.address,
-                ],
-                bool_list=[False, False]
-            ),
-            TokenSymbol.USDT: TxPayloadDetails(
-                method_name='swapExactTokensForTokens',
-                addresses=[
-                    ZkSyncEraTokenContracts.WBTC.address,
-                    ZkSyncEraTokenContracts.WETH.address,
-                    ZkSyncEraTokenContracts.USDT.address
-                ],
-                bool_list=[False, False, False]
-            ),
-            TokenSymbol.USDC: TxPayloadDetails(
-                method_name='swapExactTokensForTokens',
-                addresses=[
-                    ZkSyncEraTokenContracts.WBTC.address,
-                    ZkSyncEraTokenContracts.WETH.address,
-                    ZkSyncEraTokenContracts.USDC.address
-                ],
-                bool_list=[False, False, False]
-            )
-        }
-    }
+    ROUTE_GRAPH = RouteGraph(
+        network_name=NetworkNamesEnum.ZKSYNC_ERA,
+        token_contracts=ZkSyncEraTokenContracts,
+        pools=[
+            Pool(TokenSymbol.ETH, TokenSymbol.USDC),
+            Pool(TokenSymbol.ETH, TokenSymbol.USDT),
+            Pool(TokenSymbol.ETH, TokenSymbol.WBTC),
+            Pool(TokenSymbol.USDC, TokenSymbol.USDT, is_stable=True),
+        ],
+        swap_methods=SwapMethods(
+            from_native=SwapMethod('swapExactETHForTokens'),
+            to_native=SwapMethod('swapExactTokensForETH'),
+            tokens=SwapMethod('swapExactTokensForTokens')
+        ),
+        preferred_routes=[
+            [TokenSymbol.ETH, TokenSymbol.USDC, TokenSymbol.USDT],
+            [TokenSymbol.USDT, TokenSymbol.USDC, TokenSymbol.ETH],
+            [TokenSymbol.USDT, TokenSymbol.USDC, TokenSymbol.ETH, TokenSymbol.WBTC],
+        ]
+    )
 # endregion Available routes
 
 
@@ -176,22 +86,27 @@ class MuteImplementation(EvmTask):
         contract = self.client.contract.get_evm_contract_from_raw(
             self.__raw_router_contract
         )
-        swap_proposal = await self._create_swap_proposal(
+        swap_proposal, quote = await self._create_swap_proposal(
             contract=contract,
             swap_info=swap_info
         )
 
-        tx_payload_details = MuteRoutes.get_tx_payload_details(
-            first_token=swap_info.from_token_name,
-            second_token=swap_info.to_token_name
-        )
+        if quote:
+            tx_payload_details = quote.tx_payload_details
+            stable = self._get_stable_flags(quote)
+        else:
+            tx_payload_details = MuteRoutes.get_tx_payload_details(
+                first_token=swap_info.from_token_name,
+                second_token=swap_info.to_token_name
+            )
+            stable = tx_payload_details.bool_list
 
         params = TxArgs(
             amountOutMin=swap_proposal.min_amount_to.Wei,
             path=tx_payload_details.swap_path,
             to=self.client.account.address,
             deadline=int(time.time() + 20 * 60),
-            stable=tx_payload_details.bool_list
+            stable=stable
         )
 
         list_params = params.get_list()
@@ -272,7 +187,7 @@ class MuteImplementation(EvmTask):
         self,
         contract: Web3ContractType,
         swap_info: OperationInfo
-    ) -> OperationProposal:
+    ) -> tuple[OperationProposal, Quote | None]:
         swap_proposal = await self.init_operation_proposal(swap_info)
 
         if swap_info.from_token_name == TokenSymbol.ETH:
@@ -281,17 +196,78 @@ class MuteImplementation(EvmTask):
         if swap_info.to_token_name == TokenSymbol.ETH:
             swap_proposal.to_token = ZkSyncEraTokenContracts.WETH
 
-        min_amount_out = await contract.functions.getAmountOut(
-            swap_proposal.amount_from.Wei,
-            swap_proposal.from_token.address,
-            swap_proposal.to_token.address
-        ).call()
-
-        return await self.complete_operation_proposal(
+        quote = await DexQuoter.get_best_quote(
+            client=self.client,
+            candidates=self._get_quote_candidates(contract, swap_info, swap_proposal)
+        )
+        swap_proposal = await self.complete_quoted_operation_proposal(
             operation_proposal=swap_proposal,
-            slippage=swap_info.slippage,
-            min_amount_to_wei=min_amount_out[0],
+            op_info=swap_info,
+            quote=quote
         )
+
+        return swap_proposal, quote
+
+    def _get_quote_candidates(
+        self,
+        contract: Web3ContractType,
+        swap_info: OperationInfo,
+        swap_proposal: OperationProposal
+    ) -> list[QuoteCandidate]:
+        candidates = []
+
+        for tx_payload_details in MuteRoutes.get_all_tx_payload_details(
+            first_token=swap_info.from_token_name,
+            second_token=swap_info.to_token_name
+        ):
+            if len(tx_payload_details.swap_path) == 2:
+                candidates.append(QuoteCandidate(
+                    tx_payload_details=tx_payload_details,
+                    call=MulticallCall.from_contract(
+                        contract=contract,
+                        fn_name='getAmountOut',
+                        args=[
+                            swap_proposal.amount_from.Wei,
+                            tx_payload_details.swap_path[0],
+                            tx_payload_details.swap_path[-1]
+                        ],
+                        output_types=['uint256', 'bool', 'uint256']
+                    )
+                ))
+            else:
+                candidates.append(QuoteCandidate(
+                    tx_payload_details=tx_payload_details,
+                    simulate=partial(
+                        self._quote_hops,
+                        contract,
+                        swap_proposal.amount_from.Wei,
+                        tx_payload_details.swap_path
+                    )
+                ))
+
+        return candidates
+
+    async def _quote_hops(
+        self,
+        contract: Web3ContractType,
+        amount_in_wei: int,
+        swap_path: list[str]
+    ) -> tuple[int, list[bool]]:
+        # the router has no getAmountsOut, so every hop is quoted by getAmountOut
+        amount_out, stable = amount_in_wei, []
+
+        for token_in, token_out in zip(swap_path, swap_path[1:]):
+            amount_out, is_stable, _ = await contract.functions.getAmountOut(
+                amount_out, token_in, token_out
+            ).call()
+            stable.append(is_stable)
+
+        return amount_out, stable
+
+    @staticmethod
+    def _get_stable_flags(quote: Quote) -> list[bool]:
+        stable = quote.result[1]
+        return stable if isinstance(stable, list) else [stable]
 # endregion Implementation
 
 
@@ -304,30 +280,16 @@ class Mute:
         settings = MuteSettings()
         swap_routes = get_mute_paths()
 
-        random_networks = list(swap_routes)
-        random.shuffle(random_networks)
-
         self.client.custom_logger.log_message(
             status=LogStatus.INFO,
             message='Started to search enough balance for swap'
         )
 
-        for network in random_networks:
-            client = EvmClient(
-                account_id=self.client.account_id,
-                private_key=self.client.account._private_key,
-                network=network,
-                proxy=self.client.proxy
-            )
-
-            (operation_info, dst_data) = await RandomChoiceHelper.get_partial_operation_info_and_dst_data(
-                op_data=swap_routes,
-                op_settings=settings.swap,
-                client=client
-            )
-
-            if operation_info:
-                break
+        (client, operation_info, dst_data) = await RandomChoiceHelper.find_partial_operation_info_and_dst_data(
+            op_data=swap_routes,
+            op_settings=settings.swap,
+            client=self.client
+        )
 
         if not dst_data:
             self.client.custom_logger.log_message(
@@ -2,7 +2,7 @@ from starknet_py.net.client_models import TransactionExecutionStatus
 
 from src.libs.async_starknet_lib.architecture.client import StarknetClient
 from src.libs.async_starknet_lib.data.token_contracts import StarknetTokenContracts
-from src.libs.async_starknet_lib.models.contract import RawContract
+from src.libs.async_starknet_lib.models.contract import RawContract, TokenContract
 from src.libs.async_starknet_lib.utils.decorators import (
     validate_liquidity_pools,
     validate_operation_tokens
@@ -85,31 +85,23 @@ class MySwap(StarknetTask):
             return is_result
 
         swap_proposal = await self.create_operation_proposal(swap_info)
-        from_token_contract = self.client.contract.get_starknet_contract_from_raw(
-            contract=swap_proposal.from_token
-        )
-        router_contract = self.client.contract.get_starknet_contract_from_raw(
-            contract=self.__router_contract
-        )
-
-        approve_call = from_token_contract.functions['approve'].prepare_call(
-            spender=router_contract.address,
-            amount=swap_proposal.amount_from.Wei
-        )
-        swap_call = router_contract.functions['swap'].prepare_call(
+        approve_call = self.client.contract.get_call_template(
+            contract=swap_proposal.from_token,
+            function_name='approve',
+            spender=self.__router_contract.address
+        ).build(amount=swap_proposal.amount_from.Wei)
+        swap_call = self.client.contract.get_call_template(
+            contract=self.__router_contract,
+            function_name='swap',
             pool_id=pool_id,
-            token_from_addr=swap_proposal.from_token.address,
+            token_from_addr=swap_proposal.from_token.address
+        ).build(
             amount_from=swap_proposal.amount_from.Wei,
             amount_to_min=swap_proposal.min_amount_to.Wei
         )
         try:
-            response = await self.client.account.execute_v1(
-                calls=[approve_call, swap_call],
-                auto_estimate=True
-            )
-
-            tx_receipt = await self.client.node_client.wait_for_tx(
-                response.transaction_hash
+            tx_receipt = await self.execute_calls(
+                calls=[approve_call, swap_call]
             )
 
             rounded_amount_from = round(swap_proposal.amount_from.Ether, 5)
@@ -182,14 +174,9 @@ class MySwap(StarknetTask):
             )
         )
         try:
-            response = await self.client.account.execute_v1(
+            tx_receipt = await self.execute_calls(
                 calls=[from_token_approve_call,
-                       to_token_approve_call, add_liquidity_call],
-                auto_estimate=True
-            )
-
-            tx_receipt = await self.client.node_client.wait_for_tx(
-                response.transaction_hash
+                       to_token_approve_call, add_liquidity_call]
             )
 
             if tx_receipt.execution_status == TransactionExecutionStatus.SUCCEEDED:
@@ -230,7 +217,23 @@ class MySwap(StarknetTask):
             self.__liquidity_map[pool_name]['liquidity_token_address']
         )
         try:
-            lp_token_amount_wei = await self.client.account.get_balance(lp_token_address)
+            token_a = StarknetTokenContracts.get_token(liq_info.from_token_name)
+            token_b = StarknetTokenContracts.get_token(liq_info.to_token_name)
+            snapshot = await self.client.reader.read_tokens(
+                accounts=[self.client.account.address],
+                tokens=[
+                    TokenContract(title=pool_name, address=lp_token_address),
+                    token_a,
+                    token_b
+                ]
+            )
+            lp_token_amount_wei, a_decimals, b_decimals = (
+                snapshot.balances[0][0],
+                snapshot.decimals[1],
+                snapshot.decimals[2]
+            )
+            if lp_token_amount_wei is None:
+                lp_token_amount_wei = await self.client.account.get_balance(lp_token_address)
             lp_contract = self.client.contract.get_token_starknet_contract(
                 address=lp_token_address
             )
@@ -246,16 +249,10 @@ class MySwap(StarknetTask):
             token_a_amount = amount_list.pool['token_a_reserves']
             token_b_amount = amount_list.pool['token_b_reserves']
 
-            a_decimals = await self.client.contract.get_decimals(
-                token=StarknetTokenContracts.get_token(
-                    liq_info.from_token_name
-                )
-            )
-            b_decimals = await self.client.contract.get_decimals(
-                token=StarknetTokenContracts.get_token(
-                    liq_info.to_token_name
-                )
-            )
+            if a_decimals is None:
+                a_decimals = await self.client.contract.get_decimals(token=token_a)
+            if b_decimals is None:
+                b_decimals = await self.client.contract.get_decimals(token=token_b)
 
             amount_min_a = TokenAmount(
                 amount=int((lp_token_amount_wei / total_pool_supply) * token_a_amount
@@ -281,13 +278,8 @@ class MySwap(StarknetTask):
                 amount_min_b=amount_min_b.Wei
             )
 
-            response = await self.client.account.execute_v1(
-                calls=[approve_call, withdraw_liquidity_call],
-                auto_estimate=True
-            )
-
-            tx_receipt = await self.client.node_client.wait_for_tx(
-                response.transaction_hash
+            tx_receipt = await self.execute_calls(
+                calls=[approve_call, withdraw_liquidity_call]
             )
 
             if tx_receipt.execution_status == TransactionExecutionStatus.SUCCEEDED:
@@ -8,17 +8,22 @@ from _types.explorer import ExplorerEndpoints
 from helpers.time_functions import sleep
 from user_data._inputs.settings._global import MODULES_SETTINGS_FILE_PATH
 from src.libs.async_eth_lib.architecture.client import EvmClient
+from src.libs.async_eth_lib.architecture.multicall import MulticallCall
 from src.libs.async_eth_lib.data.token_contracts import ZkSyncEraTokenContracts
 from src.libs.async_eth_lib.models.contract import RawContract
 from src.libs.async_eth_lib.utils.helpers import read_json
 from src.libs.async_eth_lib.models.others import LogStatus
 from src.libs.async_eth_lib.models.operation import (
     OperationInfo, 
-    TxPayloadDetails, 
     TxPayloadDetailsFetcher
 )
+from src.libs.async_eth_lib.models.route_graph import (
+    Pool, RouteGraph, SwapMethod, SwapMethods
+)
+from src._types.networks import NetworkNamesEnum
 from src._types.tokens import TokenSymbol
 from src.tasks._common.evm_task import EvmTask
+from src.tasks._common.quoter import DexQuoter, QuoteCandidate, get_last_amount
 from src.tasks._common.utils import RandomChoiceHelper, StandardSettings, HexUtils
 from src.tasks.config import get_space_fi_paths
 
@@ -36,84 +41,27 @@ class SpaceFiSettings():
 
 # region Available paths
 class SpaceFiRoutes(TxPayloadDetailsFetcher):
-    PATHS = {
-        TokenSymbol.ETH: {
-            TokenSymbol.USDC: TxPayloadDetails(
-                method_name='swapExactETHForToken',
-                addresses=[
-                    ZkSyncEraTokenContracts.WETH.address,
-                    ZkSyncEraTokenContracts.USDC.address
-                ],
-                function_signature="0x7ff36ab5"
-            ),
-            TokenSymbol.USDT: TxPayloadDetails(
-                method_name='swapExactETHForToken',
-                addresses=[
-                    ZkSyncEraTokenContracts.WETH.address,
-                    ZkSyncEraTokenContracts.USDT.address
-                ],
-                function_signature="0x7ff36ab5"
-            ),
-            TokenSymbol.WBTC: TxPayloadDetails(
-                method_name='swapExactETHForToken',
-                addresses=[
-                    ZkSyncEraTokenContracts.WETH.address,
-                    ZkSyncEraTokenContracts.WBTC.address
-                ],
-                function_signature="0x7ff36ab5"
-            )
-        },
-        TokenSymbol.USDC: {
-            TokenSymbol.ETH: TxPayloadDetails(
-                method_name='swapExactTokensForETH',
-                addresses=[
-                    ZkSyncEraTokenContracts.USDC.address,
-                    ZkSyncEraTokenContracts.SPACE.address,
-                    ZkSyncEraTokenContracts.WETH.address
-                ],
-                function_signature="0x18cbafe5"
-            ),
-            TokenSymbol.WBTC: TxPayloadDetails(
-                method_name='swapExactTokensForETH',
-                addresses=[
-                    ZkSyncEraTokenContracts.USDC.address,
-                    ZkSyncEraTokenContracts.WETH.address,
-                    ZkSyncEraTokenContracts.WBTC.address
-                ],
-                function_signature='0x38ed1739'
-            )
-        },
-        TokenSymbol.USDT: {
-            TokenSymbol.ETH: TxPayloadDetails(
-                method_name='swapExactTokensForETH',
-                addresses=[
-                    ZkSyncEraTokenContracts.USDT.address,
-                    # ZkSyncTokenContracts.SPACE.address,
-                    ZkSyncEraTokenContracts.WETH.address
-                ],
-                function_signature="0x18cbafe5"
-            )
-        },
-        TokenSymbol.WBTC: {
-            TokenSymbol.ETH: TxPayloadDetails(
-                method_name='swapExactTokensForETH',
-                addresses=[
-                    ZkSyncEraTokenContracts.WBTC.address,
-                    ZkSyncEraTokenContracts.USDC.address,
-                    ZkSyncEraTokenContracts.WETH.address
-                ],
-                function_signature="0x18cbafe5"
-            ),
-            TokenSymbol.USDC: TxPayloadDetails(
-                method_name='swapExactTokensForETH',
-                addresses=[
-                    ZkSyncEraTokenContracts.WBTC.address,
-                    ZkSyncEraTokenContracts.USDC.address
-                ],
-                function_signature='0x38ed1739'
-            )
-        }
-    }
+    ROUTE_GRAPH = RouteGraph(
+        network_name=NetworkNamesEnum.ZKSYNC_ERA,
+        token_contracts=ZkSyncEraTokenContracts,
+        pools=[
+            Pool(TokenSymbol.ETH, TokenSymbol.USDC),
+            Pool(TokenSymbol.ETH, TokenSymbol.USDT),
+            Pool(TokenSymbol.ETH, TokenSymbol.WBTC),
+            Pool(TokenSymbol.ETH, TokenSymbol.SPACE),
+            Pool(TokenSymbol.USDC, TokenSymbol.SPACE),
+            Pool(TokenSymbol.USDC, TokenSymbol.WBTC),
+        ],
+        swap_methods=SwapMethods(
+            from_native=SwapMethod('swapExactETHForTokens', '0x7ff36ab5'),
+            to_native=SwapMethod('swapExactTokensForETH', '0x18cbafe5'),
+            tokens=SwapMethod('swapExactTokensForTokens', '0x38ed1739')
+        ),
+        preferred_routes=[
+            [TokenSymbol.USDC, TokenSymbol.SPACE, TokenSymbol.ETH],
+            [TokenSymbol.WBTC, TokenSymbol.USDC, TokenSymbol.ETH],
+        ]
+    )
 # endregion Available routes
 
 
@@ -137,10 +85,41 @@ class SpaceFiImplementation(EvmTask):
             self.__raw_router_contract
         )
 
-        swap_proposal = await self.create_operation_proposal(swap_info)
-        tx_payload_details = SpaceFiRoutes.get_tx_payload_details(
-            first_token=swap_info.from_token_name,
-            second_token=swap_info.to_token_name
+        swap_proposal = await self.init_operation_proposal(swap_info)
+        quote = await DexQuoter.get_best_quote(
+            client=self.client,
+            candidates=[
+                QuoteCandidate(
+                    tx_payload_details=tx_payload_details,
+                    call=MulticallCall.from_signature(
+                        target=contract.address,
+                        text_signature='getAmountsOut(uint256,address[])',
+                        args=[
+                            swap_proposal.amount_from.Wei,
+                            tx_payload_details.swap_path
+                        ],
+                        output_types=['uint256[]']
+                    ),
+                    parse_amount_out=get_last_amount
+                )
+                for tx_payload_details in SpaceFiRoutes.get_all_tx_payload_details(
+                    first_token=swap_info.from_token_name,
+                    second_token=swap_info.to_token_name
+                )
+            ]
+        )
+        swap_proposal = await self.complete_quoted_operation_proposal(
+            operation_proposal=swap_proposal,
+            op_info=swap_info,
+            quote=quote
+        )
+        tx_payload_details = (
+            quote.tx_payload_details
+            if quote
+            else SpaceFiRoutes.get_tx_payload_details(
+                first_token=swap_info.from_token_name,
+                second_token=swap_info.to_token_name
+            )
         )
 
         if swap_info.from_token_name != TokenSymbol.ETH:
@@ -247,30 +226,16 @@ class SpaceFi(EvmTask):
         settings = SpaceFiSettings()
         swap_routes = get_space_fi_paths()
 
-        random_networks = list(swap_routes)
-        random.shuffle(random_networks)
-
         self.client.custom_logger.log_message(
             status=LogStatus.INFO,
             message='Started to search enough balance for swap'
         )
 
-        for network in random_networks:
-            client = EvmClient(
-                account_id=self.client.account_id,
-                private_key=self.client.account._private_key,
-                network=network,
-                proxy=self.client.proxy
-            )
-
-            (operation_info, dst_data) = await RandomChoiceHelper.get_partial_operation_info_and_dst_data(
-                op_data=swap_routes,
-                op_settings=settings.swap,
-                client=client
-            )
-
-            if operation_info:
-                break
+        (client, operation_info, dst_data) = await RandomChoiceHelper.find_partial_operation_info_and_dst_data(
+            op_data=swap_routes,
+            op_settings=settings.swap,
+            client=self.client
+        )
 
         if not dst_data:
             self.client.custom_logger.log_message(
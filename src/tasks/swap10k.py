@@ -41,12 +41,6 @@ class Swap10k(StarknetTask):
     async def swap(self, swap_info: OperationInfo) -> bool:
         is_result = False
         swap_proposal = await self.create_operation_proposal(swap_info)
-        from_token_contract = self.client.contract.get_starknet_contract_from_raw(
-            contract=swap_proposal.from_token
-        )
-        router_contract = self.client.contract.get_starknet_contract_from_raw(
-            contract=self.__router_contract
-        )
         
         if swap_proposal.from_token.is_native_token:
             function_name = 'swapTokensForExactTokens'
@@ -72,21 +66,18 @@ class Swap10k(StarknetTask):
             }
         )
 
-        approve_call = from_token_contract.functions['approve'].prepare_call(
-            spender=router_contract.address,
-            amount=swap_proposal.amount_from.Wei
-        )
-        swap_call = router_contract.functions[function_name].prepare_call(
-            **swap_args
-        )
+        approve_call = self.client.contract.get_call_template(
+            contract=swap_proposal.from_token,
+            function_name='approve',
+            spender=self.__router_contract.address
+        ).build(amount=swap_proposal.amount_from.Wei)
+        swap_call = self.client.contract.get_call_template(
+            contract=self.__router_contract,
+            function_name=function_name
+        ).build(**swap_args)
         try:
-            response = await self.client.account.execute_v1(
-                calls=[approve_call, swap_call],
-                auto_estimate=True
-            )
-
-            tx_receipt = await self.client.node_client.wait_for_tx(
-                response.transaction_hash
+            tx_receipt = await self.execute_calls(
+                calls=[approve_call, swap_call]
             )
 
             rounded_amount_from = round(swap_proposal.amount_from.Ether, 5)
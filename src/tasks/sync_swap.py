@@ -5,17 +5,23 @@ from web3.types import TxParams
 import web3.exceptions as web3_exceptions
 
 from _types.explorer import ExplorerEndpoints
+from src._types.networks import NetworkNamesEnum
 from src.libs.async_eth_lib.architecture.client import EvmClient
+from src.libs.async_eth_lib.architecture.multicall import MulticallCall
 from src.libs.async_eth_lib.data.token_contracts import (
     ZkSyncEraTokenContracts,
     TokenContractData
 )
 from src.libs.async_eth_lib.models.contract import RawContract
 from src.libs.async_eth_lib.models.others import LogStatus, TokenSymbol
-from src.libs.async_eth_lib.models.operation import OperationInfo
+from src.libs.async_eth_lib.models.operation import OperationInfo, TxPayloadDetailsFetcher
+from src.libs.async_eth_lib.models.route_graph import (
+    Pool, RouteGraph, SwapMethod, SwapMethods
+)
 from src.libs.async_eth_lib.models.transaction import TxArgs
 from src.tasks._common.evm_task import EvmTask
-from src.tasks._common.utils import HexUtils, PriceUtils
+from src.tasks._common.quoter import DexQuoter, QuoteCandidate
+from src.tasks._common.utils import HexUtils
 
 
 class SyncSwapSettings:
@@ -28,6 +34,37 @@ class SyncSwapSettings:
     }
 
 
+class SyncSwapRoutes(TxPayloadDetailsFetcher):
+    ROUTE_GRAPH = RouteGraph(
+        network_name=NetworkNamesEnum.ZKSYNC_ERA,
+        token_contracts=ZkSyncEraTokenContracts,
+        pools=[
+            Pool(
+                TokenSymbol.ETH, TokenSymbol.USDC,
+                address='0x80115c708e12edd42e504c1cd52aea96c547c05c'
+            ),
+            Pool(
+                TokenSymbol.ETH, TokenSymbol.USDT,
+                address='0xd3D91634Cf4C04aD1B76cE2c06F7385A897F54D3'
+            ),
+            Pool(
+                TokenSymbol.ETH, TokenSymbol.BUSD,
+                address='0xad86486f1d225d624443e5df4b2301d03bbe70f6'
+            ),
+            Pool(
+                TokenSymbol.ETH, TokenSymbol.WBTC,
+                address='0xb3479139e07568ba954c8a14d5a8b3466e35533d'
+            ),
+        ],
+        swap_methods=SwapMethods(
+            from_native=SwapMethod('swap'),
+            to_native=SwapMethod('swap'),
+            tokens=SwapMethod('swap')
+        ),
+        max_hops=1
+    )
+
+
 class SyncSwap(EvmTask):
     def __init__(self, client: EvmClient):
         super().__init__(client)
@@ -36,16 +73,6 @@ class SyncSwap(EvmTask):
             address="0x2da10A1e27bF85cEdD8FFb1AbBe97e53391C0295",
             abi_path=("data", "abis", "zksync", "sync_swap", "abi.json")
         )
-        self.__liquidity_pools = {
-            (TokenSymbol.ETH, TokenSymbol.USDC):
-                "0x80115c708e12edd42e504c1cd52aea96c547c05c",
-            (TokenSymbol.ETH, TokenSymbol.USDT):
-                "0xd3D91634Cf4C04aD1B76cE2c06F7385A897F54D3",
-            (TokenSymbol.ETH, TokenSymbol.BUSD):
-                "0xad86486f1d225d624443e5df4b2301d03bbe70f6",
-            (TokenSymbol.ETH, TokenSymbol.WBTC):
-                "0xb3479139e07568ba954c8a14d5a8b3466e35533d",
-        }
 
     async def swap(self, swap_info: OperationInfo) -> bool:
         is_result = False
@@ -60,30 +87,49 @@ class SyncSwap(EvmTask):
         if swap_info.to_token_name == TokenSymbol.ETH:
             swap_proposal.to_token = ZkSyncEraTokenContracts.WETH
 
-        from_token_price = await PriceUtils.get_cex_price(swap_info.from_token_name)
-        second_token_price = await PriceUtils.get_cex_price(swap_info.to_token_name)
-
-        min_to_amount_wei = swap_proposal.amount_from.Wei * from_token_price \
-            / second_token_price
-
-        swap_proposal = await self.complete_operation_proposal(
-            operation_proposal=swap_proposal,
-            slippage=swap_info.slippage,
-            min_amount_to_wei=min_to_amount_wei,
-        )
-
-        pool = self.__liquidity_pools.get(
-            (swap_info.to_token_name.upper(), swap_info.from_token_name.upper())
-        ) or self.__liquidity_pools.get(
-            (swap_info.from_token_name.upper(), swap_info.to_token_name.upper())
-        )
-        if not pool:
+        if not SyncSwapRoutes.ROUTE_GRAPH.get_pool(
+            swap_info.from_token_name, swap_info.to_token_name
+        ):
             self.client.custom_logger.log_message(
                 status=LogStatus.ERROR,
                 message=f"{swap_info.from_token_name} -> {swap_info.to_token_name}: not existed pool"
             )
             return is_result
 
+        tx_payload_details_list = SyncSwapRoutes.get_all_tx_payload_details(
+            first_token=swap_info.from_token_name,
+            second_token=swap_info.to_token_name
+        )
+        quote = await DexQuoter.get_best_quote(
+            client=self.client,
+            candidates=[
+                QuoteCandidate(
+                    tx_payload_details=tx_payload_details,
+                    call=MulticallCall.from_signature(
+                        target=tx_payload_details.pool_addresses[0],
+                        text_signature='getAmountOut(address,uint256,address)',
+                        args=[
+                            swap_proposal.from_token.address,
+                            swap_proposal.amount_from.Wei,
+                            self.client.account.address
+                        ],
+                        output_types=['uint256']
+                    )
+                )
+                for tx_payload_details in tx_payload_details_list
+            ]
+        )
+        swap_proposal = await self.complete_quoted_operation_proposal(
+            operation_proposal=swap_proposal,
+            op_info=swap_info,
+            quote=quote
+        )
+        pool_address = (
+            quote.tx_payload_details
+            if quote
+            else tx_payload_details_list[0]
+        ).pool_addresses[0]
+
         zfilled_from_token = HexUtils.to_cut_hex_prefix_and_zfill(
             swap_proposal.from_token.address
         )
@@ -101,7 +147,7 @@ class SyncSwap(EvmTask):
                 TxArgs(
                     steps=[
                         TxArgs(
-                            pool=Web3.to_checksum_address(pool),
+                            pool=Web3.to_checksum_address(pool_address),
                             data=(
                                 '0x' +
                                 zfilled_from_token +
@@ -116,4 +116,14 @@ PUBLIC_RPCS = {
         'https://starknet-mainnet.public.blastapi.io',
     ]
     # endregion ZK Mainnets
-}
\ No newline at end of file
+}
+
+# Лимиты запросов к RPC: `rate` - запросов в секунду, `burst` - запросов подряд без ожидания
+# Ключ - начало URL RPC, 'default' - для всех остальных RPC
+RPC_RATE_LIMITS = {
+    'default': {'rate': 10, 'burst': 20},
+    'https://rpc.ankr.com': {'rate': 25, 'burst': 50},
+    'https://eth.llamarpc.com': {'rate': 10, 'burst': 20},
+    'https://arb1.arbitrum.io/rpc': {'rate': 15, 'burst': 30},
+    'https://starknet-mainnet.public.blastapi.io': {'rate': 10, 'burst': 20},
+}
@@ -12,6 +12,10 @@ settings: DefaultSettings = {
         'modules': True
     },
     'threads': 'all',
+    'concurrency': {
+        'per_network': 50,
+        'per_rpc': 10
+    },
     'tx_attempts': 3,
     'delay': {
         'before_tx_receipt': (10, 20),